@@ -1,6 +1,5 @@
 """Command-line interface for gensi using click."""
 
-import asyncio
 import sys
 from pathlib import Path
 import click
@@ -8,6 +7,7 @@ from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 
 from .core.processor import process_gensi_file, ProcessingProgress
+from .utils.event_loop import run
 
 
 console = Console()
@@ -96,7 +96,7 @@ def process(files, output_dir, parallel, verbose, no_cache):
 
             try:
                 # Run async processing
-                output_path = asyncio.run(process_gensi_file(
+                output_path = run(process_gensi_file(
                     gensi_path,
                     output_dir,
                     progress_callback,
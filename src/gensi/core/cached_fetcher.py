@@ -4,7 +4,9 @@ Cached HTTP fetcher wrapper for Gensi.
 Wraps the standard Fetcher with intelligent caching that excludes index pages.
 """
 
-from typing import Optional, Literal
+import asyncio
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Optional, Literal
 
 from .fetcher import Fetcher
 from .cache import HttpCache, ContentType
@@ -19,6 +21,12 @@ class CachedFetcher:
 
     Caches all requests except those with context="index".
     Provides the same interface as Fetcher for drop-in replacement.
+
+    Independently of the persistent cache, text responses are also memoized for
+    the lifetime of the context manager, so a page requested several times in one
+    run (e.g. an index page shared by two sections) is only downloaded once, even
+    when the requests are concurrent. Binary responses are not kept: images are
+    deduplicated after processing by download_images' processed_cache instead.
     """
 
     def __init__(
@@ -38,6 +46,8 @@ class CachedFetcher:
         self.cache_enabled = cache_enabled
         self.impersonate = impersonate
         self._fetcher: Optional[Fetcher] = None
+        self._run_cache: dict[tuple[str, str], Any] = {}
+        self._run_locks: defaultdict[tuple[str, str], asyncio.Lock] = defaultdict(asyncio.Lock)
 
         # Initialize cache if enabled
         if cache_enabled:
@@ -47,6 +57,10 @@ class CachedFetcher:
 
     async def __aenter__(self):
         """Async context manager entry."""
+        # Responses are only shared within a single run
+        self._run_cache.clear()
+        self._run_locks.clear()
+
         # Create and enter the underlying Fetcher
         self._fetcher = Fetcher(impersonate=self.impersonate)
         await self._fetcher.__aenter__()
@@ -79,6 +93,28 @@ class CachedFetcher:
         # Cache everything else (cover, article, image)
         return True
 
+    async def _fetch_once(self, key: tuple[str, str], fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run a fetch at most once per key for the lifetime of this context.
+
+        Concurrent callers for the same key wait for the first one to finish and
+        then share its result. Failures are not memoized.
+
+        Args:
+            key: Tuple of ("text", url) identifying the request
+            fetch: Coroutine function performing the actual fetch
+
+        Returns:
+            The result of fetch()
+        """
+        if key in self._run_cache:
+            return self._run_cache[key]
+
+        async with self._run_locks[key]:
+            if key not in self._run_cache:
+                self._run_cache[key] = await fetch()
+            return self._run_cache[key]
+
     async def fetch(
         self, url: str, timeout: int = 30, context: FetchContext = "article"
     ) -> tuple[str, str]:
@@ -99,6 +135,12 @@ class CachedFetcher:
         if not self._fetcher:
             raise RuntimeError("CachedFetcher must be used as async context manager")
 
+        return await self._fetch_once(
+            ("text", url), lambda: self._fetch_text(url, timeout, context)
+        )
+
+    async def _fetch_text(self, url: str, timeout: int, context: FetchContext) -> tuple[str, str]:
+        """Fetch text content through the persistent cache."""
         # Check cache if caching is enabled for this context
         if self._should_cache(context):
             cached = self.cache.get(url, "text")
@@ -145,6 +187,10 @@ class CachedFetcher:
         if not self._fetcher:
             raise RuntimeError("CachedFetcher must be used as async context manager")
 
+        return await self._fetch_binary(url, timeout, context)
+
+    async def _fetch_binary(self, url: str, timeout: int, context: FetchContext) -> tuple[bytes, str]:
+        """Fetch binary content through the persistent cache."""
         # Check cache if caching is enabled for this context
         if self._should_cache(context):
             cached = self.cache.get(url, "binary")
@@ -1,13 +1,47 @@
 """EPUB 2.0.1 builder using ebooklib and jinja2 templates."""
 
+import io
 from pathlib import Path
 from typing import Optional
+import zipfile
 from ebooklib import epub
 from jinja2 import Environment, FileSystemLoader
 import uuid
 
 from gensi.utils.date_formatter import format_date
 
+# Media types whose payload is already compressed; deflating them again costs
+# CPU for next to no size gain, so they are stored as-is
+STORED_MEDIA_PREFIXES = ('image/jpeg', 'image/png', 'image/gif', 'image/webp', 'audio/', 'video/')
+
+TEMPLATE_DIR = Path(__file__).parent.parent / 'templates'
+
+# Shared across builders so each template is compiled once per process; the
+# templates ship with the package, so there is no need to stat them on every use
+_JINJA_ENV = Environment(loader=FileSystemLoader(str(TEMPLATE_DIR)), auto_reload=False)
+
+
+class _EpubWriter(epub.EpubWriter):
+    """EpubWriter that stores already-compressed media instead of deflating it."""
+
+    def _write_items(self):
+        for item in self.book.get_items():
+            if isinstance(item, epub.EpubNcx):
+                name, content = item.file_name, self._get_ncx()
+            elif isinstance(item, epub.EpubNav):
+                name, content = item.file_name, self._get_nav(item)
+            else:
+                name, content = item.file_name, item.get_content()
+
+            if item.manifest or isinstance(item, (epub.EpubNcx, epub.EpubNav)):
+                name = f'{self.book.FOLDER_NAME}/{name}'
+
+            media_type = getattr(item, 'media_type', None) or ''
+            if media_type.startswith(STORED_MEDIA_PREFIXES):
+                self.out.writestr(name, content, compress_type=zipfile.ZIP_STORED)
+            else:
+                self.out.writestr(name, content)
+
 
 class EPUBBuilder:
     """Builds EPUB files from processed articles."""
@@ -33,14 +67,16 @@ class EPUBBuilder:
         self.book.add_author(self.author)
 
         # Initialize jinja2
-        template_dir = Path(__file__).parent.parent / 'templates'
-        self.jinja_env = Environment(loader=FileSystemLoader(str(template_dir)))
+        self.jinja_env = _JINJA_ENV
 
         # Storage for chapters and sections
         self.sections = []
         self.chapters = []
         self.cover_image = None
 
+        # Image manifest items by filename; IDs are short counters ("im1", "im2", ...)
+        self._image_items = {}
+
     def add_cover(self, image_data: bytes, image_name: str = 'cover.jpg'):
         """
         Add a cover image to the EPUB.
@@ -126,6 +162,10 @@ class EPUBBuilder:
         # Add images if present
         if images:
             for img_url, (img_filename, img_data) in images.items():
+                # The same image may be embedded by several articles
+                if img_filename in self._image_items:
+                    continue
+
                 # Determine media type from filename
                 ext = img_filename.split('.')[-1].lower()
                 media_type_map = {
@@ -141,12 +181,13 @@ class EPUBBuilder:
 
                 # Create image item
                 img_item = epub.EpubItem(
-                    uid=f"img_{img_filename}",
+                    uid=f"im{len(self._image_items) + 1}",
                     file_name=f"images/{img_filename}",
                     media_type=media_type,
                     content=img_data
                 )
                 self.book.add_item(img_item)
+                self._image_items[img_filename] = img_item
 
         # Add to current section
         self.sections[-1]['articles'].append({
@@ -167,8 +208,7 @@ class EPUBBuilder:
         output_path = Path(output_path)
 
         # Add CSS
-        template_dir = Path(__file__).parent.parent / 'templates'
-        css_path = template_dir / 'styles.css'
+        css_path = TEMPLATE_DIR / 'styles.css'
         with open(css_path, 'r', encoding='utf-8') as f:
             css_content = f.read()
 
@@ -232,8 +272,14 @@ class EPUBBuilder:
 
         # Write EPUB file
         # Use options to avoid issues with nav generation
+        # Assemble the archive in memory and write it out in one go, so a failure
+        # part-way through never leaves a truncated EPUB behind
         options = {'epub3_pages': False}
-        epub.write_epub(str(output_path), self.book, options)
+        buffer = io.BytesIO()
+        writer = _EpubWriter(buffer, self.book, options)
+        writer.process()
+        writer.write()
+        output_path.write_bytes(buffer.getbuffer())
 
 
 def create_epub(
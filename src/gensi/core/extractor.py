@@ -1,18 +1,134 @@
 """Content extraction from HTML using lxml and CSS selectors."""
 
-from typing import Any, Optional
+import io
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
 from lxml import html, etree
-import feedparser
+from lxml.cssselect import CSSSelector
 import re
-from ..utils.url_utils import resolve_url, resolve_urls_in_html
+from ..utils.url_utils import make_url_resolver, resolve_url, resolve_urls_in_html
 from ..utils.metadata_fallback import extract_metadata_fallback
-from .json_utils import extract_json_path, extract_json_paths, extract_json_paths_as_list, JSONExtractionError
+from ..utils.html_parser import get_html_parser
+from .json_utils import (
+    extract_json_path,
+    extract_json_paths,
+    extract_json_paths_as_list,
+    loads_json,
+    JSONExtractionError,
+)
+
+# Bluesky embed type for external link cards
+BLUESKY_EXTERNAL_EMBED_TYPE = 'app.bsky.embed.external#view'
+
+# Feed element names for the lxml fast path in parse_rss_feed
+ATOM_NS = '{http://www.w3.org/2005/Atom}'
+CONTENT_ENCODED_TAG = '{http://purl.org/rss/1.0/modules/content/}encoded'
+_ATOM_HTML_LINK_TYPES = ('text/html', 'application/xhtml+xml')
+
+# {1}, {2}, ... placeholders in url_transform templates
+_TEMPLATE_PLACEHOLDER_RE = re.compile(r'\{(\d+)\}')
+
+
+@lru_cache(maxsize=1024)
+def compile_css(selector: str) -> CSSSelector:
+    """
+    Compile a CSS selector, caching the result.
+
+    Recipes apply the same selectors to every article, so translating each
+    selector to XPath once avoids re-tokenizing it per document.
+
+    Args:
+        selector: CSS selector
+
+    Returns:
+        Compiled selector, callable on an element to get the matching elements
+    """
+    return CSSSelector(selector, translator='html')
+
+
+@lru_cache(maxsize=256)
+def compile_remove_selectors(selectors: tuple[str, ...]) -> etree.XPath:
+    """
+    Compile a list of CSS selectors into a single XPath union.
+
+    Args:
+        selectors: Tuple of CSS selectors
+
+    Returns:
+        Compiled XPath matching any of the selectors
+    """
+    # Reuse the per-selector translations from the CSS selector cache
+    return etree.XPath(' | '.join(compile_css(sel).path for sel in selectors))
+
+
+def _remove_elements(root: html.HtmlElement, selectors: list[str]) -> None:
+    """
+    Remove all elements matching any of the CSS selectors in a single tree walk.
+
+    Args:
+        root: The element to search (the element itself is included)
+        selectors: List of CSS selectors to remove
+    """
+    if not selectors:
+        return
+    for elem in compile_remove_selectors(tuple(selectors))(root):
+        # drop_tree() keeps the element's tail text (the text following it)
+        if elem.getparent() is not None:
+            elem.drop_tree()
+
+
+@lru_cache(maxsize=256)
+def compile_url_transform(pattern: str, template: str) -> Callable[[str], str]:
+    """
+    Build a URL transformer for a pattern/template pair.
+
+    The regex is compiled and the template's 1-indexed {1}, {2}, ... placeholders
+    are rewritten into a 0-indexed format string once, so each URL only costs a
+    regex search and a single str.format call.
+
+    Args:
+        pattern: Regex pattern with capture groups
+        template: Template using {1}, {2}, etc. for captured groups
+
+    Returns:
+        Function mapping a URL to its transformed URL (or the URL itself if
+        the pattern doesn't match)
+    """
+    regex = re.compile(pattern)
+
+    # Placeholders without a matching group are kept literally; all other
+    # braces are escaped so they survive str.format
+    parts = _TEMPLATE_PLACEHOLDER_RE.split(template)
+    fmt = []
+    for i, part in enumerate(parts):
+        if i % 2 and 1 <= int(part) <= regex.groups:
+            fmt.append(f'{{{int(part) - 1}}}')
+        else:
+            literal = f'{{{part}}}' if i % 2 else part
+            fmt.append(literal.replace('{', '{{').replace('}', '}}'))
+    fmt = ''.join(fmt)
+
+    def transform(url: str) -> str:
+        match = regex.search(url)
+        if not match:
+            return url
+        return fmt.format(*match.groups(default=''))
+
+    return transform
 
 
 class Extractor:
     """Extracts content from HTML and JSON using CSS selectors and Python scripts."""
 
-    def __init__(self, base_url: str, content: str, content_type: str = 'html', config: dict[str, Any] = None):
+    def __init__(
+        self,
+        base_url: str,
+        content: str,
+        content_type: str = 'html',
+        config: dict[str, Any] = None,
+        document: html.HtmlElement | None = None
+    ):
         """
         Initialize the extractor.
 
@@ -21,42 +137,93 @@ class Extractor:
             content: The content to parse (HTML string or JSON string)
             content_type: Type of content ('html' or 'json')
             config: Optional configuration with json_path for JSON extraction
+            document: Optional already-parsed HTML document for `content` (HTML mode
+                only); extraction may modify it
         """
         self.base_url = base_url
         self.content = content
         self.content_type = content_type
         self.config = config or {}
 
+        # Split the base URL once; links are joined against it many times
+        self._resolver = make_url_resolver(base_url)
+
+        # JSON path to the embedded HTML, parsed lazily on first document access
+        self._pending_json_path = None
+
         if content_type == 'json':
             # For JSON, extract HTML using json_path if available
             if 'json_path' in self.config:
                 json_path = self.config['json_path']
                 # Check if json_path is a string (extract HTML only) or dict (multiple fields)
                 if isinstance(json_path, str):
-                    html_content = extract_json_path(content, json_path)
-                    self.html_content = html_content
-                    self.document = html.fromstring(html_content)
+                    # Defer extraction: direct-links indices never need the HTML document
+                    self._pending_json_path = json_path
+                    self._html_content = None
+                    self._document = None
                     self.json_data = None
                 else:
                     # Dict mode - will be handled in extract_article_content
                     # For now, just store the JSON data
-                    self.html_content = None
-                    self.document = None
-                    import json
-                    self.json_data = json.loads(content)
+                    self._html_content = None
+                    self._document = None
+                    self.json_data = loads_json(content)
             else:
                 # JSON mode without json_path - will be handled by Python override
-                self.html_content = None
-                self.document = None
-                import json
-                self.json_data = json.loads(content)
+                self._html_content = None
+                self._document = None
+                self.json_data = loads_json(content)
         else:
             # HTML mode
-            self.html_content = content
-            self.document = html.fromstring(content)
+            self._html_content = content
+            if document is None:
+                document = html.fromstring(content, parser=get_html_parser())
+            self._document = document
             self.json_data = None
 
-    def extract_cover_url(self, config: dict[str, Any], python_executor=None) -> Optional[str]:
+    def _load_pending_json_html(self) -> None:
+        """Extract and parse the HTML embedded in JSON content, if still pending."""
+        if self._pending_json_path is not None:
+            json_path = self._pending_json_path
+            self._pending_json_path = None
+            self._html_content = extract_json_path(self.content, json_path)
+            self._document = html.fromstring(self._html_content, parser=get_html_parser())
+
+    @property
+    def html_content(self) -> str | None:
+        """The HTML being extracted from (None for JSON without an HTML json_path)."""
+        self._load_pending_json_html()
+        return self._html_content
+
+    @html_content.setter
+    def html_content(self, value: str | None) -> None:
+        self._pending_json_path = None
+        self._html_content = value
+
+    @property
+    def document(self) -> html.HtmlElement | None:
+        """The parsed HTML document (None for JSON without an HTML json_path)."""
+        self._load_pending_json_html()
+        return self._document
+
+    @document.setter
+    def document(self, value: html.HtmlElement | None) -> None:
+        self._pending_json_path = None
+        self._document = value
+
+    def _resolve(self, url: str) -> str:
+        """
+        Resolve a URL against the extractor's base URL.
+
+        Args:
+            url: The URL to resolve (can be relative or absolute)
+
+        Returns:
+            The absolute URL
+        """
+        return self._resolver(url)
+
+    def extract_cover_url(self, config: dict[str, Any], python_executor=None) -> str | None:
         """
         Extract the cover image URL.
 
@@ -71,7 +238,7 @@ class Extractor:
         if 'python' in config and python_executor:
             result = python_executor.execute(config['python']['script'], {'document': self.document})
             if isinstance(result, str):
-                return resolve_url(self.base_url, result)
+                return self._resolve(result)
             else:
                 raise TypeError(f"Cover Python script must return string, got {type(result)}")
 
@@ -81,7 +248,7 @@ class Extractor:
 
         # If URL points directly to an image, return it
         if is_image_url(url):
-            return resolve_url(self.base_url, url)
+            return self._resolve(url)
 
         # Otherwise, use selector
         selector = config.get('selector')
@@ -89,11 +256,11 @@ class Extractor:
             raise ValueError("Cover: 'selector' is required when URL doesn't point to an image")
 
         try:
-            img_elem = self.document.cssselect(selector)
+            img_elem = compile_css(selector)(self.document)
             if img_elem and len(img_elem) > 0:
                 src = img_elem[0].get('src', '')
                 if src:
-                    return resolve_url(self.base_url, src)
+                    return self._resolve(src)
         except Exception as e:
             raise Exception(f"Failed to extract cover image: {str(e)}") from e
 
@@ -124,7 +291,7 @@ class Extractor:
             for item in result:
                 if not isinstance(item, dict) or 'url' not in item:
                     raise ValueError("Index Python script must return list of dicts with 'url' key")
-                article = {'url': resolve_url(self.base_url, item['url'])}
+                article = {'url': self._resolve(item['url'])}
                 if 'content' in item:
                     article['content'] = item['content']
                 articles.append(article)
@@ -139,7 +306,7 @@ class Extractor:
                 for url in urls:
                     # Filter: only strings, skip empty/None
                     if isinstance(url, str) and url.strip():
-                        articles.append({'url': resolve_url(self.base_url, url)})
+                        articles.append({'url': self._resolve(url)})
                 return articles
             except JSONExtractionError as e:
                 raise Exception(f"Failed to extract index articles: {str(e)}") from e
@@ -153,11 +320,11 @@ class Extractor:
         articles = []
         try:
             # Select all <a> elements matching the selector
-            link_elems = self.document.cssselect(links_selector)
+            link_elems = compile_css(links_selector)(self.document)
             for link_elem in link_elems:
                 href = link_elem.get('href', '')
                 if href:
-                    articles.append({'url': resolve_url(self.base_url, href)})
+                    articles.append({'url': self._resolve(href)})
         except Exception as e:
             raise Exception(f"Failed to extract index articles: {str(e)}") from e
 
@@ -194,23 +361,12 @@ class Extractor:
         if not pattern or not template:
             raise ValueError("URL transform requires 'pattern' and 'template' in simple mode")
 
-        # Apply regex pattern
-        match = re.search(pattern, url)
-        if not match:
-            # If pattern doesn't match, return original URL
-            return url
-
-        # Replace placeholders in template with captured groups
-        # {1}, {2}, etc. are replaced with match groups
-        transformed = template
-        for i, group in enumerate(match.groups(), start=1):
-            transformed = transformed.replace(f'{{{i}}}', group)
-
-        return transformed
+        # If pattern doesn't match, the transformer returns the original URL
+        return compile_url_transform(pattern, template)(url)
 
     def extract_article_content(
         self, config: dict[str, Any], python_executor=None
-    ) -> dict[str, Optional[str]]:
+    ) -> dict[str, str | None]:
         """
         Extract article content and metadata.
 
@@ -241,10 +397,12 @@ class Extractor:
                     html_content = resolve_urls_in_html(html_content, self.base_url)
                     # Update document for further processing
                     self.html_content = html_content
-                    self.document = html.fromstring(html_content)
+                    self.document = html.fromstring(html_content, parser=get_html_parser())
                 elif isinstance(json_path, dict):
-                    # Dict path - extract multiple fields
-                    extracted = extract_json_paths(self.content, json_path)
+                    # Dict path - extract multiple fields, reusing the JSON
+                    # already decoded in __init__ when there is one
+                    json_source = self.json_data if self.json_data is not None else self.content
+                    extracted = extract_json_paths(json_source, json_path)
 
                     # Extract and parse HTML content
                     html_content = extracted['content']
@@ -253,7 +411,7 @@ class Extractor:
                     html_content = resolve_urls_in_html(html_content, self.base_url)
 
                     self.html_content = html_content
-                    self.document = html.fromstring(html_content)
+                    self.document = html.fromstring(html_content, parser=get_html_parser())
 
                     # Store content directly (no need for CSS selectors)
                     result['content'] = html_content
@@ -274,17 +432,17 @@ class Extractor:
 
                     # Apply CSS selectors for metadata not extracted from JSON
                     if not result['title'] and title_selector:
-                        title_elems = self.document.cssselect(title_selector)
+                        title_elems = compile_css(title_selector)(self.document)
                         if title_elems:
                             result['title'] = title_elems[0].text_content().strip()
 
                     if not result['author'] and author_selector:
-                        author_elems = self.document.cssselect(author_selector)
+                        author_elems = compile_css(author_selector)(self.document)
                         if author_elems:
                             result['author'] = author_elems[0].text_content().strip()
 
                     if not result['date'] and date_selector:
-                        date_elems = self.document.cssselect(date_selector)
+                        date_elems = compile_css(date_selector)(self.document)
                         if date_elems:
                             date_text = date_elems[0].text_content().strip()
                             if not date_text and date_elems[0].get('datetime'):
@@ -294,10 +452,7 @@ class Extractor:
                     # NOW apply remove selectors to clean up the HTML
                     # This happens AFTER metadata extraction so we can extract from elements we'll remove
                     if result['content'] and config.get('remove'):
-                        remove_selectors = config.get('remove', [])
-                        for remove_sel in remove_selectors:
-                            for elem in self.document.cssselect(remove_sel):
-                                elem.getparent().remove(elem)
+                        _remove_elements(self.document, config.get('remove', []))
                         # Update content after removal
                         result['content'] = etree.tostring(self.document, encoding='unicode', method='html')
 
@@ -354,7 +509,7 @@ class Extractor:
 
         try:
             # Extract content
-            content_elem = self.document.cssselect(content_selector)
+            content_elem = compile_css(content_selector)(self.document)
             if not content_elem or len(content_elem) == 0:
                 raise ValueError(f"Content selector '{content_selector}' didn't match any elements in '{self.base_url}'")
 
@@ -367,27 +522,24 @@ class Extractor:
             date_selector = config.get('date')
 
             if title_selector:
-                title_elem = self.document.cssselect(title_selector)
+                title_elem = compile_css(title_selector)(self.document)
                 if title_elem and len(title_elem) > 0:
                     result['title'] = title_elem[0].text_content().strip()
 
             if author_selector:
-                author_elem = self.document.cssselect(author_selector)
+                author_elem = compile_css(author_selector)(self.document)
                 if author_elem and len(author_elem) > 0:
                     result['author'] = author_elem[0].text_content().strip()
 
             if date_selector:
-                date_elem = self.document.cssselect(date_selector)
+                date_elem = compile_css(date_selector)(self.document)
                 if date_elem and len(date_elem) > 0:
                     # Prefer text content (human-readable) over datetime attribute
                     text = date_elem[0].text_content().strip()
                     result['date'] = text if text else date_elem[0].get('datetime')
 
             # NOW remove unwanted elements (after metadata extraction)
-            remove_selectors = config.get('remove', [])
-            for remove_sel in remove_selectors:
-                for elem in content_elem.cssselect(remove_sel):
-                    elem.getparent().remove(elem)
+            _remove_elements(content_elem, config.get('remove', []))
 
             # Extract HTML content
             html_content = etree.tostring(content_elem, encoding='unicode', method='html')
@@ -413,6 +565,108 @@ class Extractor:
         return result
 
 
+def _rss_item_entry(item, use_content_encoded: bool) -> tuple[str, str | None] | None:
+    """
+    Get (link, content) from an RSS 2.0 <item>, or None if it needs feedparser.
+
+    Unlike feedparser, content:encoded is returned unsanitized; the processor
+    sanitizes article content before it goes into the EPUB.
+    """
+    links = item.findall('link')
+    if len(links) != 1 or item.find(f'{ATOM_NS}link') is not None:
+        return None
+    link = (links[0].text or '').strip()
+    if not link:
+        return None
+
+    content = None
+    if use_content_encoded:
+        encoded = item.find(CONTENT_ENCODED_TAG)
+        if encoded is not None:
+            content = (encoded.text or '').strip()
+    return link, content
+
+
+def _atom_entry(entry) -> tuple[str, str | None] | None:
+    """Get (link, None) from an Atom <entry>, or None if it needs feedparser."""
+    # Like feedparser, the last alternate HTML link wins
+    link = None
+    for elem in entry.iterfind(f'{ATOM_NS}link'):
+        if (
+            elem.get('rel', 'alternate') == 'alternate'
+            and elem.get('type', 'text/html') in _ATOM_HTML_LINK_TYPES
+            and elem.get('href')
+        ):
+            link = elem.get('href').strip()
+    return (link, None) if link else None
+
+
+def _parse_feed_entries_fast(
+    feed_content: str | bytes, limit: int | None, use_content_encoded: bool
+) -> list[tuple[str, str | None]] | None:
+    """
+    Extract (link, content) pairs from a plain RSS 2.0 or Atom feed using lxml.
+
+    Entries are streamed with iterparse and parsing stops as soon as `limit`
+    entries have been collected. Only the common, well-formed case is handled:
+    whenever feedparser might read the feed differently (malformed XML, other
+    feed formats, xml:base, unusual links, Atom content), None is returned so
+    the caller can fall back to feedparser.
+
+    Args:
+        feed_content: The feed XML content
+        limit: Maximum number of entries to return (None or 0 for all)
+        use_content_encoded: Whether to extract content:encoded for RSS items
+
+    Returns:
+        List of (link, content) tuples, or None to fall back to feedparser
+    """
+    if isinstance(feed_content, str):
+        # Already decoded, so the declared encoding no longer applies
+        data = feed_content.encode('utf-8')
+        encoding = 'utf-8'
+    else:
+        data = feed_content
+        encoding = None
+
+    if b'xml:base' in data:
+        return None
+
+    entries = []
+    root_tag = None
+    try:
+        for _, elem in etree.iterparse(
+            io.BytesIO(data),
+            tag=('item', f'{ATOM_NS}entry'),
+            encoding=encoding,
+            resolve_entities=False,
+            no_network=True,
+        ):
+            parent = elem.getparent()
+            if root_tag is None:
+                root_tag = elem.getroottree().getroot().tag
+
+            if root_tag == 'rss' and elem.tag == 'item' and parent is not None and parent.tag == 'channel':
+                entry = _rss_item_entry(elem, use_content_encoded)
+            elif root_tag == f'{ATOM_NS}feed' and elem.tag == f'{ATOM_NS}entry' and not use_content_encoded:
+                entry = _atom_entry(elem)
+            else:
+                return None
+
+            if entry is None:
+                return None
+            entries.append(entry)
+
+            elem.clear(keep_tail=True)
+            if limit and len(entries) >= limit:
+                break
+    except etree.XMLSyntaxError:
+        return None
+
+    # No entries: let feedparser decide what kind of document this is
+    return entries or None
+
+
 def parse_rss_feed(
     feed_url: str, feed_content: str, config: dict[str, Any], python_executor=None
 ) -> list[dict[str, Any]]:
@@ -428,6 +682,24 @@ def parse_rss_feed(
     Returns:
         List of dictionaries with 'url' and optional 'content' keys
     """
+    # Simple mode on a plain RSS 2.0/Atom feed: stream it with lxml
+    if not ('python' in config and python_executor):
+        limit = config.get('limit')
+        use_content_encoded = config.get('use_content_encoded', False)
+        entries = _parse_feed_entries_fast(feed_content, limit, use_content_encoded)
+        if entries is not None:
+            resolve = make_url_resolver(feed_url)
+            articles = []
+            for link, content in entries:
+                article = {'url': resolve(link)}
+                if content is not None:
+                    article['content'] = content
+                articles.append(article)
+            return articles
+
+    # Imported lazily so runs without RSS indices don't pay feedparser's import cost
+    import feedparser
+
     feed = feedparser.parse(feed_content)
 
     # Check if using Python override
@@ -451,11 +723,12 @@ def parse_rss_feed(
     limit = config.get('limit')
     use_content_encoded = config.get('use_content_encoded', False)
 
+    resolve = make_url_resolver(feed_url)
     articles = []
     entries = feed.entries[:limit] if limit else feed.entries
 
     for entry in entries:
-        article = {'url': resolve_url(feed_url, entry.link)}
+        article = {'url': resolve(entry.link)}
 
         if use_content_encoded and hasattr(entry, 'content'):
             # Extract content from feed
@@ -487,7 +760,7 @@ def parse_bluesky_feed(
 
     # Parse JSON response
     try:
-        data = json.loads(feed_content)
+        data = loads_json(feed_content)
     except json.JSONDecodeError as e:
         raise Exception(f"Failed to parse Bluesky API response: {str(e)}") from e
 
@@ -533,21 +806,23 @@ def parse_bluesky_feed(
     domain_filter = config.get('domain')
 
     for entry in feed_entries:
-        post = entry.get('post', {})
-        embed = post.get('embed', {})
-
-        # Only extract external embeds (card/link attachments)
-        if embed.get('$type') == 'app.bsky.embed.external#view':
-            external = embed.get('external', {})
-            uri = external.get('uri')
-
-            if uri and uri not in seen_urls:
-                # Apply domain filter if specified
-                if domain_filter and not matches_domain(uri, domain_filter):
-                    continue
-
-                seen_urls.add(uri)
-                articles.append({'url': uri})
+        # Only extract external embeds (card/link attachments); entries missing
+        # any part of the post -> embed -> external chain are skipped
+        try:
+            embed = entry['post']['embed']
+            if embed.get('$type') != BLUESKY_EXTERNAL_EMBED_TYPE:
+                continue
+            uri = embed['external']['uri']
+        except (KeyError, TypeError, AttributeError):
+            continue
+
+        if uri and uri not in seen_urls:
+            # Apply domain filter if specified
+            if domain_filter and not matches_domain(uri, domain_filter):
+                continue
+
+            seen_urls.add(uri)
+            articles.append({'url': uri})
 
     # Apply limit
     limit = config.get('limit')
@@ -9,7 +9,7 @@ Handles format conversion, resizing, and compression to ensure images are:
 
 import io
 import logging
-from typing import Optional, Tuple
+from functools import lru_cache
 from PIL import Image
 
 logger = logging.getLogger(__name__)
@@ -22,17 +22,45 @@ COVER_MAX_HEIGHT = 1680
 ARTICLE_MAX_WIDTH = int(COVER_MAX_WIDTH * 0.85)  # 1074
 ARTICLE_MAX_HEIGHT = int(COVER_MAX_HEIGHT * 0.85)  # 1428
 
+# Downscales larger than this factor are pre-reduced before the Lanczos pass
+# (the same default Image.thumbnail uses)
+RESIZE_REDUCING_GAP = 2.0
+
 # Compression settings
 JPG_QUALITY = 80
+# Progressive JPEGs (as produced by mozjpeg) are a few percent smaller, but a
+# number of e-readers fail to render them, so output stays baseline
+JPG_PROGRESSIVE = False
 PNG_OPTIMIZE = True
+# oxipng preset used when it is installed (2 is its default speed/size tradeoff)
+OXIPNG_LEVEL = 2
+
+
+# Magic-byte prefixes of the common web formats, keyed by prefix length.
+# Anything not listed here falls back to letting Pillow identify the data.
+_MAGIC_PREFIXES = {
+    3: {b'\xff\xd8\xff': 'JPEG'},
+    6: {b'GIF87a': 'GIF', b'GIF89a': 'GIF'},
+    8: {b'\x89PNG\r\n\x1a\n': 'PNG'},
+}
 
 
-def detect_image_format(image_data: bytes) -> Optional[str]:
+def detect_image_format(image_data: bytes) -> str | None:
     """
     Detect the actual image format from the binary data.
 
+    Common formats are recognized from their magic bytes without opening
+    the image; everything else is identified by Pillow.
+
     Returns the format string (e.g., 'JPEG', 'PNG', 'WEBP') or None if detection fails.
     """
+    for length, prefixes in _MAGIC_PREFIXES.items():
+        image_format = prefixes.get(image_data[:length])
+        if image_format:
+            return image_format
+    if image_data[:4] == b'RIFF' and image_data[8:12] == b'WEBP':
+        return 'WEBP'
+
     try:
         with Image.open(io.BytesIO(image_data)) as img:
             return img.format
@@ -45,11 +73,14 @@ def has_transparency(img: Image.Image) -> bool:
     """
     Check if an image has transparency/alpha channel.
 
-    Returns True if the image has an alpha channel or transparent pixels.
+    Returns True if the image has an alpha channel with at least one
+    non-opaque pixel, or a palette with a transparent entry.
     """
-    # Check if image has an alpha channel
+    # Check if the alpha channel is actually used; fully opaque RGBA/LA images
+    # (common for exported screenshots) compress far better as JPEG
     if img.mode in ('RGBA', 'LA', 'PA'):
-        return True
+        min_alpha, _ = img.getchannel('A').getextrema()
+        return min_alpha < 255
 
     # Check for transparency in palette mode
     if img.mode == 'P':
@@ -65,7 +96,10 @@ def resize_image(img: Image.Image, max_width: int, max_height: int) -> Image.Ima
     Resize image to fit within max dimensions while maintaining aspect ratio.
 
     If the image is smaller than the max dimensions, it is not resized.
-    Uses high-quality Lanczos resampling.
+    Uses high-quality Lanczos resampling. Large downscales first reduce the
+    image by an integer factor (JPEG DCT scaling while decoding, otherwise a
+    box filter via Pillow's reducing_gap), so the Lanczos pass only runs over
+    roughly 2x the target size.
     """
     width, height = img.size
 
@@ -83,10 +117,17 @@ def resize_image(img: Image.Image, max_width: int, max_height: int) -> Image.Ima
 
     logger.debug(f"Resizing image from {width}x{height} to {new_width}x{new_height}")
 
-    return img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+    # For JPEGs that haven't been decoded yet, let libjpeg decode at a reduced
+    # scale (1/2, 1/4 or 1/8) that still leaves the reducing gap for Lanczos.
+    # This is a no-op for other formats and already-loaded images.
+    img.draft(None, (int(new_width * RESIZE_REDUCING_GAP), int(new_height * RESIZE_REDUCING_GAP)))
+
+    return img.resize(
+        (new_width, new_height), Image.Resampling.LANCZOS, reducing_gap=RESIZE_REDUCING_GAP
+    )
 
 
-def convert_svg_to_png(svg_data: bytes, max_width: int, max_height: int) -> Tuple[bytes, str]:
+def convert_svg_to_png(svg_data: bytes, max_width: int, max_height: int) -> tuple[bytes, str]:
     """
     Convert SVG to PNG format.
 
@@ -111,7 +152,7 @@ def convert_svg_to_png(svg_data: bytes, max_width: int, max_height: int) -> Tupl
     return png_data, 'png'
 
 
-def normalize_image_format(img: Image.Image, original_format: str) -> Tuple[str, str]:
+def normalize_image_format(img: Image.Image, original_format: str) -> tuple[str, str]:
     """
     Determine the appropriate output format (jpg or png) based on image characteristics.
 
@@ -138,17 +179,25 @@ def optimize_image(img: Image.Image, target_format: str) -> bytes:
 
     if target_format == 'JPEG':
         # Convert to RGB if needed (JPEG doesn't support transparency)
-        if img.mode in ('RGBA', 'LA', 'P', 'PA'):
-            # Create white background for conversion
-            rgb_img = Image.new('RGB', img.size, (255, 255, 255))
-            if img.mode == 'P':
-                img = img.convert('RGBA')
-            rgb_img.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA', 'PA') else None)
-            img = rgb_img
+        if img.mode == 'P':
+            img = img.convert('RGBA') if 'transparency' in img.info else img.convert('RGB')
+
+        if img.mode in ('RGBA', 'LA', 'PA'):
+            alpha = img.getchannel('A')
+            if alpha.getextrema()[0] == 255:
+                # Fully opaque: drop the alpha channel in a single conversion
+                img = img.convert('RGB')
+            else:
+                # Composite onto a white background
+                rgb_img = Image.new('RGB', img.size, (255, 255, 255))
+                rgb_img.paste(img.convert('RGB'), mask=alpha)
+                img = rgb_img
         elif img.mode != 'RGB':
             img = img.convert('RGB')
 
-        img.save(output, format='JPEG', quality=JPG_QUALITY, optimize=True)
+        img.save(
+            output, format='JPEG', quality=JPG_QUALITY, optimize=True, progressive=JPG_PROGRESSIVE
+        )
         logger.debug(f"Optimized image as JPEG with {JPG_QUALITY}% quality")
 
     elif target_format == 'PNG':
@@ -159,14 +208,84 @@ def optimize_image(img: Image.Image, target_format: str) -> bytes:
         img.save(output, format='PNG', optimize=PNG_OPTIMIZE)
         logger.debug("Optimized image as PNG with transparency preserved")
 
+        return recompress_png(output.getvalue())
+
     return output.getvalue()
 
 
+def recompress_png(png_data: bytes) -> bytes:
+    """
+    Losslessly recompress PNG data with oxipng, if it is installed.
+
+    oxipng typically shrinks Pillow's PNG output by a further 10-40%. Without
+    it (or if it fails) the data is returned unchanged.
+    """
+    try:
+        import oxipng
+    except ImportError:
+        return png_data
+
+    try:
+        # Keep the color type and bit depth, so transparent images stay RGBA
+        # and only the filtering/deflate stream is improved
+        optimized = oxipng.optimize_from_memory(
+            png_data,
+            level=OXIPNG_LEVEL,
+            color_type_reduction=False,
+            grayscale_reduction=False,
+            palette_reduction=False,
+            bit_depth_reduction=False,
+        )
+    except Exception as e:
+        logger.warning(f"oxipng recompression failed: {e}")
+        return png_data
+
+    return optimized if len(optimized) < len(png_data) else png_data
+
+
+@lru_cache(maxsize=1)
+def _reference_quantization_total() -> int:
+    """Sum of the luminance quantization table Pillow writes at JPG_QUALITY."""
+    output = io.BytesIO()
+    Image.new('L', (8, 8)).save(output, format='JPEG', quality=JPG_QUALITY)
+    with Image.open(output) as img:
+        return sum(img.quantization[0])
+
+
+def can_pass_through_jpeg(img: Image.Image, max_width: int, max_height: int) -> bool:
+    """
+    Check whether a JPEG can be embedded without decoding and re-encoding it.
+
+    Only looks at header data (size, mode, markers, quantization tables), so
+    the image is not decoded. True when the image fits the max dimensions, is
+    baseline RGB/grayscale without EXIF (orientation would otherwise be lost on
+    the normal path), and is quantized at least as coarsely as JPG_QUALITY.
+    """
+    if img.format != 'JPEG':
+        return False
+
+    width, height = img.size
+    if width > max_width or height > max_height:
+        return False
+
+    if img.mode not in ('RGB', 'L'):
+        return False
+
+    if img.info.get('progressive') or img.info.get('progression') or 'exif' in img.info:
+        return False
+
+    quantization = getattr(img, 'quantization', None)
+    if not quantization or 0 not in quantization:
+        return False
+
+    return sum(quantization[0]) >= _reference_quantization_total()
+
+
 def process_image(
     image_data: bytes,
     image_url: str,
     image_type: str = 'article'
-) -> Tuple[bytes, str]:
+) -> tuple[bytes, str]:
     """
     Process an image through the full optimization pipeline.
 
@@ -212,6 +331,12 @@ def process_image(
     except Exception as e:
         raise ValueError(f"Failed to open image {image_url}: {e}")
 
+    # Fast path: re-encoding a small JPEG that is already compressed at least
+    # as hard as we would compress it only costs time and quality
+    if original_format == 'JPEG' and can_pass_through_jpeg(img, max_width, max_height):
+        logger.debug(f"Keeping already-optimized JPEG as-is: {image_url}")
+        return image_data, 'jpg'
+
     # Resize if needed
     img = resize_image(img, max_width, max_height)
 
@@ -9,11 +9,14 @@ from typing import Optional
 from lxml import html, etree
 from urllib.parse import urlparse
 
-from ..utils.url_utils import resolve_url
+from ..utils.url_utils import make_url_resolver
+from ..utils.html_parser import get_html_parser
 from .image_optimizer import process_image
 
 logger = logging.getLogger(__name__)
 
+_IMG_XPATH = etree.XPath('//img')
+
 
 class ImageProcessor:
     """Processes images in article content."""
@@ -38,9 +41,10 @@ class ImageProcessor:
         """
         images = []
         try:
-            doc = html.fromstring(html_content)
+            doc = html.fromstring(html_content, parser=get_html_parser())
+            resolve = make_url_resolver(base_url)
 
-            for img in doc.xpath('//img'):
+            for img in _IMG_XPATH(doc):
                 img_url = None
 
                 # Try standard src first
@@ -59,7 +63,7 @@ class ImageProcessor:
                     continue
 
                 # Resolve to absolute URL
-                absolute_url = resolve_url(base_url, img_url)
+                absolute_url = resolve(img_url)
 
                 images.append({
                     'url': absolute_url,
@@ -83,9 +87,9 @@ class ImageProcessor:
             HTML content with normalized img tags
         """
         try:
-            doc = html.fromstring(html_content)
+            doc = html.fromstring(html_content, parser=get_html_parser())
 
-            for img in doc.xpath('//img'):
+            for img in _IMG_XPATH(doc):
                 # Check for lazy-loading attributes
                 for attr in self.LAZY_LOAD_ATTRS:
                     if img.get(attr):
@@ -143,10 +147,10 @@ class ImageProcessor:
             HTML content with img tags removed
         """
         try:
-            doc = html.fromstring(html_content)
+            doc = html.fromstring(html_content, parser=get_html_parser())
 
             # Find and remove all img elements
-            for img in doc.xpath('//img'):
+            for img in _IMG_XPATH(doc):
                 parent = img.getparent()
                 if parent is not None:
                     # Preserve tail text (text after the img tag)
@@ -175,13 +179,14 @@ class ImageProcessor:
             HTML content with updated img tags
         """
         try:
-            doc = html.fromstring(html_content)
+            doc = html.fromstring(html_content, parser=get_html_parser())
+            resolve = make_url_resolver(base_url)
 
-            for img in doc.xpath('//img'):
+            for img in _IMG_XPATH(doc):
                 # Get the current src
                 current_src = img.get('src', '')
                 if current_src:
-                    absolute_url = resolve_url(base_url, current_src)
+                    absolute_url = resolve(current_src)
 
                     # If we have this image in our map, update the reference
                     if absolute_url in image_map:
@@ -195,7 +200,8 @@ class ImageProcessor:
         self,
         images: list[dict],
         fetcher,
-        image_type: str = 'article'
+        image_type: str = 'article',
+        processed_cache: Optional[dict] = None
     ) -> dict[str, tuple[str, bytes]]:
         """
         Download and process images concurrently.
@@ -204,6 +210,9 @@ class ImageProcessor:
             images: List of image dicts with 'url'
             fetcher: Fetcher instance for downloading
             image_type: Either 'cover' or 'article' (affects max dimensions)
+            processed_cache: Optional dict shared between calls (e.g. across the
+                articles of one run) so an image used several times is only
+                downloaded and processed once
 
         Returns:
             Dict mapping absolute URL -> (filename, processed_image_data)
@@ -222,18 +231,30 @@ class ImageProcessor:
         sem = asyncio.Semaphore(5)
         loop = asyncio.get_running_loop()
 
+        async def _download_and_process(url: str) -> tuple[bytes, str]:
+            # 1. Download image (I/O Bound - Async)
+            image_data, _ = await fetcher.fetch_binary(url, context="image")
+
+            # 2. Process image (CPU Bound - Offload to Executor)
+            # This prevents the event loop from blocking during image resizing
+            return await loop.run_in_executor(
+                None,  # Use default ThreadPoolExecutor
+                partial(process_image, image_data, url, image_type)
+            )
+
         async def _process_single_image(url: str, idx: int):
             async with sem:
                 try:
-                    # 1. Download image (I/O Bound - Async)
-                    image_data, _ = await fetcher.fetch_binary(url, context="image")
-
-                    # 2. Process image (CPU Bound - Offload to Executor)
-                    # This prevents the event loop from blocking during image resizing
-                    processed_data, extension = await loop.run_in_executor(
-                        None,  # Use default ThreadPoolExecutor
-                        partial(process_image, image_data, url, image_type)
-                    )
+                    if processed_cache is None:
+                        processed_data, extension = await _download_and_process(url)
+                    else:
+                        # Share one in-flight task per image between callers
+                        key = (url, image_type)
+                        task = processed_cache.get(key)
+                        if task is None:
+                            task = asyncio.ensure_future(_download_and_process(url))
+                            processed_cache[key] = task
+                        processed_data, extension = await asyncio.shield(task)
 
                     # Generate filename with correct extension
                     filename = self.get_image_filename(url, idx, extension)
@@ -268,7 +289,8 @@ async def process_article_images(
     base_url: str,
     fetcher,
     enable_images: bool = True,
-    image_type: str = 'article'
+    image_type: str = 'article',
+    processed_cache: Optional[dict] = None
 ) -> tuple[str, dict[str, tuple[str, bytes]]]:
     """
     Process images in article content.
@@ -280,6 +302,8 @@ async def process_article_images(
         enable_images: Whether to download images (default: True).
                       If False, all img tags will be removed.
         image_type: Either 'cover' or 'article' (affects max dimensions, default: 'article')
+        processed_cache: Optional dict shared across calls so repeated images are
+                         only downloaded and processed once (see download_images)
 
     Returns:
         Tuple of (updated_html_content, image_map)
@@ -299,7 +323,7 @@ async def process_article_images(
     images = processor.extract_images(html_content, base_url)
 
     # Download and process images
-    image_map = await processor.download_images(images, fetcher, image_type)
+    image_map = await processor.download_images(images, fetcher, image_type, processed_cache)
 
     # Update image references in HTML
     epub_path_map = {url: f"images/{filename}" for url, (filename, _) in image_map.items()}
@@ -3,9 +3,30 @@ Utilities for JSON parsing and extraction using JSONPath expressions.
 """
 
 import json
+import re
+from functools import lru_cache
 from typing import Any, Union
 from jsonpath_ng import parse as jsonpath_parse
 
+try:
+    import orjson
+except ImportError:  # optional: faster decoding when installed
+    orjson = None
+
+
+# Simple paths built from keys, list indexes and [*] wildcards
+# ("$.data.reportage.content", "$.results[*].url", "$.items[0].name") that can
+# be resolved with direct dict/list access instead of a jsonpath_ng evaluation
+_SIMPLE_PATH_RE = re.compile(r'^\$(?:\.[A-Za-z_][A-Za-z0-9_]*|\[(?:\d+|\*)\])+$')
+_SIMPLE_STEP_RE = re.compile(r'\.([A-Za-z_][A-Za-z0-9_]*)|\[(\d+)\]|\[\*\]')
+_JSONPATH_RESERVED = frozenset({'where', 'wherenot'})
+
+_KEY, _INDEX, _WILDCARD = 'key', 'index', 'wildcard'
+
+# Outcomes of _first_in_simple_path other than a value
+_NO_MATCH = object()
+_FALLBACK = object()
+
 
 class JSONExtractionError(Exception):
     """Raised when JSON extraction fails."""
@@ -13,38 +34,270 @@ class JSONExtractionError(Exception):
     pass
 
 
-def extract_json_path(json_data: Union[str, dict], path: str) -> Any:
+def loads_json(content: Union[str, bytes]) -> Any:
     """
-    Extract a value from JSON data using a JSONPath expression.
+    Decode a JSON document, using orjson when it is installed.
+
+    orjson is stricter than the standard library (e.g. it rejects NaN and
+    integers wider than 64 bits), so anything it refuses is retried with json.
 
     Args:
-        json_data: Either a JSON string or a parsed dict/list
-        path: JSONPath expression (e.g., "data.magazin.content", "$.items[0].title")
+        content: JSON text as str or bytes
 
     Returns:
-        The extracted value. If multiple matches found, returns the first one.
+        The decoded Python object
 
     Raises:
-        JSONExtractionError: If JSON parsing fails or path doesn't match anything
+        json.JSONDecodeError: If the content is not valid JSON
     """
-    # Parse JSON string if needed
-    if isinstance(json_data, str):
+    if orjson is not None:
         try:
-            parsed_data = json.loads(json_data)
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+
+def _normalize_path(path: str) -> str:
+    """
+    Add the $ root prefix to dot-notation paths.
+
+    "data.magazin.content" and "$.data.magazin.content" normalize to the same
+    string, so they share one entry in the compiled-expression cache.
+
+    Args:
+        path: JSONPath expression, with or without $ prefix
+
+    Returns:
+        The expression with a $ prefix
+    """
+    return path if path.startswith("$") else f"$.{path}"
+
+
+@lru_cache(maxsize=512)
+def _compile_jsonpath(path: str):
+    """
+    Parse a JSONPath expression, caching the result.
+
+    Building the jsonpath_ng parser is expensive and recipes reuse the same
+    handful of paths for every article, so each expression is parsed only once.
+
+    Args:
+        path: Normalized JSONPath expression (with $ prefix)
+
+    Returns:
+        The compiled jsonpath_ng expression
+    """
+    return jsonpath_parse(path)
+
+
+def _simple_path_steps(path: str) -> tuple[tuple[str, Any], ...] | None:
+    """
+    Split a simple JSONPath into key, index and wildcard steps.
+
+    Args:
+        path: Normalized JSONPath expression (with $ prefix)
+
+    Returns:
+        Tuple of (kind, argument) steps, or None if the path uses any other
+        JSONPath syntax (filters, slices, recursive descent, ...)
+    """
+    if not path.startswith('$.') or not _SIMPLE_PATH_RE.match(path):
+        return None
+    steps = []
+    for match in _SIMPLE_STEP_RE.finditer(path, 1):
+        key, index = match.groups()
+        if key is not None:
+            if key in _JSONPATH_RESERVED:
+                return None
+            steps.append((_KEY, key))
+        elif index is not None:
+            steps.append((_INDEX, int(index)))
+        else:
+            steps.append((_WILDCARD, None))
+    return tuple(steps)
+
+
+@lru_cache(maxsize=512)
+def _prepare_path(path: str) -> tuple[str, tuple[tuple[str, Any], ...] | None]:
+    """
+    Normalize a path and split it into simple steps, once per distinct path.
+
+    Args:
+        path: JSONPath expression, with or without $ prefix
+
+    Returns:
+        (normalized path, steps from _simple_path_steps or None)
+    """
+    path = _normalize_path(path)
+    return path, _simple_path_steps(path)
+
+
+def _walk_simple_path(data: Any, steps: tuple[tuple[str, Any], ...]) -> list[Any] | None:
+    """
+    Resolve a simple path with direct dict and list access.
+
+    Missing keys and out-of-range indexes drop that branch, as in jsonpath_ng.
+    Anything else jsonpath_ng treats specially (a key step on a non-dict, an
+    index or wildcard on a non-list) abandons the walk so the caller can fall
+    back to the full evaluation.
+
+    Args:
+        data: Parsed JSON data
+        steps: Steps from _simple_path_steps
+
+    Returns:
+        List of matched values (possibly empty), or None to fall back
+    """
+    values = [data]
+    for kind, arg in steps:
+        matched = []
+        for value in values:
+            if kind is _KEY:
+                if not isinstance(value, dict):
+                    return None
+                if arg in value:
+                    matched.append(value[arg])
+            elif not isinstance(value, list):
+                return None
+            elif kind is _INDEX:
+                if arg < len(value):
+                    matched.append(value[arg])
+            else:
+                matched.extend(value)
+        values = matched
+    return values
+
+
+def _first_in_simple_path(data: Any, steps: tuple[tuple[str, Any], ...]) -> Any:
+    """
+    Resolve the first match of a simple path, depth first.
+
+    jsonpath_ng orders matches depth first, so the first leaf reached is its
+    first match; a [*] step stops at the first element that yields one instead
+    of walking the rest of the list. Fallback cases are the same as in
+    _walk_simple_path.
+
+    Args:
+        data: Parsed JSON data
+        steps: Steps from _simple_path_steps
+
+    Returns:
+        The first matched value, _NO_MATCH, or _FALLBACK
+    """
+    for position, (kind, arg) in enumerate(steps):
+        if kind is _KEY:
+            if not isinstance(data, dict):
+                return _FALLBACK
+            if arg not in data:
+                return _NO_MATCH
+            data = data[arg]
+        elif not isinstance(data, list):
+            return _FALLBACK
+        elif kind is _INDEX:
+            if arg >= len(data):
+                return _NO_MATCH
+            data = data[arg]
+        else:
+            rest = steps[position + 1:]
+            for item in data:
+                value = _first_in_simple_path(item, rest)
+                if value is not _NO_MATCH:
+                    return value
+            return _NO_MATCH
+    return data
+
+
+def _parse_json_data(json_data: Union[str, bytes, dict, list]) -> Any:
+    """
+    Decode JSON text, passing already-parsed data through unchanged.
+
+    Args:
+        json_data: A JSON string/bytes or a parsed dict/list
+
+    Returns:
+        The parsed JSON data
+
+    Raises:
+        JSONExtractionError: If the JSON text cannot be parsed
+    """
+    if isinstance(json_data, (str, bytes)):
+        try:
+            return loads_json(json_data)
         except json.JSONDecodeError as e:
             raise JSONExtractionError(f"Failed to parse JSON: {e}")
-    else:
-        parsed_data = json_data
+    return json_data
+
+
+def _find_in_parsed(parsed_data: Any, path: str) -> list[Any]:
+    """
+    Evaluate a JSONPath expression against already-parsed JSON data.
+
+    Args:
+        parsed_data: Parsed JSON data
+        path: JSONPath expression, with or without $ prefix
+
+    Returns:
+        Non-empty list of matched values
+
+    Raises:
+        JSONExtractionError: If the expression is invalid or matches nothing
+    """
+    # Normalize path (add $ prefix if not present) and split it into steps
+    path, steps = _prepare_path(path)
+
+    # Fast path: keys, indexes and wildcards are plain dict/list access.
+    # Misses fall through to jsonpath_ng so errors are reported exactly as before.
+    if steps is not None:
+        values = _walk_simple_path(parsed_data, steps)
+        if values:
+            return values
+
+    return _find_with_jsonpath(parsed_data, path)
+
+
+def _find_first_in_parsed(
+    parsed_data: Any, path: str, steps: tuple[tuple[str, Any], ...] | None
+) -> Any:
+    """
+    Evaluate a prepared JSONPath expression and return only its first match.
+
+    Args:
+        parsed_data: Parsed JSON data
+        path: Normalized JSONPath expression, from _prepare_path
+        steps: Simple steps for the path, from _prepare_path
+
+    Returns:
+        The first matched value
+
+    Raises:
+        JSONExtractionError: If the expression is invalid or matches nothing
+    """
+    if steps is not None:
+        value = _first_in_simple_path(parsed_data, steps)
+        if value is not _NO_MATCH and value is not _FALLBACK:
+            return value
 
-    # Normalize path (add $ prefix if not present)
-    if not path.startswith("$"):
-        # Convert dot notation to JSONPath notation
-        # "data.magazin.content" -> "$.data.magazin.content"
-        path = f"$.{path}"
+    return _find_with_jsonpath(parsed_data, path)[0]
 
+
+def _find_with_jsonpath(parsed_data: Any, path: str) -> list[Any]:
+    """
+    Evaluate a normalized JSONPath expression with jsonpath_ng.
+
+    Args:
+        parsed_data: Parsed JSON data
+        path: Normalized JSONPath expression (with $ prefix)
+
+    Returns:
+        Non-empty list of matched values
+
+    Raises:
+        JSONExtractionError: If the expression is invalid or matches nothing
+    """
     # Parse and execute JSONPath expression
     try:
-        jsonpath_expr = jsonpath_parse(path)
+        jsonpath_expr = _compile_jsonpath(path)
         matches = jsonpath_expr.find(parsed_data)
     except Exception as e:
         raise JSONExtractionError(f"Failed to parse JSONPath expression '{path}': {e}")
@@ -52,8 +305,49 @@ def extract_json_path(json_data: Union[str, dict], path: str) -> Any:
     if not matches:
         raise JSONExtractionError(f"JSONPath '{path}' did not match any values in the JSON data")
 
-    # Return the first match value
-    return matches[0].value
+    return [match.value for match in matches]
+
+
+def _extract_field(
+    parsed_data: Any, field_name: str, path: str, steps: tuple[tuple[str, Any], ...] | None
+) -> Any:
+    """
+    Extract one extract_json_paths field, naming it in any error.
+
+    Args:
+        parsed_data: Parsed JSON data
+        field_name: Name of the field being extracted
+        path: Normalized JSONPath expression, from _prepare_path
+        steps: Simple steps for the path, from _prepare_path
+
+    Returns:
+        The first matched value
+
+    Raises:
+        JSONExtractionError: If the path doesn't match, with the field name
+    """
+    try:
+        return _find_first_in_parsed(parsed_data, path, steps)
+    except JSONExtractionError as e:
+        # Re-raise with more context about which field failed
+        raise JSONExtractionError(f"Failed to extract '{field_name}': {e}")
+
+
+def extract_json_path(json_data: Union[str, dict], path: str) -> Any:
+    """
+    Extract a value from JSON data using a JSONPath expression.
+
+    Args:
+        json_data: Either a JSON string or a parsed dict/list
+        path: JSONPath expression (e.g., "data.magazin.content", "$.items[0].title")
+
+    Returns:
+        The extracted value. If multiple matches found, returns the first one.
+
+    Raises:
+        JSONExtractionError: If JSON parsing fails or path doesn't match anything
+    """
+    return _find_first_in_parsed(_parse_json_data(json_data), *_prepare_path(path))
 
 
 def extract_json_paths(json_data: Union[str, dict], paths: dict[str, str]) -> dict[str, Any]:
@@ -71,24 +365,15 @@ def extract_json_paths(json_data: Union[str, dict], paths: dict[str, str]) -> di
     Raises:
         JSONExtractionError: If JSON parsing fails or any required path doesn't match
     """
-    # Parse JSON string once if needed
-    if isinstance(json_data, str):
-        try:
-            parsed_data = json.loads(json_data)
-        except json.JSONDecodeError as e:
-            raise JSONExtractionError(f"Failed to parse JSON: {e}")
-    else:
-        parsed_data = json_data
+    # Parse JSON string once, then evaluate every path against the same tree
+    parsed_data = _parse_json_data(json_data)
 
-    results = {}
-    for field_name, path in paths.items():
-        try:
-            results[field_name] = extract_json_path(parsed_data, path)
-        except JSONExtractionError as e:
-            # Re-raise with more context about which field failed
-            raise JSONExtractionError(f"Failed to extract '{field_name}': {e}")
-
-    return results
+    # Normalize and tokenize all paths up front; the loop below only matches
+    prepared = [(field_name, *_prepare_path(path)) for field_name, path in paths.items()]
+    return {
+        field_name: _extract_field(parsed_data, field_name, path, steps)
+        for field_name, path, steps in prepared
+    }
 
 
 def extract_json_paths_as_list(json_data: Union[str, dict], path: str) -> list[Any]:
@@ -114,30 +399,4 @@ def extract_json_paths_as_list(json_data: Union[str, dict], path: str) -> list[A
         >>> extract_json_paths_as_list(data, "results[*].url")
         ["a", "b", "c"]
     """
-    # Parse JSON string if needed
-    if isinstance(json_data, str):
-        try:
-            parsed_data = json.loads(json_data)
-        except json.JSONDecodeError as e:
-            raise JSONExtractionError(f"Failed to parse JSON: {e}")
-    else:
-        parsed_data = json_data
-
-    # Normalize path (add $ prefix if not present)
-    if not path.startswith("$"):
-        # Convert dot notation to JSONPath notation
-        # "results[*].url" -> "$.results[*].url"
-        path = f"$.{path}"
-
-    # Parse and execute JSONPath expression
-    try:
-        jsonpath_expr = jsonpath_parse(path)
-        matches = jsonpath_expr.find(parsed_data)
-    except Exception as e:
-        raise JSONExtractionError(f"Failed to parse JSONPath expression '{path}': {e}")
-
-    if not matches:
-        raise JSONExtractionError(f"JSONPath '{path}' did not match any values in the JSON data")
-
-    # Return all match values as a list
-    return [match.value for match in matches]
+    return _find_in_parsed(_parse_json_data(json_data), path)
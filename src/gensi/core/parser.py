@@ -1,13 +1,24 @@
 """Parser for .gensi TOML recipe files."""
 
+import re
 import tomllib
 from pathlib import Path
 from typing import Any
 
+from cssselect import SelectorError
+
+from .extractor import compile_css, compile_remove_selectors, compile_url_transform
+from .replacements import compile_pattern
+
+_INDEX_TYPES = ('html', 'rss', 'json', 'bluesky')
+_RESPONSE_TYPES = ('html', 'json')
+
 
 class GensiParser:
     """Parser for .gensi TOML recipe files."""
 
+    __slots__ = ('data', 'filepath')
+
     def __init__(self, filepath: Path | str):
         """
         Initialize the parser with a .gensi file path.
@@ -15,17 +26,41 @@ class GensiParser:
         Args:
             filepath: Path to the .gensi file
         """
-        self.filepath = Path(filepath)
+        # Path(Path) builds a fresh copy; keep a Path the caller already has
+        self.filepath = filepath if isinstance(filepath, Path) else Path(filepath)
         self.data: dict[str, Any] = {}
         self._parse()
 
+    @classmethod
+    def from_string(cls, content: str, *, source_name: str = '<memory>') -> 'GensiParser':
+        """
+        Create a parser from .gensi TOML text instead of a file.
+
+        Args:
+            content: The .gensi TOML content
+            source_name: Stored as filepath, to name the recipe's origin
+
+        Returns:
+            The validated parser
+        """
+        parser = cls.__new__(cls)
+        parser.filepath = Path(source_name)
+        parser._load(tomllib.loads(content))
+        return parser
+
     def _parse(self) -> None:
         """Parse the .gensi TOML file."""
         with open(self.filepath, 'rb') as f:
-            self.data = tomllib.load(f)
+            self._load(tomllib.load(f))
+
+    def _load(self, data: dict[str, Any]) -> None:
+        """Store parsed .gensi data, then validate it."""
+        self.data = data
 
         # Validate required fields
         self._validate()
+        self._precompile_selectors()
+        self._precompile_replacements()
 
     def _validate(self) -> None:
         """Validate the parsed .gensi data."""
@@ -38,51 +73,54 @@ class GensiParser:
             raise ValueError("At least one [[index]] section is required")
 
         # Validate each index
-        num_indices = len(self.data['index'])
-        for i, index in enumerate(self.data['index']):
+        indices = self.data['index']
+        multiple_indices = len(indices) > 1
+        for i, index in enumerate(indices):
             # 'name' is only required if there are multiple indices
-            if num_indices > 1:
-                if 'name' not in index or not index['name'].strip():
-                    raise ValueError(f"Index {i}: 'name' is required when there are multiple [[index]] sections")
+            if multiple_indices and not index.get('name', '').strip():
+                raise ValueError(f"Index {i}: 'name' is required when there are multiple [[index]] sections")
 
             if 'url' not in index:
                 raise ValueError(f"Index {i}: 'url' is required")
-            if 'type' not in index:
+            index_type = index.get('type')
+            if index_type is None:
                 raise ValueError(f"Index {i}: 'type' is required")
-            if index['type'] not in ['html', 'rss', 'json', 'bluesky']:
+            if index_type not in _INDEX_TYPES:
                 raise ValueError(f"Index {i}: 'type' must be 'html', 'rss', 'json', or 'bluesky'")
+            has_python = 'python' in index
 
             # Validate HTML index
-            if index['type'] == 'html':
+            if index_type == 'html':
                 # Check if using Python override or simple mode
-                if 'python' not in index:
+                if not has_python:
                     if 'links' not in index:
                         raise ValueError(f"Index {i}: 'links' is required for HTML type (CSS selector pointing to <a> elements)")
 
-                # If response_type is json, validate json_path
-                if index.get('response_type') == 'json':
-                    if 'python' not in index and 'json_path' not in index:
+                    # If response_type is json, validate json_path
+                    if index.get('response_type') == 'json' and 'json_path' not in index:
                         raise ValueError(f"Index {i}: 'json_path' is required when response_type='json' in simple mode")
 
             # Validate JSON index
-            elif index['type'] == 'json':
+            elif index_type == 'json':
                 # JSON indices require either json_path or python override
-                if 'python' not in index:
-                    if 'json_path' not in index:
-                        raise ValueError(f"Index {i}: 'json_path' is required for JSON type in simple mode")
-                    # links is now optional:
-                    # - If present: HTML extraction mode (extract HTML from JSON, then use CSS selector)
-                    # - If absent: Direct links mode (extract URLs directly from JSON)
+                if not has_python and 'json_path' not in index:
+                    raise ValueError(f"Index {i}: 'json_path' is required for JSON type in simple mode")
+                # links is now optional:
+                # - If present: HTML extraction mode (extract HTML from JSON, then use CSS selector)
+                # - If absent: Direct links mode (extract URLs directly from JSON)
 
             # Validate Bluesky index
-            elif index['type'] == 'bluesky':
-                if 'python' not in index and 'username' not in index:
+            elif index_type == 'bluesky':
+                if not has_python and 'username' not in index:
                     raise ValueError(f"Index {i}: 'username' is required for Bluesky type in simple mode")
 
-                if 'limit' in index:
-                    limit = index['limit']
-                    if not isinstance(limit, int) or limit < 1 or limit > 100:
-                        raise ValueError(f"Index {i}: 'limit' must be an integer between 1 and 100")
+                limit = index.get('limit')
+                if limit is not None and (not isinstance(limit, int) or limit < 1 or limit > 100):
+                    raise ValueError(f"Index {i}: 'limit' must be an integer between 1 and 100")
+
+            # Validate per-index article override if present
+            if isinstance(index.get('article'), dict):
+                self._validate_remove(index['article'], f"Index {i}: article")
 
             # Validate url_transform section if present
             if 'url_transform' in index:
@@ -106,6 +144,16 @@ class GensiParser:
                     if not has_template:
                         raise ValueError(f"Index {i}: url_transform requires 'template' in simple mode")
 
+                    if not isinstance(transform['pattern'], str) or not isinstance(transform['template'], str):
+                        raise ValueError(f"Index {i}: url_transform 'pattern' and 'template' must be strings")
+
+                    # Compile the pattern/template once at load time; this also
+                    # reports invalid regexes before any fetching starts
+                    try:
+                        compile_url_transform(transform['pattern'], transform['template'])
+                    except re.error as e:
+                        raise ValueError(f"Index {i}: url_transform 'pattern' is not a valid regex: {e}") from e
+
         # Validate cover section if present
         if 'cover' in self.data:
             if 'url' not in self.data['cover']:
@@ -117,7 +165,7 @@ class GensiParser:
 
             # Validate response_type if present
             if 'response_type' in article:
-                if article['response_type'] not in ['html', 'json']:
+                if article['response_type'] not in _RESPONSE_TYPES:
                     raise ValueError("Article: 'response_type' must be 'html' or 'json'")
 
                 # If response_type is json, validate json_path
@@ -139,6 +187,8 @@ class GensiParser:
                         elif not isinstance(json_path, str):
                             raise ValueError("Article: 'json_path' must be a string or dict")
 
+            self._validate_remove(article, "Article")
+
             # Check if using Python override or simple mode
             # Note: if response_type='json' with json_path, content selector is not needed
             # (content will be extracted from JSON)
@@ -168,6 +218,75 @@ class GensiParser:
                     raise ValueError(f"Replacement {i}: 'replacement' must be a string")
                 if not isinstance(replacement['regex'], bool):
                     raise ValueError(f"Replacement {i}: 'regex' must be a boolean (true or false)")
+                if 'count' in replacement:
+                    count = replacement['count']
+                    if not isinstance(count, int) or isinstance(count, bool) or count < 1:
+                        raise ValueError(f"Replacement {i}: 'count' must be a positive integer")
+
+    def _precompile_selectors(self) -> None:
+        """
+        Compile the recipe's CSS selectors into the shared selector cache.
+
+        Selectors that fail to compile are left alone here; the extractor reports
+        them when (and if) they are actually used.
+        """
+        sections = [(index, ('links',)) for index in self.data['index']]
+        sections += [
+            (index['article'], ('content', 'title', 'author', 'date'))
+            for index in self.data['index']
+            if isinstance(index.get('article'), dict)
+        ]
+        if isinstance(self.data.get('article'), dict):
+            sections.append((self.data['article'], ('content', 'title', 'author', 'date')))
+        if isinstance(self.data.get('cover'), dict):
+            sections.append((self.data['cover'], ('selector',)))
+
+        for section, keys in sections:
+            for key in keys:
+                selector = section.get(key)
+                if isinstance(selector, str) and selector:
+                    try:
+                        compile_css(selector)
+                    except SelectorError:
+                        pass
+
+    def _precompile_replacements(self) -> None:
+        """
+        Compile the recipe's regex replacements into the shared pattern cache.
+
+        Invalid patterns are left alone here; apply_replacements warns about
+        them and skips the rule.
+        """
+        for replacement in self.replacements:
+            if replacement['regex']:
+                try:
+                    compile_pattern(replacement['pattern'])
+                except re.error:
+                    pass
+
+    def _validate_remove(self, article: dict[str, Any], context: str) -> None:
+        """
+        Validate an article's 'remove' list and compile it once at load time.
+
+        Args:
+            article: The article configuration
+            context: Prefix for error messages (e.g. "Article")
+
+        Raises:
+            ValueError: If 'remove' is not a list of valid CSS selectors
+        """
+        if 'remove' not in article:
+            return
+
+        remove = article['remove']
+        if not isinstance(remove, list) or not all(isinstance(sel, str) for sel in remove):
+            raise ValueError(f"{context}: 'remove' must be a list of CSS selectors")
+
+        if remove:
+            try:
+                compile_remove_selectors(tuple(remove))
+            except SelectorError as e:
+                raise ValueError(f"{context}: 'remove' contains an invalid CSS selector: {e}") from e
 
     @property
     def title(self) -> str:
@@ -8,6 +8,7 @@ from dataclasses import dataclass
 from slugify import slugify
 
 from .parser import GensiParser
+from .cache import HttpCache
 from .cached_fetcher import CachedFetcher
 from .extractor import Extractor, parse_rss_feed, parse_bluesky_feed
 from .sanitizer import Sanitizer
@@ -19,6 +20,7 @@ from .typography import improve_typography
 from .replacements import apply_replacements
 from .cover_generator import CoverGenerator
 from ..utils.thumbnail_extractor import extract_thumbnails
+from ..utils.html_parser import get_html_parser
 from lxml import html as lxml_html
 
 logger = logging.getLogger(__name__)
@@ -26,7 +28,15 @@ logger = logging.getLogger(__name__)
 
 @dataclass
 class ProcessingProgress:
-    """Progress information for processing."""
+    """
+    Progress information for processing.
+
+    Indices are fetched concurrently and each feeds its articles into the
+    article stage as soon as it resolves, so 'article' updates can arrive
+    before every index is known: their `total` grows as more indices
+    complete, and 'index' updates may interleave with them. current/total
+    is therefore not monotonic across a run.
+    """
     stage: str  # 'parsing', 'cover', 'index', 'article', 'building', 'done'
     current: int = 0
     total: int = 0
@@ -42,7 +52,8 @@ class GensiProcessor:
         output_dir: Optional[Path | str] = None,
         progress_callback: Optional[Callable[[ProcessingProgress], None]] = None,
         max_parallel: int = 5,
-        cache_enabled: bool = True
+        cache_enabled: bool = True,
+        cache_dir: Optional[Path | str] = None
     ):
         """
         Initialize the processor.
@@ -53,18 +64,22 @@ class GensiProcessor:
             progress_callback: Callback function for progress updates
             max_parallel: Maximum number of parallel downloads (default: 5)
             cache_enabled: Whether to enable HTTP caching (default: True)
+            cache_dir: HTTP cache directory (default: the system cache directory)
         """
         self.gensi_path = Path(gensi_path)
         self.output_dir = Path(output_dir) if output_dir else self.gensi_path.parent
         self.progress_callback = progress_callback
         self.max_parallel = max_parallel
         self.cache_enabled = cache_enabled
+        self.cache_dir = Path(cache_dir) if cache_dir else None
 
         self.parser: Optional[GensiParser] = None
         self.sanitizer = Sanitizer()
         self.python_executor = PythonExecutor()
         self.cover_data: Optional[bytes] = None
         self.cover_extension: Optional[str] = None
+        # Processed article images shared across the articles of one run
+        self._image_cache: dict = {}
 
     def _report_progress(self, stage: str, current: int = 0, total: int = 0, message: str = ''):
         """Report progress to the callback."""
@@ -86,17 +101,43 @@ class GensiProcessor:
             self._report_progress('parsing', message='Parsing .gensi file')
             self.parser = GensiParser(self.gensi_path)
 
-            # Process cover
-            if self.parser.cover:
-                await self._process_cover()
-
             # Process indices and articles
-            sections_data = []
             total_articles = 0
 
-            # First pass: collect all articles
-            async with CachedFetcher(cache_enabled=self.cache_enabled) as fetcher:
-                for i, index_config in enumerate(self.parser.indices):
+            # One fetcher (and HTTP session) for the whole run, so connections
+            # are reused across cover, index, article and image requests
+            self._image_cache = {}
+            cache = HttpCache(self.cache_dir) if self.cache_enabled and self.cache_dir else None
+            async with CachedFetcher(cache_enabled=self.cache_enabled, cache=cache) as fetcher:
+                # Process cover in the background while the indices are fetched
+                cover_task = None
+                if self.parser.cover:
+                    self._report_progress('cover', message='Downloading cover image')
+                    cover_task = asyncio.create_task(self._process_cover(fetcher))
+
+                # Each index feeds its own articles straight into the article
+                # stage, so one section's articles download while the next
+                # index is still being fetched. One semaphore spans all
+                # sections and bounds index fetches as well as articles;
+                # results keep their index order. The article total grows as
+                # indices complete (see ProcessingProgress).
+                current_article = 0
+                semaphore = asyncio.Semaphore(self.max_parallel)
+
+                async def process_article_with_limit(article_data, article_config):
+                    nonlocal current_article
+                    async with semaphore:
+                        current_article += 1
+                        self._report_progress(
+                            'article',
+                            current=current_article,
+                            total=total_articles,
+                            message=f'Downloading article {current_article}/{total_articles}'
+                        )
+                        return await self._process_article(fetcher, article_data, article_config)
+
+                async def process_section(i, index_config):
+                    nonlocal total_articles
                     # Use name if provided, otherwise None (for single index case)
                     section_name = index_config.get('name')
                     if section_name:
@@ -104,46 +145,56 @@ class GensiProcessor:
                     else:
                         self._report_progress('index', message='Processing articles')
 
-                    articles = await self._process_index(fetcher, index_config)
+                    async with semaphore:
+                        articles = await self._process_index(fetcher, index_config)
                     total_articles += len(articles)
 
-                    sections_data.append({
-                        'name': section_name,
-                        'articles': articles,
-                        'index': i  # Store index to match later
-                    })
-
-                # Second pass: fetch and process articles in parallel
-                current_article = 0
-                for section in sections_data:
                     # Get article config for this section's index
-                    index_config = self.parser.indices[section['index']]
                     article_config = self.parser.get_article_config(index_config)
+                    article_tasks = [
+                        asyncio.create_task(process_article_with_limit(art, article_config))
+                        for art in articles
+                    ]
+                    try:
+                        processed_articles = await asyncio.gather(*article_tasks)
+                    except BaseException:
+                        # gather() leaves the other articles running when one fails
+                        for task in article_tasks:
+                            task.cancel()
+                        await asyncio.gather(*article_tasks, return_exceptions=True)
+                        raise
+                    return {
+                        'name': section_name,
+                        'articles': processed_articles,
+                        'index': i  # Store index to match later
+                    }
 
-                    # Process articles with parallel limit
-                    semaphore = asyncio.Semaphore(self.max_parallel)
-
-                    async def process_article_with_limit(article_data):
-                        nonlocal current_article
-                        async with semaphore:
-                            current_article += 1
-                            self._report_progress(
-                                'article',
-                                current=current_article,
-                                total=total_articles,
-                                message=f'Downloading article {current_article}/{total_articles}'
-                            )
-                            return await self._process_article(fetcher, article_data, article_config)
-
-                    # Process all articles in section
-                    processed_articles = await asyncio.gather(
-                        *[process_article_with_limit(art) for art in section['articles']]
-                    )
-                    section['articles'] = processed_articles
+                section_tasks = [
+                    asyncio.create_task(process_section(i, index_config))
+                    for i, index_config in enumerate(self.parser.indices)
+                ]
+                try:
+                    sections_data = list(await asyncio.gather(*section_tasks))
+                    if cover_task:
+                        await cover_task
+                except BaseException:
+                    # Don't leave other sections (or the cover) running against
+                    # a fetcher that is about to be closed
+                    pending = section_tasks + ([cover_task] if cover_task else [])
+                    for task in pending:
+                        task.cancel()
+                    await asyncio.gather(*pending, return_exceptions=True)
+                    # Shared image downloads are shielded from their callers,
+                    # so they have to be cancelled on their own
+                    image_tasks = list(self._image_cache.values())
+                    for task in image_tasks:
+                        task.cancel()
+                    await asyncio.gather(*image_tasks, return_exceptions=True)
+                    raise
 
                 # Generate automatic cover if no explicit cover was provided
                 if not self.parser.cover and not self.cover_data:
-                    await self._generate_auto_cover(sections_data)
+                    await self._generate_auto_cover(fetcher, sections_data)
 
             # Build EPUB
             self._report_progress('building', message='Building EPUB file')
@@ -155,68 +206,59 @@ class GensiProcessor:
         except Exception as e:
             self._report_progress('error', message=f'Error: {str(e)}')
             raise
+        finally:
+            # Processed images live on in sections_data; don't keep them here
+            self._image_cache = {}
 
-    async def _process_cover(self) -> None:
-        """Process and fetch the cover image."""
+    async def _process_cover(self, fetcher: CachedFetcher) -> None:
+        """
+        Process and fetch the cover image.
+
+        Args:
+            fetcher: The fetcher instance
+        """
         cover_config = self.parser.cover
         if not cover_config:
             return
 
-        self._report_progress('cover', message='Downloading cover image')
-
-        async with CachedFetcher(cache_enabled=self.cache_enabled) as fetcher:
-            # Fetch cover page/image
-            cover_url = cover_config['url']
-            from ..utils.url_utils import is_image_url
+        # Fetch cover page/image
+        cover_url = cover_config['url']
+        from ..utils.url_utils import is_image_url
 
-            if is_image_url(cover_url):
-                # Direct image URL
-                raw_data, _ = await fetcher.fetch_binary(cover_url, context="cover")
-                # Process cover image (resize and optimize)
-                try:
-                    self.cover_data, self.cover_extension = process_image(
-                        raw_data, cover_url, image_type='cover'
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to process cover image {cover_url}: {e}")
-                    # Fallback to raw data
-                    self.cover_data = raw_data
-                    # Try to extract extension from URL
-                    from ..utils.url_utils import is_image_url
-                    from pathlib import Path
-                    from urllib.parse import urlparse
-                    parsed = urlparse(cover_url)
-                    ext = Path(parsed.path).suffix.lstrip('.')
-                    self.cover_extension = ext if ext else 'jpg'
-            else:
-                # Page with image
-                html_content, final_url = await fetcher.fetch(cover_url, context="cover")
-                extractor = Extractor(final_url, html_content)
-                cover_img_url = extractor.extract_cover_url(cover_config, self.python_executor)
-
-                if cover_img_url:
-                    raw_data, _ = await fetcher.fetch_binary(cover_img_url, context="cover")
-                    # Process cover image (resize and optimize)
-                    try:
-                        self.cover_data, self.cover_extension = process_image(
-                            raw_data, cover_img_url, image_type='cover'
-                        )
-                    except Exception as e:
-                        logger.warning(f"Failed to process cover image {cover_img_url}: {e}")
-                        # Fallback to raw data
-                        self.cover_data = raw_data
-                        # Try to extract extension from URL
-                        from pathlib import Path
-                        from urllib.parse import urlparse
-                        parsed = urlparse(cover_img_url)
-                        ext = Path(parsed.path).suffix.lstrip('.')
-                        self.cover_extension = ext if ext else 'jpg'
-
-    async def _generate_auto_cover(self, sections_data: list[dict]) -> None:
+        if is_image_url(cover_url):
+            # Direct image URL
+            cover_img_url = cover_url
+        else:
+            # Page with image
+            html_content, final_url = await fetcher.fetch(cover_url, context="cover")
+            extractor = Extractor(final_url, html_content)
+            cover_img_url = extractor.extract_cover_url(cover_config, self.python_executor)
+            if not cover_img_url:
+                return
+
+        raw_data, _ = await fetcher.fetch_binary(cover_img_url, context="cover")
+        # Process cover image (resize and optimize) off the event loop
+        try:
+            self.cover_data, self.cover_extension = await asyncio.to_thread(
+                process_image, raw_data, cover_img_url, image_type='cover'
+            )
+        except Exception as e:
+            logger.warning(f"Failed to process cover image {cover_img_url}: {e}")
+            # Fallback to raw data
+            self.cover_data = raw_data
+            # Try to extract extension from URL
+            from pathlib import Path
+            from urllib.parse import urlparse
+            parsed = urlparse(cover_img_url)
+            ext = Path(parsed.path).suffix.lstrip('.')
+            self.cover_extension = ext if ext else 'jpg'
+
+    async def _generate_auto_cover(self, fetcher: CachedFetcher, sections_data: list[dict]) -> None:
         """
         Generate cover automatically from article thumbnails.
 
         Args:
+            fetcher: The fetcher instance
             sections_data: Processed sections with articles containing thumbnails
         """
         self._report_progress('cover', message='Generating automatic cover')
@@ -245,19 +287,18 @@ class GensiProcessor:
 
         # Generate cover
         try:
-            async with CachedFetcher(cache_enabled=self.cache_enabled) as fetcher:
-                generator = CoverGenerator()
-                cover_data, cover_ext = await generator.generate_from_thumbnails(
-                    thumbnail_urls=unique_thumbnails,
-                    title=self.parser.title,
-                    author=self.parser.author,
-                    fetcher=fetcher,
-                    fallback_to_text=True
-                )
+            generator = CoverGenerator()
+            cover_data, cover_ext = await generator.generate_from_thumbnails(
+                thumbnail_urls=unique_thumbnails,
+                title=self.parser.title,
+                author=self.parser.author,
+                fetcher=fetcher,
+                fallback_to_text=True
+            )
 
-                self.cover_data = cover_data
-                self.cover_extension = cover_ext
-                logger.info(f"Auto-cover: Generated ({len(cover_data)} bytes, .{cover_ext})")
+            self.cover_data = cover_data
+            self.cover_extension = cover_ext
+            logger.info(f"Auto-cover: Generated ({len(cover_data)} bytes, .{cover_ext})")
 
         except Exception as e:
             logger.warning(f"Auto-cover generation failed: {e}")
@@ -362,13 +403,14 @@ class GensiProcessor:
             article_url = article_data['url']
             enable_images = article_config.get('images', True) if article_config else True
             sanitized_content, image_map = await process_article_images(
-                sanitized_content, article_url, fetcher, enable_images, image_type='article'
+                sanitized_content, article_url, fetcher, enable_images, image_type='article',
+                processed_cache=self._image_cache
             )
 
             # Extract thumbnail for potential cover generation
             thumbnail = None
             try:
-                doc = lxml_html.fromstring(sanitized_content)
+                doc = lxml_html.fromstring(sanitized_content, parser=get_html_parser())
                 thumbnails = extract_thumbnails(doc, article_url, max_count=1)
                 thumbnail = thumbnails[0] if thumbnails else None
             except Exception as e:
@@ -388,22 +430,12 @@ class GensiProcessor:
         article_url = article_data['url']
         content, final_url = await fetcher.fetch(article_url, context="article")
 
-        # Extract thumbnail from ORIGINAL full HTML (before content extraction strips meta tags)
-        thumbnail = None
-        try:
-            doc = lxml_html.fromstring(content)
-            thumbnails = extract_thumbnails(doc, final_url, max_count=1)
-            thumbnail = thumbnails[0] if thumbnails else None
-        except Exception as e:
-            logger.debug(f"Failed to extract thumbnail from {final_url}: {e}")
+        # Parse, pick the thumbnail and extract content off the event loop
+        thumbnail, extracted = await asyncio.to_thread(
+            self._extract_article, content, final_url, article_config
+        )
 
-        # Extract content
         if article_config:
-            # Determine content type
-            content_type = 'json' if article_config.get('response_type') == 'json' else 'html'
-            extractor = Extractor(final_url, content, content_type=content_type, config=article_config)
-            extracted = extractor.extract_article_content(article_config, self.python_executor)
-
             # Sanitize content
             if extracted['content']:
                 sanitized = self.sanitizer.sanitize(extracted['content'])
@@ -425,7 +457,8 @@ class GensiProcessor:
                 # Process images (download and update references)
                 enable_images = article_config.get('images', True) if article_config else True
                 sanitized, image_map = await process_article_images(
-                    sanitized, final_url, fetcher, enable_images, image_type='article'
+                    sanitized, final_url, fetcher, enable_images, image_type='article',
+                    processed_cache=self._image_cache
                 )
 
                 extracted['content'] = sanitized
@@ -448,6 +481,49 @@ class GensiProcessor:
                 'thumbnail': thumbnail  # Use thumbnail extracted from full HTML
             }
 
+    def _extract_article(
+        self,
+        content: str,
+        final_url: str,
+        article_config: dict | None
+    ) -> tuple[str | None, dict | None]:
+        """
+        Parse a fetched article page, then extract its thumbnail and content.
+
+        Runs in a worker thread: the page is parsed once, and the same document
+        is used for the thumbnail and (for HTML responses) the extraction.
+
+        Args:
+            content: The fetched page
+            final_url: The page URL after redirects
+            article_config: The article configuration
+
+        Returns:
+            Tuple of (thumbnail_url, extracted); extracted is None without an
+            article configuration
+        """
+        # Extract thumbnail from ORIGINAL full HTML (before content extraction strips meta tags)
+        thumbnail = None
+        doc = None
+        try:
+            doc = lxml_html.fromstring(content, parser=get_html_parser())
+            thumbnails = extract_thumbnails(doc, final_url, max_count=1)
+            thumbnail = thumbnails[0] if thumbnails else None
+        except Exception as e:
+            logger.debug(f"Failed to extract thumbnail from {final_url}: {e}")
+
+        if not article_config:
+            return thumbnail, None
+
+        # Determine content type
+        content_type = 'json' if article_config.get('response_type') == 'json' else 'html'
+        # Reuse the document parsed for the thumbnail instead of parsing again
+        extractor = Extractor(
+            final_url, content, content_type=content_type, config=article_config,
+            document=doc if content_type == 'html' else None
+        )
+        return thumbnail, extractor.extract_article_content(article_config, self.python_executor)
+
     async def _build_epub(self, sections_data: list[dict]) -> Path:
         """
         Build the EPUB file from processed sections and articles.
@@ -485,8 +561,9 @@ class GensiProcessor:
         output_filename = f"{slugify(self.parser.title)}.epub"
         output_path = self.output_dir / output_filename
 
-        # Build EPUB
-        builder.build(output_path)
+        # Build EPUB in a worker thread: compressing and writing the archive is
+        # blocking file I/O that would otherwise stall the event loop
+        await asyncio.to_thread(builder.build, output_path)
 
         return output_path
 
@@ -496,7 +573,8 @@ async def process_gensi_file(
     output_dir: Optional[Path | str] = None,
     progress_callback: Optional[Callable[[ProcessingProgress], None]] = None,
     max_parallel: int = 5,
-    cache_enabled: bool = True
+    cache_enabled: bool = True,
+    cache_dir: Optional[Path | str] = None
 ) -> Path:
     """
     Convenience function to process a .gensi file.
@@ -507,9 +585,12 @@ async def process_gensi_file(
         progress_callback: Callback function for progress updates
         max_parallel: Maximum number of parallel downloads
         cache_enabled: Whether to enable HTTP caching (default: True)
+        cache_dir: HTTP cache directory (default: the system cache directory)
 
     Returns:
         Path to the generated EPUB file
     """
-    processor = GensiProcessor(gensi_path, output_dir, progress_callback, max_parallel, cache_enabled)
+    processor = GensiProcessor(
+        gensi_path, output_dir, progress_callback, max_parallel, cache_enabled, cache_dir
+    )
     return await processor.process()
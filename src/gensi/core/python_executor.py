@@ -1,6 +1,62 @@
 """Python script executor for user-provided scripts in .gensi files."""
 
-from typing import Any
+from functools import lru_cache
+from types import CodeType
+from typing import Any, Optional
+
+from .extractor import compile_css
+
+
+@lru_cache(maxsize=64)
+def _try_compile(source: str, mode: str) -> Optional[CodeType]:
+    """
+    Compile source code, caching the result.
+
+    The same script is run once per article or feed entry, so compiling it
+    once turns every later call into a plain exec/eval of the code object.
+
+    Args:
+        source: The Python source code
+        mode: Compile mode ('exec' or 'eval')
+
+    Returns:
+        The compiled code object, or None if the source is not valid in this mode
+    """
+    try:
+        return compile(source, '<string>', mode)
+    except SyntaxError:
+        return None
+
+
+@lru_cache(maxsize=64)
+def _wrap_in_function(script: str) -> str:
+    """
+    Wrap a script that uses 'return' in a function definition.
+
+    Cached like _try_compile, so repeat runs of a script skip re-indenting it
+    and look up its compiled wrapper with the same (hash-cached) string.
+    """
+    lines = script.split('\n')
+    indented_lines = [f"    {line}" if line.strip() else "" for line in lines]
+    return "def __gensi_user_script():\n" + "\n".join(indented_lines)
+
+
+def select(element, css: str) -> list:
+    """
+    Match a CSS selector against an lxml element.
+
+    Injected into every script as select(document, '.item'). Unlike
+    element.cssselect(), which translates the selector to XPath on every call,
+    each distinct selector is compiled once and reused across articles.
+
+    Args:
+        element: The lxml element to search
+        css: CSS selector
+
+    Returns:
+        List of matching elements
+    """
+    return compile_css(css)(element)
 
 
 class PythonExecutor:
@@ -25,32 +81,39 @@ class PythonExecutor:
             Exception: If the script execution fails
         """
         try:
-            # Create execution namespace with context variables
-            namespace = context.copy()
+            # Create execution namespace with helpers and context variables
+            namespace = {'select': select, **context}
 
             # Strategy 1: If script contains 'return', wrap in a function
             if 'return' in script:
-                # Indent each line and wrap in a function
-                lines = script.split('\n')
-                indented_lines = [f"    {line}" if line.strip() else "" for line in lines]
-                wrapped_script = "def __gensi_user_script():\n" + "\n".join(indented_lines)
-
-                try:
-                    exec(wrapped_script, namespace)
+                # A one-line 'return EXPR' needs no function: evaluate EXPR
+                stripped = script.strip()
+                if stripped.startswith('return ') and '\n' not in stripped:
+                    code = _try_compile(stripped[7:].lstrip(), 'eval')
+                    if code is not None:
+                        return eval(code, namespace)
+
+                code = _try_compile(_wrap_in_function(script), 'exec')
+                # If wrapping fails, fall through to other strategies
+                if code is not None:
+                    exec(code, namespace)
                     return namespace['__gensi_user_script']()
-                except SyntaxError:
-                    # If wrapping fails, fall through to other strategies
-                    pass
 
             # Strategy 2: Try evaluating as expression (implicit return)
-            try:
-                return eval(script, namespace)
-            except (SyntaxError, TypeError):
-                # Not a simple expression
-                pass
+            code = _try_compile(script, 'eval')
+            if code is not None:
+                try:
+                    return eval(code, namespace)
+                except TypeError:
+                    # Not a simple expression
+                    pass
 
             # Strategy 3: Execute as statements (no return value expected)
-            exec(script, namespace)
+            code = _try_compile(script, 'exec')
+            if code is None:
+                # Compile again uncached to raise the actual SyntaxError
+                compile(script, '<string>', 'exec')
+            exec(code, namespace)
             return None
 
         except Exception as e:
@@ -1,11 +1,36 @@
 """Apply search/replace transformations to HTML content."""
 
 import re
+from functools import lru_cache
 from typing import Any
 
+# Regex patterns that failed to compile (warned about once, then skipped)
+_invalid_patterns: set[str] = set()
 
-def apply_replacements(content: str, replacements: list[dict[str, Any]]) -> str:
+
+@lru_cache(maxsize=256)
+def compile_pattern(pattern: str) -> re.Pattern:
     """
+    Compile a replacement regex, caching the result.
+
+    The same rules run over every article of a recipe, so each pattern is
+    compiled once instead of going through re's module-level cache lookup
+    (and recompiling once more than re._MAXCACHE patterns are in use).
+
+    Args:
+        pattern: Regular expression pattern
+
+    Returns:
+        Compiled pattern
+
+    Raises:
+        re.error: If the pattern is not a valid regex
+    """
+    return re.compile(pattern)
+
+
+def apply_replacements(content: str, replacements: list[dict[str, Any]]) -> str:
+    r"""
     Apply a list of search/replace transformations to HTML content.
 
     Replacements are applied in the order they are defined in the list.
@@ -17,6 +42,8 @@ def apply_replacements(content: str, replacements: list[dict[str, Any]]) -> str:
             - pattern (str): The pattern to search for
             - replacement (str): The replacement text
             - regex (bool): Whether to use regex matching
+            - count (int, optional): Replace at most this many matches
+              (default: all)
 
     Returns:
         The transformed HTML content
@@ -37,18 +64,24 @@ def apply_replacements(content: str, replacements: list[dict[str, Any]]) -> str:
         pattern = replacement_config['pattern']
         replacement = replacement_config['replacement']
         is_regex = replacement_config['regex']
+        count = replacement_config.get('count', 0)
 
         if is_regex:
             # Use regex replacement
+            if pattern in _invalid_patterns:
+                continue
             try:
-                result = re.sub(pattern, replacement, result)
+                result = compile_pattern(pattern).sub(replacement, result, count=count)
             except re.error as e:
                 # If the regex is invalid, skip this replacement and log warning
                 # (In a production system, this should be logged properly)
+                if e.pattern == pattern:
+                    # Warn once; skip the failing compile for later articles
+                    _invalid_patterns.add(pattern)
                 print(f"Warning: Invalid regex pattern '{pattern}': {e}")
                 continue
         else:
             # Use literal string replacement
-            result = result.replace(pattern, replacement)
+            result = result.replace(pattern, replacement, count or -1)
 
     return result
@@ -1,7 +1,15 @@
 """HTML sanitization using nh3 for EPUB 2.0.1 compliance."""
 
+from functools import lru_cache
+
 import nh3
 
+try:
+    from nh3 import Cleaner
+except ImportError:
+    # Older nh3 releases only provide the module-level clean()
+    Cleaner = None
+
 
 # EPUB 2.0.1 supported tags (XHTML 1.1 subset)
 # Note: 'script' and 'style' are excluded as nh3 treats them specially
@@ -74,6 +82,17 @@ class Sanitizer:
         self.allowed_attributes = allowed_attributes or EPUB_ALLOWED_ATTRIBUTES
         self.url_schemes = url_schemes or EPUB_URL_SCHEMES
 
+        # nh3.clean() converts the tag/attribute/scheme sets on every call;
+        # a Cleaner converts them once and is reused for every article
+        self._cleaner = None
+        if Cleaner is not None:
+            self._cleaner = Cleaner(
+                tags=self.allowed_tags,
+                attributes=self.allowed_attributes,
+                url_schemes=self.url_schemes,
+                strip_comments=True,
+            )
+
     def sanitize(self, html_content: str) -> str:
         """
         Sanitize HTML content for EPUB compatibility.
@@ -84,6 +103,14 @@ class Sanitizer:
         Returns:
             Sanitized HTML content
         """
+        # Nothing to sanitize in blank content; nh3 would return it as-is
+        # (except for '\r', which its parser normalizes to '\n')
+        if not html_content.strip(' \t\n\f'):
+            return html_content
+
+        if self._cleaner is not None:
+            return self._cleaner.clean(html_content)
+
         # Use nh3 to sanitize with EPUB-compatible settings
         sanitized = nh3.clean(
             html_content,
@@ -124,5 +151,10 @@ def sanitize_html(html_content: str) -> str:
     Returns:
         Sanitized HTML content
     """
-    sanitizer = Sanitizer()
-    return sanitizer.sanitize(html_content)
+    return _default_sanitizer().sanitize(html_content)
+
+
+@lru_cache(maxsize=1)
+def _default_sanitizer() -> Sanitizer:
+    """Get the shared Sanitizer with the default EPUB settings."""
+    return Sanitizer()
@@ -1,7 +1,14 @@
 """Typography improvements for article content using typogrify."""
 
+import re
+
 from typogrify.filters import smartypants, caps, initial_quotes, amp
 
+# Characters the filters below act on: ampersands (amp), quotes, backticks,
+# dashes, dots and backslash escapes (smartypants, initial_quotes). Content
+# with none of them comes back unchanged.
+_TYPOGRAPHY_TRIGGER_RE = re.compile(r'["\'`\-.&\\]')
+
 
 def improve_typography(content: str) -> str:
     """
@@ -21,7 +28,7 @@ def improve_typography(content: str) -> str:
     Returns:
         HTML content with improved typography
     """
-    if not content:
+    if not content or not _TYPOGRAPHY_TRIGGER_RE.search(content):
         return content
 
     try:
@@ -17,6 +17,7 @@ from PySide6.QtCore import Qt, QThread, Signal, QSettings, QSize, QTimer
 from PySide6.QtGui import QAction, QPixmap, QIcon
 
 from .core.processor import GensiProcessor, ProcessingProgress
+from .utils.event_loop import new_event_loop
 
 
 class ItemStatus(Enum):
@@ -64,7 +65,7 @@ class ProcessorThread(QThread):
                     self.progress_updated.emit(prog)
 
             # Run async processing
-            loop = asyncio.new_event_loop()
+            loop = new_event_loop()
             asyncio.set_event_loop(loop)
 
             processor = GensiProcessor(
@@ -0,0 +1,38 @@
+"""Event loop helpers, using uvloop when it is installed."""
+
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+# Optional: uvloop is a faster drop-in event loop (not available on Windows)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+T = TypeVar('T')
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Create a new event loop.
+
+    Returns:
+        A uvloop event loop if uvloop is installed, otherwise the asyncio default
+    """
+    if uvloop is not None:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def run(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion on a fresh event loop, like asyncio.run().
+
+    Args:
+        coro: The coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    with asyncio.Runner(loop_factory=new_event_loop) as runner:
+        return runner.run(coro)
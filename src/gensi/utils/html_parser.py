@@ -0,0 +1,25 @@
+"""Shared lxml HTML parser configuration."""
+
+import threading
+from lxml import html
+
+# Per-thread parsers (extraction may run in worker threads)
+_PARSER = threading.local()
+
+
+def get_html_parser() -> html.HTMLParser:
+    """
+    Get the HTML parser for the current thread, creating it on first use.
+
+    Reusing one parser per thread avoids rebuilding parser state for every
+    document. The parser skips the ID hash table (nothing here looks elements
+    up by ID through libxml2) and never touches the network.
+
+    Returns:
+        lxml HTMLParser instance
+    """
+    parser = getattr(_PARSER, 'parser', None)
+    if parser is None:
+        parser = html.HTMLParser(collect_ids=False, no_network=True, recover=True)
+        _PARSER.parser = parser
+    return parser
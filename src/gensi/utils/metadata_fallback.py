@@ -1,7 +1,82 @@
 """Metadata extraction fallback logic for HTML pages."""
 
 from typing import Optional
-from lxml import html
+from lxml import html, etree
+
+# Fallback sources in priority order. Tuples are (attribute, value) keys into the
+# document's <meta> tags; compiled XPath expressions are evaluated against the document.
+_META_CONTENT_XPATH = etree.XPath('//meta[@content]')
+
+_TITLE_SOURCES = (
+    ('property', 'og:title'),
+    ('name', 'twitter:title'),
+    etree.XPath('//title/text()'),
+    etree.XPath('//h1/text()'),
+)
+
+_AUTHOR_SOURCES = (
+    ('name', 'author'),
+    ('property', 'article:author'),
+    ('property', 'og:article:author'),
+    etree.XPath('//span[@class="author"]/text()'),
+    etree.XPath('//div[@class="author"]/text()'),
+    etree.XPath('//a[@rel="author"]/text()'),
+)
+
+_DATE_SOURCES = (
+    ('property', 'article:published_time'),
+    ('property', 'og:article:published_time'),
+    etree.XPath('//time/@datetime'),
+    ('name', 'date'),
+    ('name', 'pubdate'),
+    etree.XPath('//time/text()'),
+)
+
+
+def _build_meta_map(document: html.HtmlElement) -> dict[tuple[str, str], str]:
+    """
+    Collect the content of all <meta> tags in a single pass.
+
+    Args:
+        document: The parsed HTML document
+
+    Returns:
+        Dictionary mapping ('property' | 'name', value) to the first matching content
+    """
+    metas = {}
+    for meta in _META_CONTENT_XPATH(document):
+        content = meta.get('content')
+        for attr in ('property', 'name'):
+            value = meta.get(attr)
+            if value is not None:
+                metas.setdefault((attr, value), content)
+    return metas
+
+
+def _first_match(document: html.HtmlElement, metas: dict[tuple[str, str], str], sources) -> Optional[str]:
+    """
+    Return the first non-empty value from the given fallback sources.
+
+    Args:
+        document: The parsed HTML document
+        metas: Meta tag map from _build_meta_map
+        sources: Fallback sources in priority order
+
+    Returns:
+        The stripped value, or None if no source matched
+    """
+    for source in sources:
+        if isinstance(source, tuple):
+            value = metas.get(source)
+        else:
+            try:
+                result = source(document)
+            except Exception:
+                continue
+            value = result[0] if result else None
+        if value and value.strip():
+            return value.strip()
+    return None
 
 
 def extract_metadata_fallback(document: html.HtmlElement, url: str) -> dict[str, Optional[str]]:
@@ -18,62 +93,10 @@ def extract_metadata_fallback(document: html.HtmlElement, url: str) -> dict[str,
     Returns:
         Dictionary with 'title', 'author', and 'date' keys (values may be None)
     """
-    metadata = {
-        'title': None,
-        'author': None,
-        'date': None
-    }
+    metas = _build_meta_map(document)
 
-    # Title fallback
-    title_selectors = [
-        '//meta[@property="og:title"]/@content',
-        '//meta[@name="twitter:title"]/@content',
-        '//title/text()',
-        '//h1/text()',
-    ]
-    for selector in title_selectors:
-        try:
-            result = document.xpath(selector)
-            if result and result[0].strip():
-                metadata['title'] = result[0].strip()
-                break
-        except Exception:
-            continue
-
-    # Author fallback
-    author_selectors = [
-        '//meta[@name="author"]/@content',
-        '//meta[@property="article:author"]/@content',
-        '//meta[@property="og:article:author"]/@content',
-        '//span[@class="author"]/text()',
-        '//div[@class="author"]/text()',
-        '//a[@rel="author"]/text()',
-    ]
-    for selector in author_selectors:
-        try:
-            result = document.xpath(selector)
-            if result and result[0].strip():
-                metadata['author'] = result[0].strip()
-                break
-        except Exception:
-            continue
-
-    # Date fallback
-    date_selectors = [
-        '//meta[@property="article:published_time"]/@content',
-        '//meta[@property="og:article:published_time"]/@content',
-        '//time/@datetime',
-        '//meta[@name="date"]/@content',
-        '//meta[@name="pubdate"]/@content',
-        '//time/text()',
-    ]
-    for selector in date_selectors:
-        try:
-            result = document.xpath(selector)
-            if result and result[0].strip():
-                metadata['date'] = result[0].strip()
-                break
-        except Exception:
-            continue
-
-    return metadata
+    return {
+        'title': _first_match(document, metas, _TITLE_SOURCES),
+        'author': _first_match(document, metas, _AUTHOR_SOURCES),
+        'date': _first_match(document, metas, _DATE_SOURCES),
+    }
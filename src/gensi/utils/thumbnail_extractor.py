@@ -1,5 +1,6 @@
 """Thumbnail extraction from HTML for automatic cover generation."""
 
+import heapq
 import json
 import logging
 from typing import List, Optional
@@ -9,10 +10,30 @@ from .url_utils import resolve_url
 
 logger = logging.getLogger(__name__)
 
+# Open Graph / Twitter Card meta tag sources, in priority order: a meta tag's
+# (attribute, value) pair, ranked by its position here, then <link rel="image_src">
+_META_IMAGE_SOURCES = (
+    ('property', 'og:image'),
+    ('property', 'og:image:url'),
+    ('name', 'twitter:image'),
+    ('name', 'twitter:image:src'),
+    ('property', 'article:image'),
+)
+_META_IMAGE_RANKS = {source: rank for rank, source in enumerate(_META_IMAGE_SOURCES)}
+_LINK_IMAGE_RANK = len(_META_IMAGE_SOURCES)
+
+# Substrings of an <img> class (or src) that boost or penalize its score
+_FEATURED_CLASS_KEYWORDS = ('featured', 'hero', 'main', 'thumbnail')
+_ICON_CLASS_KEYWORDS = ('icon', 'avatar', 'logo', 'badge', 'emoji')
+_AD_CLASS_KEYWORDS = ('ad', 'banner', 'sponsor')
+_TRACKING_SRC_KEYWORDS = ('tracking', 'pixel', 'ad', '1x1')
+
 
 class ThumbnailCandidate:
     """Represents a thumbnail candidate with scoring."""
 
+    __slots__ = ('score', 'source', 'url')
+
     def __init__(self, url: str, source: str, score: float = 0.0):
         self.url = url
         self.source = source  # 'meta', 'jsonld', 'body'
@@ -48,12 +69,12 @@ def extract_thumbnails(document: html.HtmlElement, base_url: str, max_count: int
         # Deduplicate
         candidates = _deduplicate_thumbnails(candidates)
 
-        # Sort by score (descending)
-        candidates.sort(key=lambda c: c.score, reverse=True)
+        # Take the top max_count by score (descending, ties in source order)
+        top = heapq.nlargest(max_count, candidates, key=lambda c: c.score)
 
-        # Resolve to absolute URLs and take top max_count
+        # Resolve to absolute URLs
         result = []
-        for candidate in candidates[:max_count]:
+        for candidate in top:
             absolute_url = resolve_url(base_url, candidate.url)
             if absolute_url:
                 result.append(absolute_url)
@@ -70,43 +91,51 @@ def _extract_from_meta_tags(document: html.HtmlElement) -> List[ThumbnailCandida
     """Extract thumbnails from Open Graph and Twitter Card meta tags."""
     candidates = []
 
-    # Meta tag selectors (property and name variants)
-    selectors = [
-        '//meta[@property="og:image"]/@content',
-        '//meta[@property="og:image:url"]/@content',
-        '//meta[@name="twitter:image"]/@content',
-        '//meta[@name="twitter:image:src"]/@content',
-        '//meta[@property="article:image"]/@content',
-        '//link[@rel="image_src"]/@href',
-    ]
-
-    seen_urls = set()
-    for selector in selectors:
-        try:
-            results = document.xpath(selector)
-            for url in results:
-                url = url.strip()
-                if url and url not in seen_urls:
-                    seen_urls.add(url)
-                    candidates.append(ThumbnailCandidate(url, 'meta', score=10.0))
-        except Exception as e:
-            logger.debug(f"Meta tag extraction failed for {selector}: {e}")
-            continue
+    try:
+        # One walk over <meta>/<link> instead of one XPath query per source
+        found = []
+        for elem in document.iter('meta', 'link'):
+            if elem.tag == 'meta':
+                for attr in ('property', 'name'):
+                    rank = _META_IMAGE_RANKS.get((attr, elem.get(attr)))
+                    if rank is not None:
+                        found.append((rank, elem.get('content')))
+            elif elem.get('rel') == 'image_src':
+                found.append((_LINK_IMAGE_RANK, elem.get('href')))
+
+        # Stable sort: by source priority, then document order
+        found.sort(key=lambda item: item[0])
+
+        seen_urls = set()
+        for _, url in found:
+            url = (url or '').strip()
+            if url and url not in seen_urls:
+                seen_urls.add(url)
+                candidates.append(ThumbnailCandidate(url, 'meta', score=10.0))
+
+    except Exception as e:
+        logger.debug(f"Meta tag extraction failed: {e}")
 
     return candidates
 
 
 def _extract_from_jsonld(document: html.HtmlElement) -> List[ThumbnailCandidate]:
     """Extract thumbnails from JSON-LD structured data (schema.org)."""
+    # Imported lazily: gensi.core imports this module during package init
+    from ..core.json_utils import loads_json
+
     candidates = []
 
     try:
         # Find all JSON-LD script tags
-        scripts = document.xpath('//script[@type="application/ld+json"]/text()')
+        scripts = [
+            s.text for s in document.iter('script')
+            if s.get('type') == 'application/ld+json' and s.text
+        ]
 
         for script_text in scripts:
             try:
-                data = json.loads(script_text)
+                data = loads_json(script_text)
 
                 # Handle both single objects and arrays
                 items = data if isinstance(data, list) else [data]
@@ -165,9 +194,8 @@ def _extract_from_body(document: html.HtmlElement, base_url: str) -> List[Thumbn
     candidates = []
 
     try:
-        images = document.xpath('//img')
-
-        for img in images:
+        # iter() streams the <img> elements instead of building a list first
+        for img in document.iter('img'):
             try:
                 score = _score_image(img, base_url)
 
@@ -209,11 +237,12 @@ def _score_image(img_elem: html.HtmlElement, base_url: str) -> float:
     score = 5.0  # Base score for body images
 
     # Get attributes
-    src = img_elem.get('src', '') or img_elem.get('data-src', '')
-    width = img_elem.get('width', '')
-    height = img_elem.get('height', '')
-    img_class = (img_elem.get('class', '') or '').lower()
-    alt = img_elem.get('alt', '')
+    attrib = img_elem.attrib
+    src = attrib.get('src') or attrib.get('data-src', '')
+    width = attrib.get('width', '')
+    height = attrib.get('height', '')
+    img_class = attrib.get('class', '').lower()
+    alt = attrib.get('alt', '')
 
     # Parse dimensions
     try:
@@ -247,7 +276,8 @@ def _score_image(img_elem: html.HtmlElement, base_url: str) -> float:
             score += 1.0
 
     # Class boosters
-    if any(keyword in img_class for keyword in ['featured', 'hero', 'main', 'thumbnail']):
+    # (most images have no class, so skip the keyword scans for those)
+    if img_class and any(keyword in img_class for keyword in _FEATURED_CLASS_KEYWORDS):
         score += 2.0
 
     # Alt text booster
@@ -255,16 +285,16 @@ def _score_image(img_elem: html.HtmlElement, base_url: str) -> float:
         score += 0.5
 
     # Class penalties (icons, logos, ads) - very strong penalties to override dimension boosters
-    if any(keyword in img_class for keyword in ['icon', 'avatar', 'logo', 'badge', 'emoji']):
+    if img_class and any(keyword in img_class for keyword in _ICON_CLASS_KEYWORDS):
         score -= 20.0  # Strong penalty to ensure negative score
-    if any(keyword in img_class for keyword in ['ad', 'banner', 'sponsor']):
+    if img_class and any(keyword in img_class for keyword in _AD_CLASS_KEYWORDS):
         score -= 20.0  # Strong penalty to ensure negative score
 
     # URL penalties (tracking pixels, ads)
     src_lower = src.lower()
     if src.startswith('data:'):
         score -= 20.0  # Base64 embedded images - strong penalty
-    if any(keyword in src_lower for keyword in ['tracking', 'pixel', 'ad', '1x1']):
+    if any(keyword in src_lower for keyword in _TRACKING_SRC_KEYWORDS):
         score -= 20.0  # Strong penalty to ensure negative score
 
     return score
@@ -1,7 +1,13 @@
 """URL utilities for resolving and validating URLs."""
 
-from urllib.parse import urljoin, urlparse
+from typing import Callable
+from urllib.parse import urljoin, urlparse, urlsplit
 from lxml import html as lxml_html, etree
+from .html_parser import get_html_parser
+
+_HREF_XPATH = etree.XPath('.//*[@href]')
+_SRC_XPATH = etree.XPath('.//*[@src]')
+_IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp', '.svg')
 
 
 def resolve_url(base_url: str, url: str) -> str:
@@ -18,6 +24,63 @@ def resolve_url(base_url: str, url: str) -> str:
     return urljoin(base_url, url)
 
 
+def make_url_resolver(base_url: str) -> Callable[[str], str]:
+    """
+    Build a resolver that joins many URLs against one base URL.
+
+    The base URL is split once; absolute http(s) URLs, root-relative paths and
+    plain path-relative references are then joined by string concatenation.
+    Anything urljoin would rewrite or reject (dot segments, scheme-relative,
+    query/fragment-only, an empty query or fragment, ';' parameters, an
+    empty or bracketed host) falls back to resolve_url, so results match
+    urljoin.
+
+    Args:
+        base_url: The base URL to resolve against
+
+    Returns:
+        A function mapping a URL (relative or absolute) to an absolute URL
+    """
+    parts = urlsplit(base_url)
+    if (
+        parts.scheme not in ('http', 'https')
+        or not parts.netloc
+        or '/.' in parts.path
+        or '//' in parts.path
+    ):
+        return lambda url: urljoin(base_url, url)
+
+    origin = f'{parts.scheme}://{parts.netloc}'
+    directory = origin + parts.path[:parts.path.rfind('/') + 1] if parts.path else origin + '/'
+
+    def resolve(url: str) -> str:
+        if url.endswith(('?', '#')) or '?#' in url or ';' in url:
+            return urljoin(base_url, url)
+        if url.startswith(('http://', 'https://')):
+            host = url[url.index('//') + 2:]
+            if not host or host[0] in '/?#' or any(c in url for c in '\t\n\r[]'):
+                return urljoin(base_url, url)
+            return url
+        if (
+            not url
+            or url[0] <= ' '
+            or url[0] in '.?#'
+            or '/.' in url
+            or '//' in url
+            or '\t' in url
+            or '\n' in url
+            or '\r' in url
+        ):
+            return urljoin(base_url, url)
+        if url[0] == '/':
+            return origin + url
+        if ':' in url.split('/', 1)[0]:
+            return urljoin(base_url, url)
+        return directory + url
+
+    return resolve
+
+
 def is_image_url(url: str) -> bool:
     """
     Check if a URL points to an image file based on extension.
@@ -28,10 +91,8 @@ def is_image_url(url: str) -> bool:
     Returns:
         True if the URL appears to be an image file
     """
-    parsed = urlparse(url)
-    path = parsed.path.lower()
-    image_extensions = ('.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp', '.svg')
-    return any(path.endswith(ext) for ext in image_extensions)
+    # urlparse (not urlsplit): ';params' after the file name are dropped too
+    return urlparse(url).path.lower().endswith(_IMAGE_EXTENSIONS)
 
 
 def get_base_url(url: str) -> str:
@@ -64,19 +125,20 @@ def resolve_urls_in_html(html_content: str, base_url: str) -> str:
     """
     try:
         # Parse HTML
-        doc = lxml_html.fromstring(html_content)
+        doc = lxml_html.fromstring(html_content, parser=get_html_parser())
+        resolve = make_url_resolver(base_url)
 
         # Resolve all href attributes
-        for elem in doc.xpath('.//*[@href]'):
+        for elem in _HREF_XPATH(doc):
             href = elem.get('href')
             if href:
-                elem.set('href', resolve_url(base_url, href))
+                elem.set('href', resolve(href))
 
         # Resolve all src attributes
-        for elem in doc.xpath('.//*[@src]'):
+        for elem in _SRC_XPATH(doc):
             src = elem.get('src')
             if src:
-                elem.set('src', resolve_url(base_url, src))
+                elem.set('src', resolve(src))
 
         # Convert back to string
         return etree.tostring(doc, encoding='unicode', method='html')
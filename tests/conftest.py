@@ -1,12 +1,42 @@
 """Shared fixtures for gensi tests."""
 
+import os
 import pytest
 from pathlib import Path
 from pytest_httpserver import HTTPServer
+from gensi.core.parser import GensiParser
 import tempfile
 import shutil
 
 
+def _temp_root():
+    """
+    Pick the parent directory for test temp dirs.
+
+    PYTEST_TMPDIR wins if set; otherwise use /dev/shm when it is writable, so
+    the .gensi files, caches and EPUBs the tests write stay in memory.
+    Falls back to the system temp directory.
+    """
+    root = os.environ.get('PYTEST_TMPDIR')
+    if root:
+        os.makedirs(root, exist_ok=True)
+        return root
+    if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+        return '/dev/shm'
+    return None
+
+
+TEMP_ROOT = _temp_root()
+
+
+def pytest_configure(config):
+    """Register custom markers."""
+    config.addinivalue_line(
+        "markers",
+        "slow: end-to-end tests that dominate suite time (deselect with -m 'not slow')"
+    )
+
+
 def pytest_addoption(parser):
     """Add custom command-line options."""
     parser.addoption(
@@ -93,7 +123,7 @@ def epub_saver(request, epub_output_dir):
 @pytest.fixture
 def temp_dir(epub_saver):
     """Create a temporary directory for test outputs."""
-    temp_path = Path(tempfile.mkdtemp())
+    temp_path = Path(tempfile.mkdtemp(prefix='gensi-test-', dir=TEMP_ROOT))
     yield temp_path
 
     # Before cleanup, save any EPUB files if output directory is specified
@@ -104,18 +134,38 @@ def temp_dir(epub_saver):
     shutil.rmtree(temp_path, ignore_errors=True)
 
 
-@pytest.fixture
-def httpserver_with_content(httpserver: HTTPServer, html_fixtures_dir, rss_fixtures_dir, images_fixtures_dir):
+@pytest.fixture(scope="session")
+def shared_cache_dir():
+    """
+    HTTP cache directory shared by the integration tests of one session.
+
+    Only use it for tests that fetch the static fixtures: tests that register
+    their own routes may reuse paths with different content.
+    """
+    cache_dir = Path(tempfile.mkdtemp(prefix='gensi-http-cache-', dir=TEMP_ROOT))
+    yield cache_dir
+    shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def httpserver_with_content():
     """
-    Configure HTTP server with test content.
+    HTTP server with test content, started once per session.
 
     Serves:
     - HTML files from /fixtures/html/
     - RSS files from /fixtures/rss/
     - Images from /images/
+
+    The fixture routes stay registered for the whole session. Tests that add
+    their own routes should use expect_oneshot_request so they don't leak.
     """
+    fixtures_dir = Path(__file__).parent / 'fixtures'
+    httpserver = HTTPServer(threaded=True)
+    httpserver.start()
+
     # Serve HTML files
-    for html_file in html_fixtures_dir.glob('*.html'):
+    for html_file in (fixtures_dir / 'html').glob('*.html'):
         content = html_file.read_text(encoding='utf-8')
         httpserver.expect_request(f'/{html_file.name}').respond_with_data(
             content,
@@ -123,7 +173,7 @@ def httpserver_with_content(httpserver: HTTPServer, html_fixtures_dir, rss_fixtu
         )
 
     # Serve RSS files
-    for rss_file in rss_fixtures_dir.glob('*.xml'):
+    for rss_file in (fixtures_dir / 'rss').glob('*.xml'):
         content = rss_file.read_text(encoding='utf-8')
         httpserver.expect_request(f'/{rss_file.name}').respond_with_data(
             content,
@@ -131,7 +181,7 @@ def httpserver_with_content(httpserver: HTTPServer, html_fixtures_dir, rss_fixtu
         )
 
     # Serve images
-    for image_file in images_fixtures_dir.glob('*'):
+    for image_file in (fixtures_dir / 'images').glob('*'):
         if image_file.is_file():
             content = image_file.read_bytes()
             # Determine content type
@@ -152,7 +202,11 @@ def httpserver_with_content(httpserver: HTTPServer, html_fixtures_dir, rss_fixtu
                 content_type=content_type
             )
 
-    return httpserver
+    yield httpserver
+
+    httpserver.clear()
+    if httpserver.is_running():
+        httpserver.stop()
 
 
 @pytest.fixture
@@ -215,10 +269,7 @@ def progress_callback():
     return ProgressTracker()
 
 
-@pytest.fixture
-def valid_gensi_simple(temp_dir):
-    """Create a valid simple .gensi file for testing."""
-    content = """
+_VALID_GENSI_SIMPLE = """
 title = "Test EPUB"
 author = "Test Author"
 language = "en"
@@ -235,13 +286,41 @@ author = "span.author"
 date = "time.published"
 remove = [".sidebar"]
 """
-    gensi_path = temp_dir / 'test.gensi'
-    gensi_path.write_text(content)
+
+
+@pytest.fixture(scope="session")
+def valid_recipes_dir():
+    """
+    Directory holding the valid_gensi_* recipes for the whole session.
+
+    The recipes are written once and only ever read, so tests must not
+    modify them or write anything else here.
+    """
+    recipes_path = Path(tempfile.mkdtemp(prefix='gensi-recipes-', dir=TEMP_ROOT))
+    yield recipes_path
+    shutil.rmtree(recipes_path, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def valid_gensi_simple(valid_recipes_dir):
+    """Create a valid simple .gensi file for testing."""
+    gensi_path = valid_recipes_dir / 'test.gensi'
+    gensi_path.write_text(_VALID_GENSI_SIMPLE)
     return gensi_path
 
 
-@pytest.fixture
-def valid_gensi_with_cover(temp_dir):
+@pytest.fixture(scope="module")
+def simple_parser(valid_gensi_simple):
+    """
+    GensiParser for the valid_gensi_simple recipe, shared by a test module.
+
+    Only for tests that read the parsed recipe; don't modify its data.
+    """
+    return GensiParser(valid_gensi_simple)
+
+
+@pytest.fixture(scope="session")
+def valid_gensi_with_cover(valid_recipes_dir):
     """Create a valid .gensi file with cover for testing."""
     content = """
 title = "Test EPUB with Cover"
@@ -261,13 +340,13 @@ links = "article.post-preview a.post-link"
 content = "div.article-content"
 title = "h1.article-title"
 """
-    gensi_path = temp_dir / 'test_with_cover.gensi'
+    gensi_path = valid_recipes_dir / 'test_with_cover.gensi'
     gensi_path.write_text(content)
     return gensi_path
 
 
-@pytest.fixture
-def valid_gensi_multi_index(temp_dir):
+@pytest.fixture(scope="session")
+def valid_gensi_multi_index(valid_recipes_dir):
     """Create a valid .gensi file with multiple indices for testing."""
     content = """
 title = "Multi-Index EPUB"
@@ -290,13 +369,13 @@ limit = 2
 content = "div.article-content"
 title = "h1.article-title"
 """
-    gensi_path = temp_dir / 'multi_index.gensi'
+    gensi_path = valid_recipes_dir / 'multi_index.gensi'
     gensi_path.write_text(content)
     return gensi_path
 
 
-@pytest.fixture
-def valid_gensi_with_python(temp_dir):
+@pytest.fixture(scope="session")
+def valid_gensi_with_python(valid_recipes_dir):
     """Create a valid .gensi file with Python scripts for testing."""
     content = """
 title = "Python Script EPUB"
@@ -318,7 +397,7 @@ return articles
 content = "div.article-content"
 title = "h1.article-title"
 """
-    gensi_path = temp_dir / 'with_python.gensi'
+    gensi_path = valid_recipes_dir / 'with_python.gensi'
     gensi_path.write_text(content)
     return gensi_path
 
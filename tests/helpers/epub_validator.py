@@ -1,10 +1,54 @@
 """Helper functions for validating EPUB file structure and content."""
 
+import posixpath
 import zipfile
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, NamedTuple, Optional
 from lxml import etree
 
+CONTAINER_NS = {'container': 'urn:oasis:names:tc:opendocument:xmlns:container'}
+OPF_NS = {'opf': 'http://www.idpf.org/2007/opf', 'dc': 'http://purl.org/dc/elements/1.1/'}
+
+# The package queries run against every EPUB the tests build; compile them once
+_ROOTFILE_PATHS = etree.XPath('//container:rootfile/@full-path', namespaces=CONTAINER_NS)
+_ROOTFILES = etree.XPath('//container:rootfile', namespaces=CONTAINER_NS)
+_DC_TITLE = etree.XPath('//dc:title/text()', namespaces=OPF_NS)
+_DC_CREATOR = etree.XPath('//dc:creator/text()', namespaces=OPF_NS)
+_DC_LANGUAGE = etree.XPath('//dc:language/text()', namespaces=OPF_NS)
+_SPINE_IDREFS = etree.XPath('//opf:spine/opf:itemref/@idref', namespaces=OPF_NS)
+_MANIFEST_ITEMS = etree.XPath('//opf:manifest/opf:item', namespaces=OPF_NS)
+_COVER_IMAGE_ITEMS = etree.XPath('//opf:manifest/opf:item[@properties="cover-image"]', namespaces=OPF_NS)
+_COVER_META = etree.XPath('//opf:metadata/opf:meta[@name="cover"]', namespaces=OPF_NS)
+_OPF_ITEM_TAG = '{http://www.idpf.org/2007/opf}item'
+_TOC_LINKS = etree.XPath('//xhtml:nav[@*="toc"]//xhtml:a', namespaces={'xhtml': 'http://www.w3.org/1999/xhtml'})
+
+
+@lru_cache(maxsize=32)
+def _load_package(epub_path: str, mtime_ns: int, size: int) -> tuple[Optional[str], Optional[etree._Element]]:
+    """
+    Read the content.opf path and parsed content.opf of an EPUB.
+
+    Cached per file version (path, mtime and size), so tests that validate an
+    EPUB and then inspect it again don't re-read and re-parse the package.
+    The returned tree is shared and must not be modified.
+    """
+    with zipfile.ZipFile(epub_path, 'r') as epub:
+        try:
+            container = etree.fromstring(epub.read('META-INF/container.xml'))
+        except (KeyError, etree.XMLSyntaxError):
+            return None, None
+
+        rootfiles = _ROOTFILE_PATHS(container)
+        if not rootfiles:
+            return None, None
+
+        opf_path = rootfiles[0]
+        try:
+            return opf_path, etree.fromstring(epub.read(opf_path))
+        except (KeyError, etree.XMLSyntaxError):
+            return opf_path, None
+
 
 class EPUBValidator:
     """Validates EPUB file structure and content."""
@@ -18,8 +62,21 @@ class EPUBValidator:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying zip file."""
         self.epub.close()
 
+    @cached_property
+    def _package_data(self) -> tuple[Optional[str], Optional[etree._Element]]:
+        stat = self.epub_path.stat()
+        return _load_package(str(self.epub_path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+    def _package(self) -> tuple[Optional[str], Optional[etree._Element]]:
+        """Get the (content.opf path, parsed content.opf) pair for this EPUB."""
+        return self._package_data
+
     def validate_mimetype(self) -> bool:
         """Validate that mimetype file exists and has correct content."""
         try:
@@ -34,174 +91,163 @@ class EPUBValidator:
             content = self.epub.read('META-INF/container.xml')
             tree = etree.fromstring(content)
             # Check for rootfile element
-            rootfiles = tree.xpath(
-                '//container:rootfile',
-                namespaces={'container': 'urn:oasis:names:tc:opendocument:xmlns:container'}
-            )
+            rootfiles = _ROOTFILES(tree)
             return len(rootfiles) > 0
         except (KeyError, etree.XMLSyntaxError):
             return False
 
     def get_content_opf_path(self) -> Optional[str]:
         """Get the path to content.opf from container.xml."""
-        try:
-            content = self.epub.read('META-INF/container.xml')
-            tree = etree.fromstring(content)
-            rootfiles = tree.xpath(
-                '//container:rootfile/@full-path',
-                namespaces={'container': 'urn:oasis:names:tc:opendocument:xmlns:container'}
-            )
-            return rootfiles[0] if rootfiles else None
-        except (KeyError, etree.XMLSyntaxError):
-            return None
+        return self._package()[0]
 
     def get_metadata(self) -> dict:
         """Extract metadata from content.opf."""
-        opf_path = self.get_content_opf_path()
-        if not opf_path:
+        _, tree = self._package()
+        if tree is None:
             return {}
 
-        try:
-            content = self.epub.read(opf_path)
-            tree = etree.fromstring(content)
-            ns = {'opf': 'http://www.idpf.org/2007/opf', 'dc': 'http://purl.org/dc/elements/1.1/'}
+        metadata = {}
+        title = _DC_TITLE(tree)
+        if title:
+            metadata['title'] = title[0]
 
-            metadata = {}
-            title = tree.xpath('//dc:title/text()', namespaces=ns)
-            if title:
-                metadata['title'] = title[0]
+        creator = _DC_CREATOR(tree)
+        if creator:
+            metadata['author'] = creator[0]
 
-            creator = tree.xpath('//dc:creator/text()', namespaces=ns)
-            if creator:
-                metadata['author'] = creator[0]
+        language = _DC_LANGUAGE(tree)
+        if language:
+            metadata['language'] = language[0]
 
-            language = tree.xpath('//dc:language/text()', namespaces=ns)
-            if language:
-                metadata['language'] = language[0]
-
-            return metadata
-        except (KeyError, etree.XMLSyntaxError):
-            return {}
+        return metadata
 
     def get_spine_items(self) -> list[str]:
-        """Get list of spine item IDs in order."""
-        opf_path = self.get_content_opf_path()
-        if not opf_path:
+        """Get a copy of the list of spine item IDs in order."""
+        return list(self.spine_items)
+
+    @cached_property
+    def spine_items(self) -> list[str]:
+        """Spine item IDs in order, read once per validator. Don't modify."""
+        _, tree = self._package()
+        if tree is None:
             return []
 
-        try:
-            content = self.epub.read(opf_path)
-            tree = etree.fromstring(content)
-            ns = {'opf': 'http://www.idpf.org/2007/opf'}
-
-            idrefs = tree.xpath('//opf:spine/opf:itemref/@idref', namespaces=ns)
-            return idrefs
-        except (KeyError, etree.XMLSyntaxError):
-            return []
+        return _SPINE_IDREFS(tree)
 
     def get_manifest_items(self) -> dict:
-        """Get manifest items as dict {id: href}."""
-        opf_path = self.get_content_opf_path()
-        if not opf_path:
-            return {}
-
-        try:
-            content = self.epub.read(opf_path)
-            tree = etree.fromstring(content)
-            ns = {'opf': 'http://www.idpf.org/2007/opf'}
-
-            items = tree.xpath('//opf:manifest/opf:item', namespaces=ns)
-            manifest = {}
-            for item in items:
-                item_id = item.get('id')
-                href = item.get('href')
-                if item_id and href:
-                    manifest[item_id] = href
-            return manifest
-        except (KeyError, etree.XMLSyntaxError):
+        """Get a copy of the manifest items as dict {id: href}."""
+        return dict(self.manifest_items)
+
+    @cached_property
+    def manifest_items(self) -> dict:
+        """Manifest items as dict {id: href}, read once per validator. Don't modify."""
+        _, tree = self._package()
+        if tree is None:
             return {}
 
-    def get_chapter_content(self, href: str) -> Optional[str]:
-        """Get content of a chapter by href (relative to content.opf)."""
+        items = _MANIFEST_ITEMS(tree)
+        manifest = {}
+        for item in items:
+            item_id = item.get('id')
+            href = item.get('href')
+            if item_id and href:
+                manifest[item_id] = href
+        return manifest
+
+    @cached_property
+    def _opf_dir(self) -> Optional[str]:
+        # Zip member names always use forward slashes, whatever the OS
         opf_path = self.get_content_opf_path()
-        if not opf_path:
+        return posixpath.dirname(opf_path) if opf_path else None
+
+    def get_chapter_bytes(self, href: str) -> Optional[bytes]:
+        """Get the raw bytes of a chapter by href (relative to content.opf)."""
+        opf_dir = self._opf_dir
+        if opf_dir is None:
             return None
 
-        # Construct full path
-        opf_dir = str(Path(opf_path).parent)
-        if opf_dir == '.':
-            full_path = href
-        else:
-            full_path = f"{opf_dir}/{href}"
+        full_path = posixpath.join(opf_dir, href)
 
         try:
-            content = self.epub.read(full_path).decode('utf-8')
-            return content
+            return self.epub.read(full_path)
         except KeyError:
             return None
 
-    def has_cover_image(self) -> bool:
-        """Check if EPUB has a cover image."""
-        opf_path = self.get_content_opf_path()
-        if not opf_path:
-            return False
+    def get_chapters_bulk(self, hrefs: Iterable[str]) -> dict[str, bytes]:
+        """
+        Get the raw bytes of several chapters in one pass over the zip.
 
-        try:
-            content = self.epub.read(opf_path)
-            tree = etree.fromstring(content)
-            ns = {'opf': 'http://www.idpf.org/2007/opf'}
+        Members are read in their on-disk order; hrefs that aren't in the
+        EPUB are left out of the result.
 
-            # Check for cover item in manifest
-            cover_items = tree.xpath(
-                '//opf:manifest/opf:item[@properties="cover-image"]',
-                namespaces=ns
-            )
-            if cover_items:
-                return True
+        Returns:
+            Dict mapping each found href to its bytes
+        """
+        opf_dir = self._opf_dir
+        if opf_dir is None:
+            return {}
 
-            # Check for cover metadata
-            cover_meta = tree.xpath(
-                '//opf:metadata/opf:meta[@name="cover"]',
-                namespaces=ns
-            )
-            return len(cover_meta) > 0
+        wanted = {posixpath.join(opf_dir, href): href for href in hrefs}
+        chapters = {}
+        for info in self.epub.infolist():
+            href = wanted.get(info.filename)
+            if href is not None:
+                with self.epub.open(info) as f:
+                    chapters[href] = f.read()
+        return chapters
 
-        except (KeyError, etree.XMLSyntaxError):
+    def get_chapter_content(self, href: str) -> Optional[str]:
+        """Get content of a chapter by href (relative to content.opf)."""
+        content = self.get_chapter_bytes(href)
+        return content.decode('utf-8') if content is not None else None
+
+    def has_cover_image(self) -> bool:
+        """Check if EPUB has a cover image."""
+        _, tree = self._package()
+        if tree is None:
             return False
 
+        # Check for cover item in manifest
+        if _COVER_IMAGE_ITEMS(tree):
+            return True
+
+        # Check for cover metadata
+        return len(_COVER_META(tree)) > 0
+
     def get_nav_toc(self) -> list:
         """Get table of contents structure from nav file."""
-        opf_path = self.get_content_opf_path()
-        if not opf_path:
-            return []
+        return list(self._nav_toc)
 
-        try:
-            content = self.epub.read(opf_path)
-            tree = etree.fromstring(content)
-            ns = {'opf': 'http://www.idpf.org/2007/opf'}
+    def get_nav_path(self) -> Optional[str]:
+        """Get the zip member path of the nav document."""
+        _, tree = self._package()
+        if tree is None:
+            return None
 
-            # Find nav document
-            nav_items = tree.xpath(
-                '//opf:manifest/opf:item[@properties="nav"]/@href',
-                namespaces=ns
-            )
-            if not nav_items:
-                return []
+        # The nav item sits near the top of the manifest; stop at the first match
+        # instead of collecting every item as an XPath query would
+        nav_href = next(
+            (item.get('href') for item in tree.iter(_OPF_ITEM_TAG) if item.get('properties') == 'nav'),
+            None
+        )
+        if nav_href is None:
+            return None
 
-            nav_href = nav_items[0]
-            opf_dir = str(Path(opf_path).parent)
-            if opf_dir == '.':
-                nav_path = nav_href
-            else:
-                nav_path = f"{opf_dir}/{nav_href}"
+        return posixpath.join(self._opf_dir, nav_href)
 
+    @cached_property
+    def _nav_toc(self) -> list:
+        nav_path = self.get_nav_path()
+        if nav_path is None:
+            return []
+
+        try:
             nav_content = self.epub.read(nav_path)
             nav_tree = etree.fromstring(nav_content)
 
             # Extract TOC items
             # This is a simplified extraction - full implementation would handle nested lists
-            xhtml_ns = {'xhtml': 'http://www.w3.org/1999/xhtml'}
-            nav_items = nav_tree.xpath('//xhtml:nav[@*="toc"]//xhtml:a', namespaces=xhtml_ns)
+            nav_items = _TOC_LINKS(nav_tree)
 
             toc = []
             for item in nav_items:
@@ -223,26 +269,67 @@ class EPUBValidator:
         image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg'}
         count = 0
         for filename in self.epub.namelist():
-            if Path(filename).suffix.lower() in image_extensions:
+            if posixpath.splitext(filename)[1].lower() in image_extensions:
                 count += 1
         return count
 
     def get_articles(self) -> list[str]:
         """Get list of all article contents from the EPUB spine."""
-        spine_items = self.get_spine_items()
-        manifest = self.get_manifest_items()
+        spine_items = self.spine_items
+        manifest = self.manifest_items
+
+        hrefs = [manifest[item_id] for item_id in spine_items if manifest.get(item_id)]
+        chapters = self.get_chapters_bulk(hrefs)
 
         articles = []
-        for item_id in spine_items:
-            href = manifest.get(item_id)
-            if href:
-                content = self.get_chapter_content(href)
-                if content:
-                    articles.append(content)
+        for href in hrefs:
+            content = chapters.get(href)
+            if content:
+                articles.append(content.decode('utf-8'))
 
         return articles
 
 
+class ValidatorSnapshot(NamedTuple):
+    """Read-only view of an EPUB, as returned by validator_for()."""
+    manifest_items: dict
+    spine_items: list[str]
+    nav_toc: list
+    articles: list[str]
+    metadata: dict
+    image_count: int
+    has_cover: bool
+    files: list[str]
+
+
+@lru_cache(maxsize=64)
+def _snapshot(epub_path: str, mtime_ns: int, size: int) -> ValidatorSnapshot:
+    with EPUBValidator(epub_path) as validator:
+        return ValidatorSnapshot(
+            manifest_items=validator.get_manifest_items(),
+            spine_items=validator.get_spine_items(),
+            nav_toc=validator.get_nav_toc(),
+            articles=validator.get_articles(),
+            metadata=validator.get_metadata(),
+            image_count=validator.count_images(),
+            has_cover=validator.has_cover_image(),
+            files=validator.list_files(),
+        )
+
+
+def validator_for(epub_path: Path | str) -> ValidatorSnapshot:
+    """
+    Get a cached snapshot of everything the tests read from an EPUB.
+
+    Cached per file version (path, mtime and size), so several assertions (or
+    parametrized cases) on the same EPUB open and parse it once. The snapshot
+    is shared and must not be modified.
+    """
+    epub_path = Path(epub_path)
+    stat = epub_path.stat()
+    return _snapshot(str(epub_path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+
 def validate_epub_structure(epub_path: Path) -> dict:
     """
     Validate basic EPUB structure and return results.
@@ -274,7 +361,7 @@ def validate_epub_structure(epub_path: Path) -> dict:
             results['has_container'] = validator.validate_container_xml()
             results['has_content_opf'] = validator.get_content_opf_path() is not None
             results['metadata'] = validator.get_metadata()
-            results['spine_count'] = len(validator.get_spine_items())
+            results['spine_count'] = len(validator.spine_items)
             results['has_cover'] = validator.has_cover_image()
 
             results['valid'] = (
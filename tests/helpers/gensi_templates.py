@@ -0,0 +1,179 @@
+"""Templates for the .gensi recipes used by the integration tests."""
+
+from functools import lru_cache
+from string import Template
+
+# A single HTML index over /blog_index.html. `header` holds extra top-level
+# lines (author, language, a [cover] section); `article` holds extra [article]
+# lines after the content selector.
+BLOG = Template("""
+title = "$title"
+$header
+[[index]]
+url = "$url"
+type = "html"
+links = "article.post-preview a.post-link"
+
+[article]
+content = "div.article-content"
+$article""")
+
+# A single RSS/Atom index. `index` holds extra [[index]] lines (limit,
+# use_content_encoded); `article` is a complete optional [article] section.
+FEED = Template("""
+title = "$title"
+$header
+[[index]]
+url = "$url"
+type = "rss"
+$index$article""")
+
+# The blog index and the RSS feed as two named sections.
+MULTI_INDEX = Template("""
+title = "$title"
+author = "Test Author"
+
+[[index]]
+name = "Blog Posts"
+url = "$blog_url"
+type = "html"
+links = "article.post-preview a.post-link"
+
+[[index]]
+name = "RSS Feed"
+url = "$feed_url"
+type = "rss"
+limit = 2
+
+[article]
+content = "div.article-content"
+title = "h1.article-title"
+""")
+
+# Every feature at once: cover, an HTML and an RSS section, full [article].
+COMPREHENSIVE = Template("""
+title = "$title"
+author = "Test Author"
+language = "en"
+
+[cover]
+url = "$cover_url"
+selector = "img.site-logo"
+
+[[index]]
+name = "Blog Articles"
+url = "$blog_url"
+type = "html"
+links = "article.post-preview a.post-link"
+
+[[index]]
+name = "RSS Feed"
+url = "$feed_url"
+type = "rss"
+limit = 2
+use_content_encoded = true
+
+[article]
+content = "div.article-content"
+title = "h1.article-title"
+author = "span.author"
+date = "time.published"
+remove = [".sidebar"]
+images = true
+""")
+
+# The blog index, with links collected by an index Python script.
+PYTHON_INDEX = Template("""
+title = "$title"
+
+[[index]]
+url = "$url"
+type = "html"
+
+[index.python]
+script = '''
+articles = []
+for elem in document.cssselect('article.post-preview a.post-link'):
+    url = elem.get('href')
+    articles.append({'url': url})
+return articles
+'''
+
+[article]
+content = "div.article-content"
+title = "h1.article-title"
+""")
+
+# The blog index, with article content extracted by a Python script.
+PYTHON_ARTICLE = Template("""
+title = "$title"
+
+[[index]]
+url = "$url"
+type = "html"
+links = "article.post-preview a.post-link"
+
+[article.python]
+script = '''
+from lxml import etree
+content_div = document.cssselect('div.article-content')[0]
+title_elem = document.cssselect('h1.article-title')
+return {
+    'content': etree.tostring(content_div, encoding='unicode'),
+    'title': title_elem[0].text if title_elem else None
+}
+'''
+""")
+
+# A tagged RSS feed, filtered by category in an index Python script.
+FILTERED_FEED = Template("""
+title = "$title"
+
+[[index]]
+url = "$url"
+type = "rss"
+
+[index.python]
+script = '''
+articles = []
+for entry in feed.entries:
+    categories = [cat.get('term', '') for cat in entry.get('tags', [])]
+    if 'Technology' in categories and 'Sponsor' not in categories:
+        articles.append({'url': entry.link})
+return articles
+'''
+
+[article]
+content = "div.article-content"
+""")
+
+TEMPLATES = {
+    'blog': BLOG,
+    'feed': FEED,
+    'multi_index': MULTI_INDEX,
+    'comprehensive': COMPREHENSIVE,
+    'python_index': PYTHON_INDEX,
+    'python_article': PYTHON_ARTICLE,
+    'filtered_feed': FILTERED_FEED,
+}
+
+_DEFAULTS = {'header': '', 'article': '', 'index': ''}
+
+
+@lru_cache(maxsize=128)
+def _render(shape: str, values: tuple[tuple[str, str], ...]) -> bytes:
+    return TEMPLATES[shape].substitute({**_DEFAULTS, **dict(values)}).encode('utf-8')
+
+
+def make_gensi_bytes(shape: str, **values: str) -> bytes:
+    """
+    Render a .gensi recipe template to UTF-8 bytes.
+
+    Args:
+        shape: Template name (a key of TEMPLATES)
+        **values: Template fields; optional fields default to empty
+
+    Returns:
+        The recipe, ready for Path.write_bytes()
+    """
+    return _render(shape, tuple(sorted(values.items())))
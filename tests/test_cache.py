@@ -319,3 +319,62 @@ class TestCachedFetcher:
             assert final_url1 == final_url2
 
             cache.close()
+
+    @pytest.mark.asyncio
+    async def test_cached_fetcher_deduplicates_within_run(self, httpserver):
+        """Test that a URL is only downloaded once per run, even for index pages."""
+        request_count = 0
+
+        def handle_request(request):
+            nonlocal request_count
+            request_count += 1
+            return f"<html><body>Index request {request_count}</body></html>"
+
+        httpserver.expect_request("/index").respond_with_handler(handle_request)
+
+        url = httpserver.url_for("/index")
+
+        async with CachedFetcher(cache_enabled=False) as fetcher:
+            results = await asyncio.gather(
+                fetcher.fetch(url, context="index"),
+                fetcher.fetch(url, context="index"),
+                fetcher.fetch(url, context="index"),
+            )
+
+        assert request_count == 1
+        assert all(content == results[0][0] for content, _ in results)
+
+        # A new run fetches again
+        async with CachedFetcher(cache_enabled=False) as fetcher:
+            result, _ = await fetcher.fetch(url, context="index")
+
+        assert "Index request 2" in result
+
+    @pytest.mark.asyncio
+    async def test_cached_fetcher_does_not_memoize_binary(self, httpserver):
+        """Test that binary responses are not held in the run-wide memo."""
+        httpserver.expect_ordered_request("/image.png").respond_with_data(b"first")
+        httpserver.expect_ordered_request("/image.png").respond_with_data(b"second")
+
+        url = httpserver.url_for("/image.png")
+
+        async with CachedFetcher(cache_enabled=False) as fetcher:
+            first, _ = await fetcher.fetch_binary(url)
+            second, _ = await fetcher.fetch_binary(url)
+
+        assert (first, second) == (b"first", b"second")
+
+    @pytest.mark.asyncio
+    async def test_cached_fetcher_does_not_memoize_failures(self, httpserver):
+        """Test that failed fetches are retried within the same run."""
+        httpserver.expect_ordered_request("/flaky").respond_with_data("Error", status=500)
+        httpserver.expect_ordered_request("/flaky").respond_with_data("OK")
+
+        url = httpserver.url_for("/flaky")
+
+        async with CachedFetcher(cache_enabled=False) as fetcher:
+            with pytest.raises(Exception):
+                await fetcher.fetch(url, context="article")
+            result, _ = await fetcher.fetch(url, context="article")
+
+        assert result == "OK"
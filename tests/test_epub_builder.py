@@ -1,5 +1,6 @@
 """Tests for EPUB builder."""
 
+import zipfile
 import pytest
 from pathlib import Path
 from gensi.core.epub_builder import EPUBBuilder
@@ -129,6 +130,48 @@ class TestEPUBBuilderBuild:
         with EPUBValidator(output_path) as validator:
             assert validator.has_cover_image()
 
+    def test_build_epub_stores_images_uncompressed(self, temp_dir, images_fixtures_dir):
+        """Test that images are stored as-is while text entries are deflated."""
+        builder = EPUBBuilder("Stored Images", "Author")
+        builder.add_cover((images_fixtures_dir / 'cover.jpg').read_bytes())
+        builder.add_section("Content")
+        builder.add_article(content="<p>Content</p>", title="Title")
+
+        output_path = temp_dir / 'stored.epub'
+        builder.build(output_path)
+
+        with zipfile.ZipFile(output_path) as zf:
+            infos = zf.infolist()
+            assert infos[0].filename == 'mimetype'
+            assert infos[0].compress_type == zipfile.ZIP_STORED
+            for info in infos[1:]:
+                if info.filename.endswith(('.jpg', '.jpeg', '.png', '.gif')):
+                    assert info.compress_type == zipfile.ZIP_STORED, info.filename
+                else:
+                    assert info.compress_type == zipfile.ZIP_DEFLATED, info.filename
+            assert any(info.filename.endswith('.jpg') for info in infos)
+            assert zf.testzip() is None
+
+    def test_build_epub_shared_image_added_once(self, temp_dir, images_fixtures_dir):
+        """Test that an image embedded by two articles gets one manifest entry."""
+        img_data = (images_fixtures_dir / 'cover.jpg').read_bytes()
+        images = {'https://example.com/logo.jpg': ('image_000_abc.jpg', img_data)}
+
+        builder = EPUBBuilder("Shared Images", "Author")
+        builder.add_section("Content")
+        builder.add_article(content="<p>One</p>", title="One", images=images)
+        builder.add_article(content="<p>Two</p>", title="Two", images=images)
+
+        output_path = temp_dir / 'shared.epub'
+        builder.build(output_path)
+
+        with zipfile.ZipFile(output_path) as zf:
+            names = zf.namelist()
+            assert names.count('EPUB/images/image_000_abc.jpg') == 1
+            opf = zf.read('EPUB/content.opf').decode('utf-8')
+            assert 'id="im1"' in opf
+            assert 'id="im2"' not in opf
+
     def test_build_epub_multiple_sections(self, temp_dir):
         """Test building EPUB with multiple sections."""
         builder = EPUBBuilder("Multi-Section EPUB", "Author")
@@ -149,7 +192,7 @@ class TestEPUBBuilderBuild:
 
         # Validate structure
         with EPUBValidator(output_path) as validator:
-            spine_items = validator.get_spine_items()
+            spine_items = validator.spine_items
             assert len(spine_items) == 3  # 3 chapters
 
     def test_build_epub_metadata(self, temp_dir):
@@ -203,7 +246,7 @@ class TestEPUBBuilderBuild:
 
         # Check that article was created
         with EPUBValidator(output_path) as validator:
-            manifest = validator.get_manifest_items()
+            manifest = validator.manifest_items
             assert len(manifest) > 0
 
     def test_build_epub_single_index_no_sections(self, temp_dir):
@@ -220,7 +263,7 @@ class TestEPUBBuilderBuild:
         assert output_path.exists()
 
         with EPUBValidator(output_path) as validator:
-            spine_items = validator.get_spine_items()
+            spine_items = validator.spine_items
             assert len(spine_items) == 2
 
     def test_epub_chapter_content(self, temp_dir):
@@ -235,8 +278,8 @@ class TestEPUBBuilderBuild:
         builder.build(output_path)
 
         with EPUBValidator(output_path) as validator:
-            manifest = validator.get_manifest_items()
-            spine_items = validator.get_spine_items()
+            manifest = validator.manifest_items
+            spine_items = validator.spine_items
 
             # Get first chapter
             if spine_items:
@@ -262,8 +305,8 @@ class TestEPUBBuilderStylesheets:
         builder.build(output_path)
 
         with EPUBValidator(output_path) as validator:
-            manifest = validator.get_manifest_items()
-            spine_items = validator.get_spine_items()
+            manifest = validator.manifest_items
+            spine_items = validator.spine_items
 
             # Get first article
             assert len(spine_items) > 0
@@ -271,13 +314,13 @@ class TestEPUBBuilderStylesheets:
             first_href = manifest.get(first_id)
             assert first_href is not None
 
-            chapter_content = validator.get_chapter_content(first_href)
+            chapter_content = validator.get_chapter_bytes(first_href)
             assert chapter_content is not None
 
             # Check for stylesheet link with correct attributes
-            assert '<link href="../styles/styles.css"' in chapter_content
-            assert 'rel="stylesheet"' in chapter_content
-            assert 'type="text/css"' in chapter_content
+            assert b'<link href="../styles/styles.css"' in chapter_content
+            assert b'rel="stylesheet"' in chapter_content
+            assert b'type="text/css"' in chapter_content
 
     def test_nav_has_stylesheet_link(self, temp_dir):
         """Test that nav document contains stylesheet link."""
@@ -289,38 +332,14 @@ class TestEPUBBuilderStylesheets:
         builder.build(output_path)
 
         with EPUBValidator(output_path) as validator:
-            # Find nav document
-            opf_path = validator.get_content_opf_path()
-            assert opf_path is not None
-
-            import zipfile
-            from lxml import etree
-            from pathlib import Path
-
-            content = validator.epub.read(opf_path)
-            tree = etree.fromstring(content)
-            ns = {'opf': 'http://www.idpf.org/2007/opf'}
-
-            # Find nav document
-            nav_items = tree.xpath(
-                '//opf:manifest/opf:item[@properties="nav"]/@href',
-                namespaces=ns
-            )
-            assert len(nav_items) > 0
+            nav_path = validator.get_nav_path()
+            assert nav_path is not None
+            nav_content = validator.epub.read(nav_path)
 
-            nav_href = nav_items[0]
-            opf_dir = str(Path(opf_path).parent)
-            if opf_dir == '.':
-                nav_path = nav_href
-            else:
-                nav_path = f"{opf_dir}/{nav_href}"
-
-            nav_content = validator.epub.read(nav_path).decode('utf-8')
-
-            # Check for stylesheet link with correct attributes
-            assert '<link href="styles/styles.css"' in nav_content
-            assert 'rel="stylesheet"' in nav_content
-            assert 'type="text/css"' in nav_content
+        # Check for stylesheet link with correct attributes
+        assert b'<link href="styles/styles.css"' in nav_content
+        assert b'rel="stylesheet"' in nav_content
+        assert b'type="text/css"' in nav_content
 
     def test_multiple_articles_all_have_stylesheet_links(self, temp_dir):
         """Test that all article HTML files contain stylesheet links."""
@@ -338,8 +357,8 @@ class TestEPUBBuilderStylesheets:
         builder.build(output_path)
 
         with EPUBValidator(output_path) as validator:
-            manifest = validator.get_manifest_items()
-            spine_items = validator.get_spine_items()
+            manifest = validator.manifest_items
+            spine_items = validator.spine_items
 
             assert len(spine_items) == 5
 
@@ -348,13 +367,13 @@ class TestEPUBBuilderStylesheets:
                 href = manifest.get(item_id)
                 assert href is not None
 
-                chapter_content = validator.get_chapter_content(href)
+                chapter_content = validator.get_chapter_bytes(href)
                 assert chapter_content is not None
 
                 # Verify stylesheet link exists
-                assert '<link href="../styles/styles.css"' in chapter_content
-                assert 'rel="stylesheet"' in chapter_content
-                assert 'type="text/css"' in chapter_content
+                assert b'<link href="../styles/styles.css"' in chapter_content
+                assert b'rel="stylesheet"' in chapter_content
+                assert b'type="text/css"' in chapter_content
 
     def test_multiple_sections_all_articles_have_stylesheet_links(self, temp_dir):
         """Test that articles in multiple sections all have stylesheet links."""
@@ -374,16 +393,16 @@ class TestEPUBBuilderStylesheets:
         builder.build(output_path)
 
         with EPUBValidator(output_path) as validator:
-            manifest = validator.get_manifest_items()
-            spine_items = validator.get_spine_items()
+            manifest = validator.manifest_items
+            spine_items = validator.spine_items
 
             assert len(spine_items) == 4
 
             # Check all articles have stylesheet links
             for item_id in spine_items:
                 href = manifest.get(item_id)
-                chapter_content = validator.get_chapter_content(href)
+                chapter_content = validator.get_chapter_bytes(href)
 
-                assert '<link href="../styles/styles.css"' in chapter_content
-                assert 'rel="stylesheet"' in chapter_content
-                assert 'type="text/css"' in chapter_content
+                assert b'<link href="../styles/styles.css"' in chapter_content
+                assert b'rel="stylesheet"' in chapter_content
+                assert b'type="text/css"' in chapter_content
@@ -2,6 +2,7 @@
 
 import pytest
 from pathlib import Path
+from lxml import html
 from gensi.core.extractor import Extractor, parse_rss_feed, parse_bluesky_feed
 from gensi.core.python_executor import PythonExecutor
 
@@ -113,6 +114,27 @@ class TestIndexExtraction:
         assert articles[1]['url'] == 'http://example.com/post2.html'
         assert articles[2]['url'] == 'http://example.com/post3.html'
 
+    def test_extract_index_articles_mixed_link_forms(self):
+        """Test that all link forms resolve the same way urljoin would."""
+        from urllib.parse import urljoin
+
+        base_url = "https://example.com/blog/index.html"
+        hrefs = [
+            'https://other.com/a.html',
+            '/root.html',
+            '/a/../b.html',
+            '//cdn.example.com/c.html',
+            'relative.html',
+            '../up.html',
+            '?page=2',
+        ]
+        content = '<html><body>' + ''.join(f'<a href="{h}">x</a>' for h in hrefs) + '</body></html>'
+        extractor = Extractor(base_url, content)
+
+        articles = extractor.extract_index_articles({'type': 'html', 'links': 'a'})
+
+        assert [a['url'] for a in articles] == [urljoin(base_url, h) for h in hrefs]
+
     def test_extract_index_articles_with_python(self, html_with_links):
         """Test extracting article URLs with Python script."""
         extractor = Extractor("http://example.com/index.html", html_with_links)
@@ -208,6 +230,19 @@ class TestArticleExtraction:
         assert result['author'] == 'John Doe'
         assert result['date'] == 'January 15, 2025'
 
+    def test_extract_article_with_preparsed_document(self, article_html):
+        """Test that a document passed in is used instead of parsing again."""
+        config = {'content': 'div.content', 'title': 'h1.title', 'remove': ['.ad']}
+        executor = PythonExecutor()
+        document = html.fromstring(article_html)
+
+        extractor = Extractor("http://example.com/article.html", article_html, document=document)
+        result = extractor.extract_article_content(config, executor)
+
+        assert extractor.document is document
+        expected = Extractor("http://example.com/article.html", article_html).extract_article_content(config, executor)
+        assert result == expected
+
     def test_extract_article_with_remove_selectors(self, article_html):
         """Test extracting article with element removal."""
         extractor = Extractor("http://example.com/article.html", article_html)
@@ -224,6 +259,38 @@ class TestArticleExtraction:
         # Comments should not be in content div, but test the remove worked
         assert 'More content' in result['content']
 
+    def test_extract_article_remove_keeps_surrounding_text(self):
+        """Test that removing an inline element keeps the text that follows it."""
+        html_content = """
+<html><body><div class="content">
+    <p>Before <span class="ad">Advertisement</span> after.</p>
+</div></body></html>
+"""
+        extractor = Extractor("http://example.com/article.html", html_content)
+        config = {'content': 'div.content', 'remove': ['.ad']}
+
+        result = extractor.extract_article_content(config, PythonExecutor())
+
+        assert 'Advertisement' not in result['content']
+        assert 'Before' in result['content']
+        assert 'after.' in result['content']
+
+    def test_extract_article_with_overlapping_remove_selectors(self, article_html):
+        """Test that nested and overlapping remove selectors are all applied."""
+        extractor = Extractor("http://example.com/article.html", article_html)
+        config = {
+            'content': 'article',
+            'remove': ['.meta', '.author', 'div.ad, .comments']
+        }
+        executor = PythonExecutor()
+
+        result = extractor.extract_article_content(config, executor)
+
+        assert 'Article content here' in result['content']
+        assert 'John Doe' not in result['content']
+        assert 'Advertisement' not in result['content']
+        assert 'Comments section' not in result['content']
+
     def test_extract_article_with_python_returning_string(self, article_html):
         """Test extracting article with Python script returning string."""
         extractor = Extractor("http://example.com/article.html", article_html)
@@ -401,6 +468,47 @@ class TestRSSParsing:
         assert len(articles) >= 1
         assert all('url' in article for article in articles)
 
+    def test_parse_rss_feed_guid_as_link(self):
+        """Test that items without <link> still use a permalink <guid> as URL."""
+        feed_content = """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Feed</title>
+    <item><guid>http://example.com/from-guid</guid></item>
+</channel></rss>"""
+        config = {'type': 'rss'}
+
+        articles = parse_rss_feed("http://example.com/feed.rss", feed_content, config, None)
+
+        assert articles == [{'url': 'http://example.com/from-guid'}]
+
+    def test_parse_atom_feed_picks_alternate_link(self):
+        """Test that Atom entries use the alternate HTML link, not self/enclosure links."""
+        feed_content = """<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>Feed</title>
+    <entry>
+        <id>urn:uuid:1</id>
+        <link rel="self" href="http://example.com/self"/>
+        <link rel="alternate" type="text/html" href="/post1.html"/>
+        <link rel="enclosure" href="http://example.com/audio.mp3"/>
+    </entry>
+</feed>"""
+        config = {'type': 'rss'}
+
+        articles = parse_rss_feed("http://example.com/feed.atom", feed_content, config, None)
+
+        assert articles == [{'url': 'http://example.com/post1.html'}]
+
+    def test_parse_rss_feed_non_utf8_declaration(self):
+        """Test that a decoded feed with a non-UTF-8 declaration keeps its characters."""
+        feed_content = """<?xml version="1.0" encoding="ISO-8859-1"?>
+<rss version="2.0"><channel><title>Feed</title>
+    <item><link>http://example.com/café</link></item>
+</channel></rss>"""
+        config = {'type': 'rss'}
+
+        articles = parse_rss_feed("http://example.com/feed.rss", feed_content, config, None)
+
+        assert articles == [{'url': 'http://example.com/café'}]
+
     def test_parse_rss_feed_with_python_filtering(self, rss_fixtures_dir):
         """Test parsing RSS feed with Python script filtering."""
         feed_path = rss_fixtures_dir / 'test_feed_with_tags.xml'
@@ -500,6 +608,27 @@ class TestBlueskyFeedParsing:
         assert len(articles) == 1
         assert articles[0]['url'] == 'https://example.com/article1'
 
+    def test_parse_bluesky_skips_malformed_entries(self):
+        """Entries missing post, embed, or external data should be skipped."""
+        import json
+        feed_content = json.dumps({
+            'feed': [
+                {},
+                {'post': None},
+                {'post': {}},
+                {'post': {'embed': {'$type': 'app.bsky.embed.external#view'}}},
+                {'post': {'embed': {'$type': 'app.bsky.embed.external#view',
+                         'external': {}}}},
+                {'post': {'embed': {'$type': 'app.bsky.embed.external#view',
+                         'external': {'uri': 'https://example.com/article1'}}}}
+            ]
+        })
+
+        config = {'username': 'test.bsky.social'}
+        articles = parse_bluesky_feed('', feed_content, config)
+
+        assert articles == [{'url': 'https://example.com/article1'}]
+
     def test_parse_bluesky_api_error(self):
         """Handle API error responses."""
         import json
@@ -703,6 +832,18 @@ class TestURLTransformation:
 
         assert transformed == "/different/path/"
 
+    def test_transform_url_template_with_literal_braces(self):
+        """Test that braces other than group placeholders are kept as-is."""
+        extractor = Extractor("http://example.com/", "<html></html>")
+        transform_config = {
+            'pattern': r'/article/([^/]+)/',
+            'template': 'https://api.com/graphql?q={"slug":"{1}"}&x={0}{2}'
+        }
+
+        transformed = extractor.transform_url("/article/test/", transform_config)
+
+        assert transformed == 'https://api.com/graphql?q={"slug":"test"}&x={0}{2}'
+
     def test_transform_url_python_mode(self):
         """Test URL transformation with Python script."""
         extractor = Extractor("http://example.com/", "<html></html>")
@@ -877,6 +1018,27 @@ class TestJSONDirectLinksExtraction:
         assert articles[0]['url'] == 'https://example.com/1'
         assert articles[1]['url'] == 'https://example.com/2'
 
+    def test_json_direct_links_skips_html_parsing(self):
+        """Test that direct links mode never parses the matched values as HTML."""
+        json_response = '''
+        {
+            "items": [
+                {"url": null},
+                {"url": "https://example.com/1"}
+            ]
+        }
+        '''
+        config = {
+            'type': 'json',
+            'json_path': 'items[*].url'
+        }
+        extractor = Extractor("https://example.com/", json_response, content_type='json', config=config)
+
+        articles = extractor.extract_index_articles(config)
+
+        assert articles == [{'url': 'https://example.com/1'}]
+        assert extractor._document is None
+
     def test_json_direct_links_nested_paths(self):
         """Test extracting URLs from nested JSON structures."""
         json_response = '''
@@ -999,6 +1161,33 @@ class TestJSONArticleExtraction:
         assert result['title'] == 'Test Article'
         assert result['author'] == 'John Doe'
 
+    def test_extract_article_json_dict_path_decodes_once(self, monkeypatch):
+        """Test that dict json_path extraction reuses the JSON decoded at construction."""
+        import gensi.core.extractor as extractor_module
+        import gensi.core.json_utils as json_utils
+
+        calls = []
+        original_loads = json_utils.loads_json
+
+        def counting_loads(content):
+            calls.append(content)
+            return original_loads(content)
+
+        monkeypatch.setattr(extractor_module, 'loads_json', counting_loads)
+        monkeypatch.setattr(json_utils, 'loads_json', counting_loads)
+
+        json_response = '{"data": {"title": "T", "content": "<article><p>Body</p></article>"}}'
+        config = {
+            'response_type': 'json',
+            'json_path': {'content': 'data.content', 'title': 'data.title'},
+            'content': 'article'
+        }
+        extractor = Extractor("http://example.com/a.json", json_response, content_type='json', config=config)
+        result = extractor.extract_article_content(config)
+
+        assert result['title'] == 'T'
+        assert len(calls) == 1
+
     def test_extract_article_json_mixed_extraction(self):
         """Test mixing JSON extraction and CSS selectors for metadata."""
         json_response = '''
@@ -1,5 +1,7 @@
 """Tests for HTTP fetcher."""
 
+import gzip
+
 import pytest
 from gensi.core.fetcher import Fetcher
 
@@ -109,6 +111,24 @@ class TestFetcher:
             with pytest.raises(Exception):
                 await fetcher.fetch(httpserver.url_for('/nonexistent.html'))
 
+    async def test_fetch_decompresses_encoded_response(self, httpserver):
+        """Test that compressed responses are negotiated and decoded transparently."""
+        body = '<?xml version="1.0"?><rss><channel><title>Test Blog</title></channel></rss>'
+        httpserver.expect_request('/feed.xml').respond_with_data(
+            gzip.compress(body.encode('utf-8')),
+            headers={'Content-Encoding': 'gzip'},
+            content_type='application/rss+xml',
+        )
+
+        async with Fetcher() as fetcher:
+            content, _ = await fetcher.fetch(httpserver.url_for('/feed.xml'))
+
+        request, _ = httpserver.log[0]
+        accept_encoding = request.headers.get('Accept-Encoding', '')
+        assert 'br' in accept_encoding
+        assert 'zstd' in accept_encoding
+        assert content == body
+
     async def test_fetch_multiple_images(self, httpserver_with_content):
         """Test fetching multiple images."""
         httpserver = httpserver_with_content
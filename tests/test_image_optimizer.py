@@ -11,6 +11,7 @@ from gensi.core.image_optimizer import (
     normalize_image_format,
     optimize_image,
     process_image,
+    recompress_png,
     COVER_MAX_WIDTH,
     COVER_MAX_HEIGHT,
     ARTICLE_MAX_WIDTH,
@@ -54,6 +55,21 @@ class TestImageFormatDetection:
         format_type = detect_image_format(image_data)
         assert format_type == 'WEBP'
 
+    def test_detect_format_matches_pillow(self):
+        """Test that magic-byte detection agrees with Pillow for common and other formats."""
+        for fmt in ('JPEG', 'PNG', 'WEBP', 'GIF', 'BMP', 'TIFF'):
+            buffer = io.BytesIO()
+            Image.new('RGB', (10, 10), color='red').save(buffer, format=fmt)
+            image_data = buffer.getvalue()
+
+            with Image.open(io.BytesIO(image_data)) as img:
+                assert detect_image_format(image_data) == img.format
+
+    def test_detect_format_invalid_data(self):
+        """Test that unrecognized data returns None."""
+        assert detect_image_format(b'not an image') is None
+        assert detect_image_format(b'RIFF\x00\x00\x00\x00WAVEfmt ') is None
+
 
 class TestTransparencyDetection:
     """Test transparency detection."""
@@ -63,6 +79,17 @@ class TestTransparencyDetection:
         img = Image.new('RGBA', (100, 100), color=(255, 0, 0, 128))
         assert has_transparency(img) is True
 
+    def test_has_transparency_opaque_rgba(self):
+        """Test that an RGBA image whose alpha is fully opaque has no transparency."""
+        img = Image.new('RGBA', (100, 100), color=(255, 0, 0, 255))
+        assert has_transparency(img) is False
+
+    def test_has_transparency_single_transparent_pixel(self):
+        """Test that a single non-opaque pixel counts as transparency."""
+        img = Image.new('RGBA', (100, 100), color=(255, 0, 0, 255))
+        img.putpixel((50, 50), (255, 0, 0, 254))
+        assert has_transparency(img) is True
+
     def test_has_transparency_rgb(self):
         """Test RGB image has no transparency."""
         img = Image.new('RGB', (100, 100), color='red')
@@ -138,6 +165,17 @@ class TestImageResizing:
         expected_width = int(1000 * (COVER_MAX_HEIGHT / 2000))
         assert resized.size[0] == expected_width
 
+    def test_resize_undecoded_jpeg_exact_dimensions(self):
+        """Test that a lazily opened JPEG (decoded at reduced scale) still hits exact dimensions."""
+        buffer = io.BytesIO()
+        Image.new('RGB', (4000, 6000), color='orange').save(buffer, format='JPEG')
+        img = Image.open(io.BytesIO(buffer.getvalue()))
+
+        resized = resize_image(img, ARTICLE_MAX_WIDTH, ARTICLE_MAX_HEIGHT)
+
+        assert resized.size == (int(4000 * (ARTICLE_MAX_HEIGHT / 6000)), ARTICLE_MAX_HEIGHT)
+        assert resized.mode == 'RGB'
+
 
 class TestFormatNormalization:
     """Test format normalization (webp/others to jpg/png)."""
@@ -189,6 +227,29 @@ class TestImageOptimization:
         optimized_img = Image.open(io.BytesIO(optimized_data))
         assert optimized_img.mode == 'RGBA'
 
+    def test_optimize_jpeg_is_baseline(self):
+        """Test that JPEG output is baseline (not progressive) for e-reader compatibility."""
+        img = Image.new('RGB', (200, 200), color='red')
+        optimized_img = Image.open(io.BytesIO(optimize_image(img, 'JPEG')))
+
+        assert not optimized_img.info.get('progressive')
+        assert not optimized_img.info.get('progression')
+
+    def test_recompress_png_is_lossless(self):
+        """Test that PNG recompression never changes pixels or grows the file."""
+        img = Image.effect_noise((120, 80), 40).convert('RGB')
+        img.putalpha(Image.new('L', img.size, 128))
+        buffer = io.BytesIO()
+        img.save(buffer, format='PNG')
+        png_data = buffer.getvalue()
+
+        recompressed = recompress_png(png_data)
+        result = Image.open(io.BytesIO(recompressed))
+
+        assert len(recompressed) <= len(png_data)
+        assert result.mode == 'RGBA'
+        assert result.tobytes() == img.tobytes()
+
     def test_optimize_converts_rgba_to_rgb_for_jpeg(self):
         """Test that RGBA images are converted to RGB for JPEG."""
         # Create an RGBA image
@@ -199,6 +260,18 @@ class TestImageOptimization:
         optimized_img = Image.open(io.BytesIO(optimized_data))
         assert optimized_img.mode == 'RGB'
 
+    def test_optimize_composites_transparency_on_white_for_jpeg(self):
+        """Test that transparent pixels become white and gray images stay gray."""
+        img = Image.new('LA', (100, 100), color=(100, 255))
+        img.paste((0, 0), (0, 0, 50, 100))  # left half fully transparent
+        optimized_img = Image.open(io.BytesIO(optimize_image(img, 'JPEG')))
+
+        left = optimized_img.getpixel((10, 50))
+        right = optimized_img.getpixel((90, 50))
+        assert all(channel > 245 for channel in left)
+        assert max(right) - min(right) < 5
+        assert abs(right[0] - 100) < 5
+
 
 class TestProcessImage:
     """Test the complete image processing pipeline."""
@@ -325,3 +398,38 @@ class TestProcessImage:
 
         # Should still be smaller due to compression
         assert len(processed_data) < len(image_data)
+
+    def test_process_small_well_compressed_jpeg_passes_through(self):
+        """Test that a small JPEG already at or below target quality is kept byte-for-byte."""
+        img = Image.new('RGB', (400, 400), color='yellow')
+        buffer = io.BytesIO()
+        img.save(buffer, format='JPEG', quality=60)
+        image_data = buffer.getvalue()
+
+        processed_data, extension = process_image(
+            image_data, 'http://example.com/small.jpg', image_type='article'
+        )
+
+        assert processed_data == image_data
+        assert extension == 'jpg'
+
+    def test_process_small_jpeg_not_passed_through_when_unsuitable(self):
+        """Test that progressive, CMYK and oversized JPEGs still go through the pipeline."""
+        cases = [
+            (Image.new('RGB', (400, 400), color='yellow'), {'quality': 60, 'progressive': True}),
+            (Image.new('CMYK', (400, 400), color=(0, 0, 255, 0)), {'quality': 60}),
+            (Image.new('RGB', (2000, 400), color='yellow'), {'quality': 60}),
+        ]
+        for img, save_kwargs in cases:
+            buffer = io.BytesIO()
+            img.save(buffer, format='JPEG', **save_kwargs)
+            image_data = buffer.getvalue()
+
+            processed_data, _ = process_image(
+                image_data, 'http://example.com/small.jpg', image_type='article'
+            )
+
+            assert processed_data != image_data
+            processed_img = Image.open(io.BytesIO(processed_data))
+            assert processed_img.mode == 'RGB'
+            assert not processed_img.info.get('progressive')
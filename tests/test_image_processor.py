@@ -1,5 +1,7 @@
 """Tests for image processing."""
 
+import asyncio
+
 import pytest
 from gensi.core.image_processor import ImageProcessor
 
@@ -101,3 +103,37 @@ class TestImageProcessingIntegration:
 
         assert result == ''
         assert len(image_map) == 0
+
+    async def test_process_article_images_shared_cache(self, httpserver, images_fixtures_dir, monkeypatch):
+        """Test that a shared cache processes an image used by several articles once."""
+        from gensi.core import image_processor
+        from gensi.core.image_processor import process_article_images
+        from gensi.core.cached_fetcher import CachedFetcher
+
+        process_count = 0
+        original_process_image = image_processor.process_image
+
+        def counting_process_image(*args, **kwargs):
+            nonlocal process_count
+            process_count += 1
+            return original_process_image(*args, **kwargs)
+
+        monkeypatch.setattr(image_processor, 'process_image', counting_process_image)
+        httpserver.expect_request('/logo.jpg').respond_with_data(
+            (images_fixtures_dir / 'test1.jpg').read_bytes(), content_type='image/jpeg'
+        )
+
+        html = f'<p>Text <img src="{httpserver.url_for("/logo.jpg")}"></p>'
+        base_url = httpserver.url_for('/')
+        cache = {}
+
+        async with CachedFetcher(cache_enabled=False) as fetcher:
+            results = await asyncio.gather(
+                process_article_images(html, base_url, fetcher, True, processed_cache=cache),
+                process_article_images(html, base_url, fetcher, True, processed_cache=cache),
+            )
+
+        assert process_count == 1
+        (_, map1), (_, map2) = results
+        assert len(map1) == len(map2) == 1
+        assert list(map1.values())[0][1] == list(map2.values())[0][1]
@@ -1,42 +1,53 @@
 """Integration tests for end-to-end .gensi processing."""
 
+import asyncio
+import re
+import time
 import pytest
 from pathlib import Path
+from lxml import etree
+from werkzeug import Response
 from gensi.core.processor import GensiProcessor, process_gensi_file
 from gensi.core.parser import GensiParser
-from tests.helpers.epub_validator import EPUBValidator, validate_epub_structure
+from gensi.core.cache import HttpCache
+from tests.helpers.epub_validator import EPUBValidator, validate_epub_structure, validator_for
+from tests.helpers.gensi_templates import make_gensi_bytes
+
+# Patterns are compiled once at import and reused by every test (and by every
+# chapter checked in a loop), so no test body compiles its own.
+_SIDEBAR_RE = re.compile(rb"sidebar", re.I)
+_ARTICLE_CONTENT = '\n[article]\ncontent = "div.article-content"\n'
+
+
+def _assert_stylesheet_link(content: bytes, href: str) -> None:
+    """Assert that an XHTML document links the stylesheet at href."""
+    links = [link.attrib for link in etree.fromstring(content).iter('{*}link')]
+    link = next((attrib for attrib in links if attrib.get('href') == href), None)
+    assert link is not None, f"no <link> to {href} in {links}"
+    assert link.get('rel') == 'stylesheet'
+    assert link.get('type') == 'text/css'
 
 
 @pytest.mark.asyncio
 class TestSimpleIntegration:
     """Test simple single-index EPUB generation."""
 
-    async def test_process_simple_gensi(self, temp_dir, httpserver_with_content):
+    async def test_process_simple_gensi(self, temp_dir, shared_cache_dir, httpserver_with_content):
         """Test processing a simple .gensi file end-to-end."""
         httpserver = httpserver_with_content
 
         # Create .gensi file
-        gensi_content = f"""
-title = "Integration Test EPUB"
-author = "Test Author"
-language = "en"
-
-[[index]]
-url = "{httpserver.url_for('/blog_index.html')}"
-type = "html"
-links = "article.post-preview a.post-link"
-
-[article]
-content = "div.article-content"
-title = "h1.article-title"
-author = "span.author"
-date = "time.published"
-"""
         gensi_path = temp_dir / 'test.gensi'
-        gensi_path.write_text(gensi_content)
+        gensi_path.write_bytes(make_gensi_bytes(
+            'blog',
+            title="Integration Test EPUB",
+            header='author = "Test Author"\nlanguage = "en"\n',
+            url=httpserver.url_for('/blog_index.html'),
+            article='title = "h1.article-title"\nauthor = "span.author"\ndate = "time.published"\n',
+        ))
 
         # Process it
-        output_path = await process_gensi_file(gensi_path, temp_dir, cache_enabled=False)
+        output_path = await process_gensi_file(gensi_path, temp_dir, cache_dir=shared_cache_dir)
 
         # Verify EPUB was created
         assert output_path.exists()
@@ -49,31 +60,26 @@ date = "time.published"
         assert results['metadata']['author'] == "Test Author"
         assert results['spine_count'] == 3  # 3 articles in blog_index.html
 
-    async def test_process_with_cover(self, temp_dir, httpserver_with_content):
+    async def test_process_with_cover(self, temp_dir, shared_cache_dir, httpserver_with_content):
         """Test processing .gensi file with cover image."""
         httpserver = httpserver_with_content
 
-        gensi_content = f"""
-title = "EPUB with Cover"
-author = "Test Author"
-
-[cover]
-url = "{httpserver.url_for('/cover_page.html')}"
-selector = "img.site-logo"
-
-[[index]]
-url = "{httpserver.url_for('/blog_index.html')}"
-type = "html"
-links = "article.post-preview a.post-link"
-
-[article]
-content = "div.article-content"
-title = "h1.article-title"
-"""
+        cover_url = httpserver.url_for('/cover_page.html')
         gensi_path = temp_dir / 'with_cover.gensi'
-        gensi_path.write_text(gensi_content)
-
-        output_path = await process_gensi_file(gensi_path, temp_dir, cache_enabled=False)
+        gensi_path.write_bytes(make_gensi_bytes(
+            'blog',
+            title="EPUB with Cover",
+            header=(
+                'author = "Test Author"\n\n'
+                '[cover]\n'
+                f'url = "{cover_url}"\n'
+                'selector = "img.site-logo"\n'
+            ),
+            url=httpserver.url_for('/blog_index.html'),
+            article='title = "h1.article-title"\n',
+        ))
+
+        output_path = await process_gensi_file(gensi_path, temp_dir, cache_dir=shared_cache_dir)
 
         assert output_path.exists()
 
@@ -81,54 +87,118 @@ title = "h1.article-title"
         with EPUBValidator(output_path) as validator:
             assert validator.has_cover_image()
 
-    async def test_process_with_remove_selectors(self, temp_dir, httpserver_with_content):
-        """Test processing with element removal."""
+    async def test_process_with_cache_dir(self, temp_dir, httpserver_with_content):
+        """Test that article responses are stored in the given cache directory."""
         httpserver = httpserver_with_content
 
-        gensi_content = f"""
-title = "Test Remove"
-author = "Author"
+        gensi_path = temp_dir / 'cache_dir.gensi'
+        gensi_path.write_bytes(make_gensi_bytes(
+            'blog', title="Cache Dir Test", url=httpserver.url_for('/blog_index.html')
+        ))
+        cache_dir = temp_dir / 'http_cache'
 
-[[index]]
-url = "{httpserver.url_for('/blog_index.html')}"
-type = "html"
-links = "article.post-preview a.post-link"
+        output_path = await process_gensi_file(gensi_path, temp_dir, cache_dir=cache_dir)
+
+        assert output_path.exists()
+        with HttpCache(cache_dir) as cache:
+            # Articles are cached, the index page is not
+            assert cache.get(httpserver.url_for('/article1.html'), 'text') is not None
+            assert cache.get(httpserver.url_for('/blog_index.html'), 'text') is None
+
+    async def test_process_with_remove_selectors(self, temp_dir, shared_cache_dir, httpserver_with_content):
+        """Test processing with element removal."""
+        httpserver = httpserver_with_content
 
-[article]
-content = "div.article-content"
-remove = [".sidebar"]
-"""
         gensi_path = temp_dir / 'remove.gensi'
-        gensi_path.write_text(gensi_content)
+        gensi_path.write_bytes(make_gensi_bytes(
+            'blog',
+            title="Test Remove",
+            header='author = "Author"\n',
+            url=httpserver.url_for('/blog_index.html'),
+            article='remove = [".sidebar"]\n',
+        ))
 
-        output_path = await process_gensi_file(gensi_path, temp_dir, cache_enabled=False)
+        output_path = await process_gensi_file(gensi_path, temp_dir, cache_dir=shared_cache_dir)
 
         assert output_path.exists()
 
         # Verify content doesn't contain sidebar
         with EPUBValidator(output_path) as validator:
-            manifest = validator.get_manifest_items()
-            spine_items = validator.get_spine_items()
-            if spine_items:
-                first_href = manifest.get(spine_items[0])
-                if first_href:
-                    content = validator.get_chapter_content(first_href)
-                    assert content is not None
-                    # Sidebar should have been removed
-                    assert 'sidebar' not in content.lower() or 'sidebar' in content.lower()
+            manifest = validator.manifest_items
+            spine_items = validator.spine_items
+            assert spine_items
+            content = validator.get_chapter_bytes(manifest[spine_items[0]])
+            assert content is not None
+            # Sidebar should have been removed
+            assert _SIDEBAR_RE.search(content) is None
 
 
 @pytest.mark.asyncio
 class TestMultiIndexIntegration:
     """Test multi-index EPUB generation."""
 
-    async def test_process_multi_index(self, temp_dir, httpserver_with_content):
+    @pytest.mark.slow
+    async def test_process_multi_index(self, temp_dir, shared_cache_dir, httpserver_with_content):
         """Test processing .gensi file with multiple indices."""
         httpserver = httpserver_with_content
 
+        gensi_path = temp_dir / 'multi_index.gensi'
+        gensi_path.write_bytes(make_gensi_bytes(
+            'multi_index',
+            title="Multi-Index EPUB",
+            blog_url=httpserver.url_for('/blog_index.html'),
+            feed_url=httpserver.url_for('/test_feed_rss.xml'),
+        ))
+
+        output_path = await process_gensi_file(gensi_path, temp_dir, cache_dir=shared_cache_dir)
+
+        assert output_path.exists()
+
+        # Verify structure
+        snapshot = validator_for(output_path)
+        # 3 from blog + 2 from RSS (limited)
+        assert len(snapshot.spine_items) == 5
+
+        # Check TOC has sections
+        assert len(snapshot.nav_toc) > 0
+
+    async def test_index_fetches_respect_max_parallel(self, temp_dir, shared_cache_dir, httpserver_with_content):
+        """Test that index fetches share the max_parallel limit."""
+        httpserver = httpserver_with_content
+
+        class CountingProcessor(GensiProcessor):
+            in_flight = 0
+            peak = 0
+
+            async def _process_index(self, fetcher, index_config):
+                CountingProcessor.in_flight += 1
+                CountingProcessor.peak = max(CountingProcessor.peak, CountingProcessor.in_flight)
+                try:
+                    await asyncio.sleep(0.05)
+                    return await super()._process_index(fetcher, index_config)
+                finally:
+                    CountingProcessor.in_flight -= 1
+
+        gensi_path = temp_dir / 'bounded_indices.gensi'
+        gensi_path.write_bytes(make_gensi_bytes(
+            'multi_index',
+            title="Bounded Indices",
+            blog_url=httpserver.url_for('/blog_index.html'),
+            feed_url=httpserver.url_for('/test_feed_rss.xml'),
+        ))
+
+        processor = CountingProcessor(gensi_path, temp_dir, max_parallel=1, cache_dir=shared_cache_dir)
+        output_path = await processor.process()
+
+        assert output_path.exists()
+        assert CountingProcessor.peak == 1
+
+    async def test_process_multi_index_failing_index(self, temp_dir, httpserver_with_content):
+        """Test that a failing index aborts the run while other sections are in flight."""
+        httpserver = httpserver_with_content
+
         gensi_content = f"""
-title = "Multi-Index EPUB"
-author = "Test Author"
+title = "Failing Index EPUB"
 
 [[index]]
 name = "Blog Posts"
@@ -137,34 +207,23 @@ type = "html"
 links = "article.post-preview a.post-link"
 
 [[index]]
-name = "RSS Feed"
-url = "{httpserver.url_for('/test_feed_rss.xml')}"
-type = "rss"
-limit = 2
+name = "Missing"
+url = "{httpserver.url_for('/missing_index.html')}"
+type = "html"
+links = "a"
 
 [article]
 content = "div.article-content"
-title = "h1.article-title"
 """
-        gensi_path = temp_dir / 'multi_index.gensi'
+        gensi_path = temp_dir / 'failing_index.gensi'
         gensi_path.write_text(gensi_content)
 
-        output_path = await process_gensi_file(gensi_path, temp_dir, cache_enabled=False)
-
-        assert output_path.exists()
-
-        # Verify structure
-        with EPUBValidator(output_path) as validator:
-            spine_items = validator.get_spine_items()
-            # 3 from blog + 2 from RSS (limited)
-            assert len(spine_items) == 5
+        with pytest.raises(Exception):
+            await process_gensi_file(gensi_path, temp_dir, cache_enabled=False)
 
-            # Check TOC has sections
-            toc = validator.get_nav_toc()
-            # TOC should have entries
-            assert len(toc) > 0
+        assert not (temp_dir / 'failing-index-epub.epub').exists()
 
-    async def test_process_with_article_override(self, temp_dir, httpserver_with_content):
+    async def test_process_with_article_override(self, temp_dir, shared_cache_dir, httpserver_with_content):
         """Test processing with per-index article config override."""
         httpserver = httpserver_with_content
 
@@ -195,13 +254,13 @@ author = "span.author"
         gensi_path = temp_dir / 'override.gensi'
         gensi_path.write_text(gensi_content)
 
-        output_path = await process_gensi_file(gensi_path, temp_dir, cache_enabled=False)
+        output_path = await process_gensi_file(gensi_path, temp_dir, cache_dir=shared_cache_dir)
 
         assert output_path.exists()
 
         # Both sections should have articles
         with EPUBValidator(output_path) as validator:
-            spine_items = validator.get_spine_items()
+            spine_items = validator.spine_items
             # 3 from each section
             assert len(spine_items) == 6
 
@@ -210,84 +269,56 @@ author = "span.author"
 class TestRSSIntegration:
     """Test RSS/Atom feed processing."""
 
-    async def test_process_rss_feed(self, temp_dir, httpserver_with_content):
-        """Test processing RSS feed."""
+    @pytest.mark.parametrize(("title", "feed", "index", "article", "min_spine", "max_spine"), [
+        # Every item from the RSS test feed
+        ("RSS EPUB", "/test_feed_rss.xml", "", _ARTICLE_CONTENT, 2, None),
+        # Only the first item when limited
+        ("RSS Limited", "/test_feed_rss.xml", "limit = 1\n", _ARTICLE_CONTENT, 1, 1),
+        # Atom entries without an article section
+        ("Atom EPUB", "/test_feed_atom.xml", "", "", 1, None),
+    ], ids=["rss", "rss_limit", "atom"])
+    async def test_process_feed(
+        self, temp_dir, shared_cache_dir, httpserver_with_content,
+        title, feed, index, article, min_spine, max_spine
+    ):
+        """Test processing RSS and Atom feeds."""
         httpserver = httpserver_with_content
 
-        gensi_content = f"""
-title = "RSS EPUB"
-author = "RSS Author"
-
-[[index]]
-url = "{httpserver.url_for('/test_feed_rss.xml')}"
-type = "rss"
-
-[article]
-content = "div.article-content"
-"""
-        gensi_path = temp_dir / 'rss.gensi'
-        gensi_path.write_text(gensi_content)
+        gensi_path = temp_dir / 'feed.gensi'
+        gensi_path.write_bytes(make_gensi_bytes(
+            'feed', title=title, url=httpserver.url_for(feed), index=index, article=article
+        ))
 
-        output_path = await process_gensi_file(gensi_path, temp_dir, cache_enabled=False)
-
-        assert output_path.exists()
-
-        # Verify articles from RSS
-        with EPUBValidator(output_path) as validator:
-            spine_items = validator.get_spine_items()
-            assert len(spine_items) >= 2  # At least 2 items from test feed
-
-    async def test_process_rss_with_limit(self, temp_dir, httpserver_with_content):
-        """Test processing RSS feed with limit."""
-        httpserver = httpserver_with_content
-
-        gensi_content = f"""
-title = "RSS Limited"
-
-[[index]]
-url = "{httpserver.url_for('/test_feed_rss.xml')}"
-type = "rss"
-limit = 1
-
-[article]
-content = "div.article-content"
-"""
-        gensi_path = temp_dir / 'rss_limit.gensi'
-        gensi_path.write_text(gensi_content)
-
-        output_path = await process_gensi_file(gensi_path, temp_dir, cache_enabled=False)
+        output_path = await process_gensi_file(gensi_path, temp_dir, cache_dir=shared_cache_dir)
 
         assert output_path.exists()
 
-        # Should only have 1 article
         with EPUBValidator(output_path) as validator:
-            spine_items = validator.get_spine_items()
-            assert len(spine_items) == 1
+            spine_count = len(validator.spine_items)
+            assert spine_count >= min_spine
+            if max_spine is not None:
+                assert spine_count <= max_spine
 
-    async def test_process_rss_with_content_encoded(self, temp_dir, httpserver_with_content):
+    async def test_process_rss_with_content_encoded(self, temp_dir, shared_cache_dir, httpserver_with_content):
         """Test processing RSS with use_content_encoded."""
         httpserver = httpserver_with_content
 
-        gensi_content = f"""
-title = "RSS with Content"
-
-[[index]]
-url = "{httpserver.url_for('/test_feed_rss.xml')}"
-type = "rss"
-use_content_encoded = true
-limit = 2
-"""
         gensi_path = temp_dir / 'rss_content.gensi'
-        gensi_path.write_text(gensi_content)
+        gensi_path.write_bytes(make_gensi_bytes(
+            'feed',
+            title="RSS with Content",
+            url=httpserver.url_for('/test_feed_rss.xml'),
+            index='use_content_encoded = true\nlimit = 2\n',
+        ))
 
-        output_path = await process_gensi_file(gensi_path, temp_dir, cache_enabled=False)
+        output_path = await process_gensi_file(gensi_path, temp_dir, cache_dir=shared_cache_dir)
 
         assert output_path.exists()
 
         # Content should be from content:encoded
         with EPUBValidator(output_path) as validator:
-            manifest = validator.get_manifest_items()
-            spine_items = validator.get_spine_items()
+            manifest = validator.manifest_items
+            spine_items = validator.spine_items
             if spine_items:
                 first_href = manifest.get(spine_items[0])
                 if first_href:
@@ -296,132 +327,99 @@ limit = 2
                     # Should contain content from RSS
                     assert len(content) > 0
 
-    async def test_process_atom_feed(self, temp_dir, httpserver_with_content):
-        """Test processing Atom feed."""
-        httpserver = httpserver_with_content
+    async def test_content_encoded_scripts_are_sanitized(self, temp_dir, httpserver):
+        """Test that scripts in content:encoded never reach the EPUB.
+
+        The feed fast path returns content:encoded as-is (feedparser would
+        sanitize it), so the processor's sanitizer is what removes them.
+        """
+        feed = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">
+<channel>
+    <title>Script Feed</title>
+    <link>https://example.com/</link>
+    <item>
+        <title>Scripted</title>
+        <link>https://example.com/scripted</link>
+        <content:encoded><![CDATA[<p>Feed body</p><script>alert("injected")</script>]]></content:encoded>
+    </item>
+</channel>
+</rss>
+"""
+        httpserver.expect_request('/script_feed.xml').respond_with_data(
+            feed, content_type='application/rss+xml'
+        )
 
-        gensi_content = f"""
-title = "Atom EPUB"
-
-[[index]]
-url = "{httpserver.url_for('/test_feed_atom.xml')}"
-type = "rss"
-"""
-        gensi_path = temp_dir / 'atom.gensi'
-        gensi_path.write_text(gensi_content)
+        gensi_path = temp_dir / 'script_feed.gensi'
+        gensi_path.write_bytes(make_gensi_bytes(
+            'feed',
+            title="Script Feed",
+            url=httpserver.url_for('/script_feed.xml'),
+            index='use_content_encoded = true\n',
+        ))
 
         output_path = await process_gensi_file(gensi_path, temp_dir, cache_enabled=False)
 
-        assert output_path.exists()
-
         with EPUBValidator(output_path) as validator:
-            spine_items = validator.get_spine_items()
-            assert len(spine_items) >= 1
+            hrefs = [validator.manifest_items[item_id] for item_id in validator.spine_items]
+            chapters = validator.get_chapters_bulk(hrefs)
+
+        assert any(b'Feed body' in chapter for chapter in chapters.values())
+        for chapter in chapters.values():
+            assert b'<script' not in chapter
+            assert b'injected' not in chapter
 
 
 @pytest.mark.asyncio
 class TestPythonScriptIntegration:
     """Test Python script processing."""
 
-    async def test_process_with_index_python(self, temp_dir, httpserver_with_content):
+    async def test_process_with_index_python(self, temp_dir, shared_cache_dir, httpserver_with_content):
         """Test processing with Python script for index."""
         httpserver = httpserver_with_content
 
-        gensi_content = f"""
-title = "Python Index EPUB"
-
-[[index]]
-url = "{httpserver.url_for('/blog_index.html')}"
-type = "html"
-
-[index.python]
-script = '''
-articles = []
-for elem in document.cssselect('article.post-preview a.post-link'):
-    url = elem.get('href')
-    articles.append({{'url': url}})
-return articles
-'''
-
-[article]
-content = "div.article-content"
-title = "h1.article-title"
-"""
         gensi_path = temp_dir / 'python_index.gensi'
-        gensi_path.write_text(gensi_content)
+        gensi_path.write_bytes(make_gensi_bytes(
+            'python_index', title="Python Index EPUB", url=httpserver.url_for('/blog_index.html')
+        ))
 
-        output_path = await process_gensi_file(gensi_path, temp_dir, cache_enabled=False)
+        output_path = await process_gensi_file(gensi_path, temp_dir, cache_dir=shared_cache_dir)
 
         assert output_path.exists()
 
         with EPUBValidator(output_path) as validator:
-            spine_items = validator.get_spine_items()
+            spine_items = validator.spine_items
             assert len(spine_items) == 3
 
-    async def test_process_with_article_python(self, temp_dir, httpserver_with_content):
+    async def test_process_with_article_python(self, temp_dir, shared_cache_dir, httpserver_with_content):
         """Test processing with Python script for article extraction."""
         httpserver = httpserver_with_content
 
-        gensi_content = f"""
-title = "Python Article EPUB"
-
-[[index]]
-url = "{httpserver.url_for('/blog_index.html')}"
-type = "html"
-links = "article.post-preview a.post-link"
-
-[article.python]
-script = '''
-from lxml import etree
-content_div = document.cssselect('div.article-content')[0]
-title_elem = document.cssselect('h1.article-title')
-return {{
-    'content': etree.tostring(content_div, encoding='unicode'),
-    'title': title_elem[0].text if title_elem else None
-}}
-'''
-"""
         gensi_path = temp_dir / 'python_article.gensi'
-        gensi_path.write_text(gensi_content)
+        gensi_path.write_bytes(make_gensi_bytes(
+            'python_article', title="Python Article EPUB", url=httpserver.url_for('/blog_index.html')
+        ))
 
-        output_path = await process_gensi_file(gensi_path, temp_dir, cache_enabled=False)
+        output_path = await process_gensi_file(gensi_path, temp_dir, cache_dir=shared_cache_dir)
 
         assert output_path.exists()
 
-    async def test_process_rss_with_python_filtering(self, temp_dir, httpserver_with_content):
+    async def test_process_rss_with_python_filtering(self, temp_dir, shared_cache_dir, httpserver_with_content):
         """Test processing RSS with Python filtering."""
         httpserver = httpserver_with_content
 
-        gensi_content = f"""
-title = "Filtered RSS"
-
-[[index]]
-url = "{httpserver.url_for('/test_feed_with_tags.xml')}"
-type = "rss"
-
-[index.python]
-script = '''
-articles = []
-for entry in feed.entries:
-    categories = [cat.get('term', '') for cat in entry.get('tags', [])]
-    if 'Technology' in categories and 'Sponsor' not in categories:
-        articles.append({{'url': entry.link}})
-return articles
-'''
-
-[article]
-content = "div.article-content"
-"""
         gensi_path = temp_dir / 'filtered_rss.gensi'
-        gensi_path.write_text(gensi_content)
+        gensi_path.write_bytes(make_gensi_bytes(
+            'filtered_feed', title="Filtered RSS", url=httpserver.url_for('/test_feed_with_tags.xml')
+        ))
 
-        output_path = await process_gensi_file(gensi_path, temp_dir, cache_enabled=False)
+        output_path = await process_gensi_file(gensi_path, temp_dir, cache_dir=shared_cache_dir)
 
         assert output_path.exists()
 
         # Should only have filtered articles
         with EPUBValidator(output_path) as validator:
-            spine_items = validator.get_spine_items()
+            spine_items = validator.spine_items
             # Should have 2 items (articles 1 and 4 from test feed)
             assert len(spine_items) == 2
 
@@ -430,90 +428,88 @@ content = "div.article-content"
 class TestImageIntegration:
     """Test image processing integration."""
 
-    async def test_process_with_images_enabled(self, temp_dir, httpserver_with_content):
-        """Test processing with images enabled (default)."""
+    @pytest.mark.parametrize(("images", "max_images"), [
+        # Images may or may not be present depending on test content
+        ("true", None),
+        # Cover might exist, but article images should be 0
+        ("false", 1),
+    ], ids=["enabled", "disabled"])
+    async def test_process_with_images(self, temp_dir, shared_cache_dir, httpserver_with_content, images, max_images):
+        """Test processing with article images enabled and disabled."""
         httpserver = httpserver_with_content
 
-        gensi_content = f"""
-title = "EPUB with Images"
+        gensi_path = temp_dir / 'images.gensi'
+        gensi_path.write_bytes(make_gensi_bytes(
+            'blog',
+            title=f"EPUB Images {images}",
+            url=httpserver.url_for('/blog_index.html'),
+            article=f'images = {images}\n',
+        ))
 
-[[index]]
-url = "{httpserver.url_for('/blog_index.html')}"
-type = "html"
-links = "article.post-preview a.post-link"
-
-[article]
-content = "div.article-content"
-images = true
-"""
-        gensi_path = temp_dir / 'with_images.gensi'
-        gensi_path.write_text(gensi_content)
-
-        output_path = await process_gensi_file(gensi_path, temp_dir, cache_enabled=False)
+        output_path = await process_gensi_file(gensi_path, temp_dir, cache_dir=shared_cache_dir)
 
         assert output_path.exists()
 
-        # Images should be in EPUB (if any articles had images)
         with EPUBValidator(output_path) as validator:
-            # Count image files
             image_count = validator.count_images()
-            # May or may not have images depending on test content
             assert image_count >= 0
+            if max_images is not None:
+                assert image_count <= max_images
 
-    async def test_process_with_images_disabled(self, temp_dir, httpserver_with_content):
-        """Test processing with images disabled."""
-        httpserver = httpserver_with_content
 
-        gensi_content = f"""
-title = "EPUB without Images"
+    async def test_failed_run_cancels_image_downloads(self, temp_dir, httpserver):
+        """Test that a failing article cancels image downloads still in flight."""
+        def slow_image(request):
+            time.sleep(0.5)
+            return Response(b'not reached', content_type='image/png')
 
-[[index]]
-url = "{httpserver.url_for('/blog_index.html')}"
-type = "html"
-links = "article.post-preview a.post-link"
+        def slow_not_found(request):
+            # Fail only once the good article's image download has started
+            time.sleep(0.2)
+            return Response('Not Found', status=404)
 
-[article]
-content = "div.article-content"
-images = false
-"""
-        gensi_path = temp_dir / 'no_images.gensi'
-        gensi_path.write_text(gensi_content)
+        httpserver.expect_request('/slow.png').respond_with_handler(slow_image)
+        httpserver.expect_request('/good.html').respond_with_data(
+            f'<div class="article-content"><img src="{httpserver.url_for("/slow.png")}"></div>',
+            content_type='text/html'
+        )
+        httpserver.expect_request('/bad.html').respond_with_handler(slow_not_found)
+        httpserver.expect_request('/index.html').respond_with_data(
+            f'<a class="link" href="{httpserver.url_for("/good.html")}">Good</a>'
+            f'<a class="link" href="{httpserver.url_for("/bad.html")}">Bad</a>',
+            content_type='text/html'
+        )
 
-        output_path = await process_gensi_file(gensi_path, temp_dir, cache_enabled=False)
+        gensi_path = temp_dir / 'failing_images.gensi'
+        gensi_path.write_text(
+            f'title = "Failing Images"\n\n[[index]]\nurl = "{httpserver.url_for("/index.html")}"\n'
+            f'type = "html"\nlinks = "a.link"\n{_ARTICLE_CONTENT}'
+        )
 
-        assert output_path.exists()
+        processor = GensiProcessor(gensi_path, temp_dir, cache_enabled=False)
+        with pytest.raises(Exception, match="Failed to fetch"):
+            await processor.process()
 
-        # Should have no images
-        with EPUBValidator(output_path) as validator:
-            image_count = validator.count_images()
-            # Cover might exist, but article images should be 0
-            assert image_count == 0 or image_count == 1  # Cover only
+        # Nothing from the run is left running or holding image data
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+        assert processor._image_cache == {}
 
 
 @pytest.mark.asyncio
 class TestProcessorProgress:
     """Test processor progress reporting."""
 
-    async def test_process_with_progress_callback(self, temp_dir, httpserver_with_content, progress_callback):
+    async def test_process_with_progress_callback(self, temp_dir, shared_cache_dir, httpserver_with_content, progress_callback):
         """Test processing with progress callback."""
         httpserver = httpserver_with_content
 
-        gensi_content = f"""
-title = "Progress Test"
-
-[[index]]
-url = "{httpserver.url_for('/blog_index.html')}"
-type = "html"
-links = "article.post-preview a.post-link"
-
-[article]
-content = "div.article-content"
-"""
         gensi_path = temp_dir / 'progress.gensi'
-        gensi_path.write_text(gensi_content)
+        gensi_path.write_bytes(make_gensi_bytes(
+            'blog', title="Progress Test", url=httpserver.url_for('/blog_index.html')
+        ))
 
         # Process with callback
-        processor = GensiProcessor(gensi_path, temp_dir, progress_callback, cache_enabled=False)
+        processor = GensiProcessor(gensi_path, temp_dir, progress_callback, cache_dir=shared_cache_dir)
         output_path = await processor.process()
 
         assert output_path.exists()
@@ -527,26 +523,17 @@ content = "div.article-content"
         assert 'article' in stages or 'index' in stages
         assert 'done' in stages
 
-    async def test_parallel_article_processing(self, temp_dir, httpserver_with_content):
+    async def test_parallel_article_processing(self, temp_dir, shared_cache_dir, httpserver_with_content):
         """Test parallel article processing."""
         httpserver = httpserver_with_content
 
-        gensi_content = f"""
-title = "Parallel Test"
-
-[[index]]
-url = "{httpserver.url_for('/blog_index.html')}"
-type = "html"
-links = "article.post-preview a.post-link"
-
-[article]
-content = "div.article-content"
-"""
         gensi_path = temp_dir / 'parallel.gensi'
-        gensi_path.write_text(gensi_content)
+        gensi_path.write_bytes(make_gensi_bytes(
+            'blog', title="Parallel Test", url=httpserver.url_for('/blog_index.html')
+        ))
 
         # Process with different parallel limits
-        processor = GensiProcessor(gensi_path, temp_dir, max_parallel=2, cache_enabled=False)
+        processor = GensiProcessor(gensi_path, temp_dir, max_parallel=2, cache_dir=shared_cache_dir)
         output_path = await processor.process()
 
         assert output_path.exists()
@@ -556,44 +543,21 @@ content = "div.article-content"
 class TestCompleteFeatures:
     """Test complete feature combinations."""
 
-    async def test_comprehensive_gensi(self, temp_dir, httpserver_with_content):
+    @pytest.mark.slow
+    async def test_comprehensive_gensi(self, temp_dir, shared_cache_dir, httpserver_with_content):
         """Test comprehensive .gensi file with most features."""
         httpserver = httpserver_with_content
 
-        gensi_content = f"""
-title = "Comprehensive EPUB"
-author = "Test Author"
-language = "en"
-
-[cover]
-url = "{httpserver.url_for('/cover_page.html')}"
-selector = "img.site-logo"
-
-[[index]]
-name = "Blog Articles"
-url = "{httpserver.url_for('/blog_index.html')}"
-type = "html"
-links = "article.post-preview a.post-link"
-
-[[index]]
-name = "RSS Feed"
-url = "{httpserver.url_for('/test_feed_rss.xml')}"
-type = "rss"
-limit = 2
-use_content_encoded = true
-
-[article]
-content = "div.article-content"
-title = "h1.article-title"
-author = "span.author"
-date = "time.published"
-remove = [".sidebar"]
-images = true
-"""
         gensi_path = temp_dir / 'comprehensive.gensi'
-        gensi_path.write_text(gensi_content)
+        gensi_path.write_bytes(make_gensi_bytes(
+            'comprehensive',
+            title="Comprehensive EPUB",
+            cover_url=httpserver.url_for('/cover_page.html'),
+            blog_url=httpserver.url_for('/blog_index.html'),
+            feed_url=httpserver.url_for('/test_feed_rss.xml'),
+        ))
 
-        output_path = await process_gensi_file(gensi_path, temp_dir, cache_enabled=False)
+        output_path = await process_gensi_file(gensi_path, temp_dir, cache_dir=shared_cache_dir)
 
         assert output_path.exists()
 
@@ -607,99 +571,81 @@ images = true
         assert results['spine_count'] == 5  # 3 blog + 2 RSS
 
         # Detailed validation
-        with EPUBValidator(output_path) as validator:
-            # Check TOC
-            toc = validator.get_nav_toc()
-            assert len(toc) > 0
+        snapshot = validator_for(output_path)
+        # Check TOC
+        assert len(snapshot.nav_toc) > 0
 
-            # Check files
-            files = validator.list_files()
-            assert 'mimetype' in files
-            assert any('META-INF' in f for f in files)
+        # Check files
+        assert 'mimetype' in snapshot.files
+        assert any('META-INF' in f for f in snapshot.files)
 
-
-@pytest.mark.asyncio
-class TestDateFormatting:
-    """Test date formatting in different languages."""
-
-    async def test_date_formatting_english(self, temp_dir, httpserver_with_content):
-        """Test that dates are formatted in human-readable English."""
+    async def test_concurrent_builds(self, temp_dir, shared_cache_dir, httpserver_with_content):
+        """Test that independent builds can run concurrently in one event loop."""
         httpserver = httpserver_with_content
 
-        gensi_content = f"""
-title = "English Date Test"
-author = "Test Author"
-language = "en"
-
-[[index]]
-url = "{httpserver.url_for('/blog_index.html')}"
-type = "html"
-links = "article.post-preview a.post-link"
-
-[article]
-content = "div.article-content"
-title = "h1.article-title"
-author = "span.author"
-date = "time.published"
-"""
-        gensi_path = temp_dir / 'test_english_dates.gensi'
-        gensi_path.write_text(gensi_content)
-
-        output_path = await process_gensi_file(gensi_path, temp_dir, cache_enabled=False)
+        builds = []
+        for name, recipe in [
+            ('blog', make_gensi_bytes(
+                'blog', title="Concurrent Blog", url=httpserver.url_for('/blog_index.html')
+            )),
+            ('feed', make_gensi_bytes(
+                'feed', title="Concurrent Feed", url=httpserver.url_for('/test_feed_rss.xml'),
+                index='limit = 2\n', article=_ARTICLE_CONTENT
+            )),
+        ]:
+            output_dir = temp_dir / name
+            output_dir.mkdir()
+            gensi_path = output_dir / f'{name}.gensi'
+            gensi_path.write_bytes(recipe)
+            builds.append((gensi_path, output_dir))
+
+        output_paths = await asyncio.gather(*(
+            process_gensi_file(gensi_path, output_dir, cache_dir=shared_cache_dir)
+            for gensi_path, output_dir in builds
+        ))
+
+        blog, feed = (validator_for(path) for path in output_paths)
+        assert blog.metadata['title'] == "Concurrent Blog"
+        assert len(blog.spine_items) == 3
+        assert feed.metadata['title'] == "Concurrent Feed"
+        assert len(feed.spine_items) == 2
 
-        assert output_path.exists()
 
-        # Validate the EPUB and check date formatting
-        with EPUBValidator(output_path) as validator:
-            # Get first article content
-            articles = validator.get_articles()
-            assert len(articles) > 0
-
-            first_article = articles[0]
-            # The date should be formatted in English
-            # Original: "2025-01-15T10:00:00Z" or "January 15, 2025"
-            # Should contain formatted date components
-            assert '2025' in first_article or '25' in first_article
-            assert ('Jan' in first_article or 'January' in first_article)
+@pytest.mark.asyncio
+class TestDateFormatting:
+    """Test date formatting in different languages."""
 
-    async def test_date_formatting_german(self, temp_dir, httpserver_with_content):
-        """Test that dates are formatted in human-readable German."""
+    @pytest.mark.parametrize(("title", "language", "month_names"), [
+        ("English Date Test", "en", ("Jan", "January")),
+        # German uses "Januar" for January; the day alone is also accepted
+        ("German Date Test", "de", ("Jan", "Januar", "15")),
+    ], ids=["english", "german"])
+    async def test_date_formatting(
+        self, temp_dir, shared_cache_dir, httpserver_with_content, title, language, month_names
+    ):
+        """Test that dates are formatted in the recipe's language."""
         httpserver = httpserver_with_content
 
-        gensi_content = f"""
-title = "German Date Test"
-author = "Test Author"
-language = "de"
-
-[[index]]
-url = "{httpserver.url_for('/blog_index.html')}"
-type = "html"
-links = "article.post-preview a.post-link"
-
-[article]
-content = "div.article-content"
-title = "h1.article-title"
-author = "span.author"
-date = "time.published"
-"""
-        gensi_path = temp_dir / 'test_german_dates.gensi'
-        gensi_path.write_text(gensi_content)
+        gensi_path = temp_dir / f'test_{language}_dates.gensi'
+        gensi_path.write_bytes(make_gensi_bytes(
+            'blog',
+            title=title,
+            header=f'author = "Test Author"\nlanguage = "{language}"\n',
+            url=httpserver.url_for('/blog_index.html'),
+            article='title = "h1.article-title"\nauthor = "span.author"\ndate = "time.published"\n',
+        ))
 
-        output_path = await process_gensi_file(gensi_path, temp_dir, cache_enabled=False)
+        output_path = await process_gensi_file(gensi_path, temp_dir, cache_dir=shared_cache_dir)
 
         assert output_path.exists()
 
-        # Validate the EPUB and check date formatting
-        with EPUBValidator(output_path) as validator:
-            articles = validator.get_articles()
-            assert len(articles) > 0
+        # Original: "2025-01-15T10:00:00Z" or "January 15, 2025"
+        articles = validator_for(output_path).articles
+        assert len(articles) > 0
 
-            first_article = articles[0]
-            # The date should be formatted in German format
-            # Should contain date in German locale format
-            assert '2025' in first_article or '25' in first_article
-            # German uses "Januar" for January
-            assert ('Jan' in first_article or 'Januar' in first_article or '15' in first_article)
+        first_article = articles[0]
+        assert '2025' in first_article or '25' in first_article
+        assert any(name in first_article for name in month_names)
 
     async def test_date_formatting_with_iso_datetime(self, temp_dir, httpserver_with_content):
         """Test formatting of ISO datetime strings."""
@@ -727,7 +673,7 @@ date = "time.published"
 </html>
 """
         # Serve custom article
-        httpserver.expect_request('/iso_article.html').respond_with_data(
+        httpserver.expect_oneshot_request('/iso_article.html').respond_with_data(
             custom_article_html,
             content_type='text/html'
         )
@@ -742,7 +688,7 @@ date = "time.published"
 </body>
 </html>
 """
-        httpserver.expect_request('/iso_index.html').respond_with_data(
+        httpserver.expect_oneshot_request('/iso_index.html').respond_with_data(
             index_html,
             content_type='text/html'
         )
@@ -782,6 +728,7 @@ date = "time.published"
             # Should include time since it's a datetime
             assert ('14' in article_content or '2:30' in article_content or '30' in article_content)
 
+    @pytest.mark.slow
     async def test_unparseable_date_fallback(self, temp_dir, httpserver_with_content):
         """Test that unparseable dates fall back to original string."""
         httpserver = httpserver_with_content
@@ -800,7 +747,7 @@ date = "time.published"
 </body>
 </html>
 """
-        httpserver.expect_request('/unparseable_article.html').respond_with_data(
+        httpserver.expect_oneshot_request('/unparseable_article.html').respond_with_data(
             custom_article_html,
             content_type='text/html'
         )
@@ -814,7 +761,7 @@ date = "time.published"
 </body>
 </html>
 """
-        httpserver.expect_request('/unparseable_index.html').respond_with_data(
+        httpserver.expect_oneshot_request('/unparseable_index.html').respond_with_data(
             index_html,
             content_type='text/html'
         )
@@ -907,21 +854,19 @@ title = "h1.article-title"
 
         # Verify article has stylesheet link
         with EPUBValidator(output_path) as validator:
-            manifest = validator.get_manifest_items()
-            spine_items = validator.get_spine_items()
+            manifest = validator.manifest_items
+            spine_items = validator.spine_items
 
             assert len(spine_items) > 0
             first_id = spine_items[0]
             first_href = manifest.get(first_id)
             assert first_href is not None
 
-            chapter_content = validator.get_chapter_content(first_href)
+            chapter_content = validator.get_chapter_bytes(first_href)
             assert chapter_content is not None
 
             # Check for stylesheet link with correct attributes
-            assert '<link href="../styles/styles.css"' in chapter_content
-            assert 'rel="stylesheet"' in chapter_content
-            assert 'type="text/css"' in chapter_content
+            _assert_stylesheet_link(chapter_content, '../styles/styles.css')
 
     @pytest.mark.asyncio
     async def test_nav_has_stylesheet_link_integration(self, temp_dir, httpserver):
@@ -977,36 +922,12 @@ title = "h1.article-title"
 
         # Verify nav has stylesheet link
         with EPUBValidator(output_path) as validator:
-            opf_path = validator.get_content_opf_path()
-            assert opf_path is not None
-
-            from lxml import etree
-            from pathlib import Path
+            nav_path = validator.get_nav_path()
+            assert nav_path is not None
+            nav_content = validator.epub.read(nav_path)
 
-            content = validator.epub.read(opf_path)
-            tree = etree.fromstring(content)
-            ns = {'opf': 'http://www.idpf.org/2007/opf'}
-
-            # Find nav document
-            nav_items = tree.xpath(
-                '//opf:manifest/opf:item[@properties="nav"]/@href',
-                namespaces=ns
-            )
-            assert len(nav_items) > 0
-
-            nav_href = nav_items[0]
-            opf_dir = str(Path(opf_path).parent)
-            if opf_dir == '.':
-                nav_path = nav_href
-            else:
-                nav_path = f"{opf_dir}/{nav_href}"
-
-            nav_content = validator.epub.read(nav_path).decode('utf-8')
-
-            # Check for stylesheet link with correct attributes
-            assert '<link href="styles/styles.css"' in nav_content
-            assert 'rel="stylesheet"' in nav_content
-            assert 'type="text/css"' in nav_content
+        # Check for stylesheet link with correct attributes
+        _assert_stylesheet_link(nav_content, 'styles/styles.css')
 
     @pytest.mark.asyncio
     async def test_multi_index_all_articles_have_stylesheet_links(self, temp_dir, httpserver):
@@ -1083,20 +1004,16 @@ title = "h1.article-title"
 
         # Verify all articles have stylesheet links
         with EPUBValidator(output_path) as validator:
-            manifest = validator.get_manifest_items()
-            spine_items = validator.get_spine_items()
+            manifest = validator.manifest_items
+            spine_items = validator.spine_items
 
             assert len(spine_items) == 3  # 2 from section 1, 1 from section 2
 
-            # Check all articles have stylesheet links
-            for item_id in spine_items:
-                href = manifest.get(item_id)
-                assert href is not None
-
-                chapter_content = validator.get_chapter_content(href)
-                assert chapter_content is not None
+            hrefs = [manifest.get(item_id) for item_id in spine_items]
+            assert None not in hrefs
 
-                # Verify stylesheet link exists
-                assert '<link href="../styles/styles.css"' in chapter_content
-                assert 'rel="stylesheet"' in chapter_content
-                assert 'type="text/css"' in chapter_content
+            # Check all articles have stylesheet links
+            chapters = validator.get_chapters_bulk(hrefs)
+            assert set(chapters) == set(hrefs)
+            for chapter_content in chapters.values():
+                _assert_stylesheet_link(chapter_content, '../styles/styles.css')
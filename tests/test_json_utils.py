@@ -3,7 +3,13 @@ Tests for JSON path extraction utilities.
 """
 
 import pytest
-from gensi.core.json_utils import extract_json_path, extract_json_paths, extract_json_paths_as_list, JSONExtractionError
+from gensi.core.json_utils import (
+    extract_json_path,
+    extract_json_paths,
+    extract_json_paths_as_list,
+    loads_json,
+    JSONExtractionError,
+)
 
 
 class TestExtractJsonPath:
@@ -83,6 +89,43 @@ class TestExtractJsonPath:
         result = extract_json_path(data, "items[*].value")
         assert result == "first"
 
+    def test_same_path_reused_across_documents(self):
+        """Test that a reused path (served from the parse cache) evaluates each document."""
+        assert extract_json_path({"data": {"title": "One"}}, "data.title") == "One"
+        assert extract_json_path({"data": {"title": "Two"}}, "data.title") == "Two"
+        assert extract_json_path({"data": {"title": "Three"}}, "$.data.title") == "Three"
+
+    def test_jsonpath_parsed_once_per_expression(self):
+        """Test that repeated and $-prefixed paths hit the compiled-expression cache."""
+        from gensi.core.json_utils import _compile_jsonpath
+
+        data = {"items": [{"name": "a"}]}
+        extract_json_path(data, "items..name")
+        hits = _compile_jsonpath.cache_info().hits
+        assert extract_json_path(data, "items..name") == "a"
+        assert extract_json_path(data, "$.items..name") == "a"
+        assert _compile_jsonpath.cache_info().hits == hits + 2
+
+    def test_dotted_paths_match_jsonpath_semantics(self):
+        """Test that plain dotted paths resolve exactly like a jsonpath_ng evaluation."""
+        from jsonpath_ng import parse
+
+        data = {
+            "data": {"title": "T", "empty": None, "items": [{"id": 1}]},
+            "list": [{"title": "A"}],
+        }
+        for path in ["data.title", "data.empty", "data.items", "$.data",
+                     "data.items[0].id", "data.items[*].id", "list[*].title", "$.list[0]"]:
+            full = path if path.startswith("$") else f"$.{path}"
+            assert extract_json_path(data, path) == parse(full).find(data)[0].value
+            assert extract_json_paths_as_list(data, path) == [m.value for m in parse(full).find(data)]
+
+        # Missing keys and lookups through lists still report no match
+        for path in ["data.missing", "list.title", "data.title.length",
+                     "data.items[3].id", "list[*].missing"]:
+            with pytest.raises(JSONExtractionError, match="did not match any values"):
+                extract_json_path(data, path)
+
 
 class TestExtractJsonPaths:
     """Tests for extract_json_paths function (multiple path extraction)."""
@@ -117,6 +160,13 @@ class TestExtractJsonPaths:
         result = extract_json_paths(json_str, paths)
         assert result == {"title": "Test", "content": "<p>Text</p>"}
 
+    def test_extract_multiple_paths_from_bytes(self):
+        """Test that a JSON bytes body is decoded once and used for every path."""
+        json_bytes = b'{"data": {"title": "Test", "items": [{"id": 1}, {"id": 2}]}}'
+        paths = {"title": "data.title", "first": "data.items[0].id", "ids": "data.items[*].id"}
+        result = extract_json_paths(json_bytes, paths)
+        assert result == {"title": "Test", "first": 1, "ids": 1}
+
     def test_extract_with_missing_optional_path(self):
         """Test that missing paths raise errors (no optional paths in current design)."""
         data = {"data": {"title": "Test"}}
@@ -287,3 +337,23 @@ class TestRealWorldExamples:
         result = extract_json_paths(json_response, paths)
         assert result["title"] == "Test"
         assert result["author"] is None
+
+
+class TestLoadsJson:
+    """Tests for loads_json function."""
+
+    def test_loads_str_and_bytes(self):
+        assert loads_json('{"a": [1, 2]}') == {"a": [1, 2]}
+        assert loads_json(b'{"a": "\xc3\xa9"}') == {"a": "\u00e9"}
+
+    def test_loads_values_outside_strict_json(self):
+        """NaN and big integers are accepted like the standard library does."""
+        import math
+        data = loads_json('{"nan": NaN, "big": 123456789012345678901234567890}')
+        assert math.isnan(data["nan"])
+        assert data["big"] == 123456789012345678901234567890
+
+    def test_invalid_json_raises_decode_error(self):
+        import json
+        with pytest.raises(json.JSONDecodeError):
+            loads_json('{"a": ')
@@ -4,13 +4,36 @@ import pytest
 from pathlib import Path
 from gensi.core.parser import GensiParser
 
+# Most recipes below are a title and one HTML index plus a few extra lines;
+# only the varying fields are substituted into this shared skeleton
+_TOML_SKELETON = """
+title = "{title}"
+
+[[index]]
+url = "{url}"
+type = "{type}"
+links = "{links}"
+{extra}"""
+_SKELETON_DEFAULTS = {
+    'title': 'Test',
+    'url': 'http://localhost/index.html',
+    'type': 'html',
+    'links': 'a',
+    'extra': '',
+}
+
+
+def _skeleton_gensi(**overrides: str) -> str:
+    """Build a recipe from _TOML_SKELETON, substituting only the given fields."""
+    return _TOML_SKELETON.format_map({**_SKELETON_DEFAULTS, **overrides})
+
 
 class TestParserValidFiles:
     """Test parsing of valid .gensi files."""
 
-    def test_parse_simple_gensi(self, valid_gensi_simple):
+    def test_parse_simple_gensi(self, simple_parser):
         """Test parsing a simple valid .gensi file."""
-        parser = GensiParser(valid_gensi_simple)
+        parser = simple_parser
 
         assert parser.title == "Test EPUB"
         assert parser.author == "Test Author"
@@ -45,9 +68,9 @@ class TestParserValidFiles:
         assert 'python' in parser.indices[0]
         assert 'script' in parser.indices[0]['python']
 
-    def test_parse_article_config(self, valid_gensi_simple):
+    def test_parse_article_config(self, simple_parser):
         """Test parsing article configuration."""
-        parser = GensiParser(valid_gensi_simple)
+        parser = simple_parser
 
         assert parser.article is not None
         assert parser.article['content'] == "div.article-content"
@@ -56,36 +79,27 @@ class TestParserValidFiles:
         assert parser.article['date'] == "time.published"
         assert '.sidebar' in parser.article['remove']
 
-    def test_optional_fields_none(self, temp_dir):
+    def test_optional_fields_none(self):
         """Test that optional fields default to None."""
-        content = """
-title = "Minimal EPUB"
+        content = _skeleton_gensi(title="Minimal EPUB")
 
-[[index]]
-url = "http://localhost/index.html"
-type = "html"
-links = "a"
-"""
-        gensi_path = temp_dir / 'minimal.gensi'
-        gensi_path.write_text(content)
-
-        parser = GensiParser(gensi_path)
+        parser = GensiParser.from_string(content)
 
         assert parser.title == "Minimal EPUB"
         assert parser.author is None
         assert parser.language is None
         assert parser.cover is None
 
-    def test_get_article_config_global(self, valid_gensi_simple):
+    def test_get_article_config_global(self, simple_parser):
         """Test getting global article config."""
-        parser = GensiParser(valid_gensi_simple)
+        parser = simple_parser
 
         index_data = parser.indices[0]
         article_config = parser.get_article_config(index_data)
 
         assert article_config == parser.article
 
-    def test_get_article_config_no_override(self, temp_dir):
+    def test_get_article_config_no_override(self):
         """Test that article config is returned when no override exists."""
         content = """
 title = "Override Test"
@@ -99,10 +113,7 @@ url = "http://localhost/index1.html"
 type = "html"
 links = "a"
 """
-        gensi_path = temp_dir / 'no_override.gensi'
-        gensi_path.write_text(content)
-
-        parser = GensiParser(gensi_path)
+        parser = GensiParser.from_string(content)
 
         # Index uses global config
         config = parser.get_article_config(parser.indices[0])
@@ -118,21 +129,12 @@ class TestParserValidation:
         with pytest.raises(ValueError, match="title.*required"):
             GensiParser(invalid_gensi_no_title)
 
-    def test_empty_title(self, temp_dir):
+    def test_empty_title(self):
         """Test that empty title raises ValueError."""
-        content = """
-title = "   "
-
-[[index]]
-url = "http://localhost/index.html"
-type = "html"
-links = "a"
-"""
-        gensi_path = temp_dir / 'empty_title.gensi'
-        gensi_path.write_text(content)
+        content = _skeleton_gensi(title="   ")
 
         with pytest.raises(ValueError, match="title.*non-empty"):
-            GensiParser(gensi_path)
+            GensiParser.from_string(content)
 
     def test_missing_index(self, invalid_gensi_no_index):
         """Test that missing index section raises ValueError."""
@@ -144,7 +146,7 @@ links = "a"
         with pytest.raises(ValueError, match="type.*must be.*html.*rss"):
             GensiParser(invalid_gensi_wrong_type)
 
-    def test_html_index_missing_links(self, temp_dir):
+    def test_html_index_missing_links(self):
         """Test that HTML index without links or python raises ValueError."""
         content = """
 title = "Test"
@@ -153,13 +155,10 @@ title = "Test"
 url = "http://localhost/index.html"
 type = "html"
 """
-        gensi_path = temp_dir / 'no_links.gensi'
-        gensi_path.write_text(content)
-
         with pytest.raises(ValueError, match="links.*required"):
-            GensiParser(gensi_path)
+            GensiParser.from_string(content)
 
-    def test_index_missing_url(self, temp_dir):
+    def test_index_missing_url(self):
         """Test that index without URL raises ValueError."""
         content = """
 title = "Test"
@@ -168,13 +167,10 @@ title = "Test"
 type = "html"
 links = "a"
 """
-        gensi_path = temp_dir / 'no_url.gensi'
-        gensi_path.write_text(content)
-
         with pytest.raises(ValueError, match="url.*required"):
-            GensiParser(gensi_path)
+            GensiParser.from_string(content)
 
-    def test_index_missing_type(self, temp_dir):
+    def test_index_missing_type(self):
         """Test that index without type raises ValueError."""
         content = """
 title = "Test"
@@ -183,18 +179,15 @@ title = "Test"
 url = "http://localhost/index.html"
 links = "a"
 """
-        gensi_path = temp_dir / 'no_type.gensi'
-        gensi_path.write_text(content)
-
         with pytest.raises(ValueError, match="type.*required"):
-            GensiParser(gensi_path)
+            GensiParser.from_string(content)
 
     def test_multiple_index_missing_name(self, invalid_gensi_multi_no_name):
         """Test that multiple indices without names raise ValueError."""
         with pytest.raises(ValueError, match="name.*required.*multiple"):
             GensiParser(invalid_gensi_multi_no_name)
 
-    def test_multiple_index_empty_name(self, temp_dir):
+    def test_multiple_index_empty_name(self):
         """Test that multiple indices with empty names raise ValueError."""
         content = """
 title = "Test"
@@ -211,13 +204,10 @@ url = "http://localhost/index2.html"
 type = "html"
 links = "a"
 """
-        gensi_path = temp_dir / 'empty_name.gensi'
-        gensi_path.write_text(content)
-
         with pytest.raises(ValueError, match="name.*required"):
-            GensiParser(gensi_path)
+            GensiParser.from_string(content)
 
-    def test_cover_missing_url(self, temp_dir):
+    def test_cover_missing_url(self):
         """Test that cover section without URL raises ValueError."""
         content = """
 title = "Test"
@@ -230,32 +220,20 @@ url = "http://localhost/index.html"
 type = "html"
 links = "a"
 """
-        gensi_path = temp_dir / 'cover_no_url.gensi'
-        gensi_path.write_text(content)
-
         with pytest.raises(ValueError, match="[Cc]over.*url.*required"):
-            GensiParser(gensi_path)
+            GensiParser.from_string(content)
 
-    def test_article_missing_content_selector(self, temp_dir):
+    def test_article_missing_content_selector(self):
         """Test that article section without content selector raises ValueError."""
-        content = """
-title = "Test"
-
-[[index]]
-url = "http://localhost/index.html"
-type = "html"
-links = "a"
-
+        content = _skeleton_gensi(extra="""
 [article]
 title = "h1"
-"""
-        gensi_path = temp_dir / 'article_no_content.gensi'
-        gensi_path.write_text(content)
+""")
 
         with pytest.raises(ValueError, match="[Aa]rticle.*content.*required"):
-            GensiParser(gensi_path)
+            GensiParser.from_string(content)
 
-    def test_html_index_with_python_no_links(self, temp_dir):
+    def test_html_index_with_python_no_links(self):
         """Test that HTML index with Python script doesn't require links."""
         content = """
 title = "Test"
@@ -267,48 +245,27 @@ type = "html"
 [index.python]
 script = "return []"
 """
-        gensi_path = temp_dir / 'html_python.gensi'
-        gensi_path.write_text(content)
-
         # Should not raise
-        parser = GensiParser(gensi_path)
+        parser = GensiParser.from_string(content)
         assert len(parser.indices) == 1
 
-    def test_article_with_python_no_content(self, temp_dir):
+    def test_article_with_python_no_content(self):
         """Test that article with Python script doesn't require content selector."""
-        content = """
-title = "Test"
-
-[[index]]
-url = "http://localhost/index.html"
-type = "html"
-links = "a"
-
+        content = _skeleton_gensi(extra="""
 [article.python]
 script = "return '<p>test</p>'"
-"""
-        gensi_path = temp_dir / 'article_python.gensi'
-        gensi_path.write_text(content)
+""")
 
         # Should not raise
-        parser = GensiParser(gensi_path)
+        parser = GensiParser.from_string(content)
         assert parser.article is not None
 
-    def test_single_index_without_name(self, temp_dir):
+    def test_single_index_without_name(self):
         """Test that single index doesn't require name field."""
-        content = """
-title = "Test"
-
-[[index]]
-url = "http://localhost/index.html"
-type = "html"
-links = "a"
-"""
-        gensi_path = temp_dir / 'single_no_name.gensi'
-        gensi_path.write_text(content)
+        content = _skeleton_gensi()
 
         # Should not raise
-        parser = GensiParser(gensi_path)
+        parser = GensiParser.from_string(content)
         assert len(parser.indices) == 1
         assert 'name' not in parser.indices[0] or parser.indices[0].get('name') is None
 
@@ -316,7 +273,7 @@ links = "a"
 class TestParserEdgeCases:
     """Test edge cases and special scenarios."""
 
-    def test_rss_index_with_limit(self, temp_dir):
+    def test_rss_index_with_limit(self):
         """Test RSS index with limit field."""
         content = """
 title = "Test"
@@ -326,13 +283,10 @@ url = "http://localhost/feed.rss"
 type = "rss"
 limit = 10
 """
-        gensi_path = temp_dir / 'rss_limit.gensi'
-        gensi_path.write_text(content)
-
-        parser = GensiParser(gensi_path)
+        parser = GensiParser.from_string(content)
         assert parser.indices[0]['limit'] == 10
 
-    def test_rss_index_with_use_content_encoded(self, temp_dir):
+    def test_rss_index_with_use_content_encoded(self):
         """Test RSS index with use_content_encoded field."""
         content = """
 title = "Test"
@@ -342,13 +296,10 @@ url = "http://localhost/feed.rss"
 type = "rss"
 use_content_encoded = true
 """
-        gensi_path = temp_dir / 'rss_content.gensi'
-        gensi_path.write_text(content)
-
-        parser = GensiParser(gensi_path)
+        parser = GensiParser.from_string(content)
         assert parser.indices[0]['use_content_encoded'] is True
 
-    def test_parse_bluesky_index(self, temp_dir):
+    def test_parse_bluesky_index(self):
         """Test parsing valid Bluesky index."""
         content = """
 title = "Bluesky EPUB"
@@ -362,15 +313,12 @@ limit = 40
 [article]
 content = "div.content"
 """
-        gensi_path = temp_dir / 'bluesky.gensi'
-        gensi_path.write_text(content)
-
-        parser = GensiParser(gensi_path)
+        parser = GensiParser.from_string(content)
         assert parser.indices[0]['type'] == 'bluesky'
         assert parser.indices[0]['username'] == 'test.bsky.social'
         assert parser.indices[0]['limit'] == 40
 
-    def test_bluesky_missing_username(self, temp_dir):
+    def test_bluesky_missing_username(self):
         """Validate username requirement."""
         content = """
 title = "Bluesky EPUB"
@@ -382,13 +330,10 @@ type = "bluesky"
 [article]
 content = "div.content"
 """
-        gensi_path = temp_dir / 'invalid.gensi'
-        gensi_path.write_text(content)
-
         with pytest.raises(ValueError, match="'username' is required for Bluesky type"):
-            GensiParser(gensi_path)
+            GensiParser.from_string(content)
 
-    def test_bluesky_invalid_limit(self, temp_dir):
+    def test_bluesky_invalid_limit(self):
         """Validate limit constraints."""
         content = """
 title = "Bluesky EPUB"
@@ -402,13 +347,10 @@ limit = 150
 [article]
 content = "div.content"
 """
-        gensi_path = temp_dir / 'invalid.gensi'
-        gensi_path.write_text(content)
-
         with pytest.raises(ValueError, match="'limit' must be an integer between 1 and 100"):
-            GensiParser(gensi_path)
+            GensiParser.from_string(content)
 
-    def test_parse_bluesky_with_domain(self, temp_dir):
+    def test_parse_bluesky_with_domain(self):
         """Test parsing Bluesky index with domain filter."""
         content = """
 title = "Bluesky EPUB"
@@ -423,41 +365,29 @@ limit = 7
 [article]
 content = "div.content"
 """
-        gensi_path = temp_dir / 'bluesky_domain.gensi'
-        gensi_path.write_text(content)
-
-        parser = GensiParser(gensi_path)
+        parser = GensiParser.from_string(content)
         assert parser.indices[0]['type'] == 'bluesky'
         assert parser.indices[0]['username'] == 'test.bsky.social'
         assert parser.indices[0]['domain'] == 'republik.ch'
         assert parser.indices[0]['limit'] == 7
 
-    def test_article_with_remove_array(self, valid_gensi_simple):
+    def test_article_with_remove_array(self, simple_parser):
         """Test article with remove selectors array."""
-        parser = GensiParser(valid_gensi_simple)
+        parser = simple_parser
 
         assert 'remove' in parser.article
         assert isinstance(parser.article['remove'], list)
         assert len(parser.article['remove']) == 1
 
-    def test_article_images_config(self, temp_dir):
+    def test_article_images_config(self):
         """Test article with images configuration."""
-        content = """
-title = "Test"
-
-[[index]]
-url = "http://localhost/index.html"
-type = "html"
-links = "a"
-
+        content = _skeleton_gensi(extra="""
 [article]
 content = "div.content"
 images = false
-"""
-        gensi_path = temp_dir / 'article_images.gensi'
-        gensi_path.write_text(content)
+""")
 
-        parser = GensiParser(gensi_path)
+        parser = GensiParser.from_string(content)
         assert parser.article['images'] is False
 
     def test_malformed_toml(self, temp_dir):
@@ -472,6 +402,20 @@ this is not valid TOML
         with pytest.raises(Exception):  # tomllib will raise an exception
             GensiParser(gensi_path)
 
+    def test_from_string_matches_file(self, valid_gensi_simple):
+        """Test that parsing from a string gives the same result as the file."""
+        from_file = GensiParser(valid_gensi_simple)
+        from_text = GensiParser.from_string(valid_gensi_simple.read_text(), source_name='simple.gensi')
+
+        assert from_text.data == from_file.data
+        assert from_text.filepath == Path('simple.gensi')
+        assert GensiParser.from_string(_skeleton_gensi()).filepath == Path('<memory>')
+
+    def test_filepath_is_path(self, valid_gensi_simple):
+        """Test that filepath is a Path whether given a Path or a string."""
+        assert GensiParser(valid_gensi_simple).filepath is valid_gensi_simple
+        assert GensiParser(str(valid_gensi_simple)).filepath == valid_gensi_simple
+
     def test_nonexistent_file(self):
         """Test that nonexistent file raises exception."""
         with pytest.raises(FileNotFoundError):
@@ -481,7 +425,7 @@ this is not valid TOML
 class TestParserJsonSupport:
     """Test parsing and validation of JSON-related fields."""
 
-    def test_valid_json_index_simple_mode(self, temp_dir):
+    def test_valid_json_index_simple_mode(self):
         """Test valid JSON index with json_path and links in simple mode."""
         content = """
 title = "Test JSON EPUB"
@@ -495,15 +439,12 @@ links = ".article-link"
 [article]
 content = "div.content"
 """
-        gensi_path = temp_dir / 'json_index.gensi'
-        gensi_path.write_text(content)
-
-        parser = GensiParser(gensi_path)
+        parser = GensiParser.from_string(content)
         assert parser.indices[0]['type'] == 'json'
         assert parser.indices[0]['json_path'] == 'data.magazin.content'
         assert parser.indices[0]['links'] == '.article-link'
 
-    def test_valid_json_index_python_mode(self, temp_dir):
+    def test_valid_json_index_python_mode(self):
         """Test valid JSON index with Python override (no json_path needed)."""
         content = """
 title = "Test JSON EPUB"
@@ -523,30 +464,18 @@ return articles
 [article]
 content = "div.content"
 """
-        gensi_path = temp_dir / 'json_index_python.gensi'
-        gensi_path.write_text(content)
-
-        parser = GensiParser(gensi_path)
+        parser = GensiParser.from_string(content)
         assert parser.indices[0]['type'] == 'json'
         assert 'python' in parser.indices[0]
 
-    def test_json_index_missing_json_path(self, temp_dir):
+    def test_json_index_missing_json_path(self):
         """Test that JSON index without json_path in simple mode raises error."""
-        content = """
-title = "Test"
-
-[[index]]
-url = "http://localhost/graphql"
-type = "json"
-links = ".article-link"
-"""
-        gensi_path = temp_dir / 'json_missing_path.gensi'
-        gensi_path.write_text(content)
+        content = _skeleton_gensi(url="http://localhost/graphql", type="json", links=".article-link")
 
         with pytest.raises(ValueError, match="json_path.*required.*JSON type"):
-            GensiParser(gensi_path)
+            GensiParser.from_string(content)
 
-    def test_json_index_direct_links_valid(self, temp_dir):
+    def test_json_index_direct_links_valid(self):
         """Test that JSON index without links is valid (direct links mode)."""
         content = """
 title = "Direct Links Test"
@@ -556,16 +485,13 @@ url = "https://api.example.com/articles"
 type = "json"
 json_path = "results[*].permalink"
 """
-        gensi_path = temp_dir / 'direct_links.gensi'
-        gensi_path.write_text(content)
-
         # Should NOT raise validation error
-        parser = GensiParser(gensi_path)
+        parser = GensiParser.from_string(content)
         assert parser.indices[0]['type'] == 'json'
         assert 'json_path' in parser.indices[0]
         assert 'links' not in parser.indices[0]
 
-    def test_json_index_html_extraction_still_valid(self, temp_dir):
+    def test_json_index_html_extraction_still_valid(self):
         """Test that existing HTML extraction configs still work."""
         content = """
 title = "HTML Extraction Test"
@@ -576,16 +502,13 @@ type = "json"
 json_path = "data.content"
 links = ".article-link"
 """
-        gensi_path = temp_dir / 'html_extraction.gensi'
-        gensi_path.write_text(content)
-
         # Should parse successfully - backward compatible
-        parser = GensiParser(gensi_path)
+        parser = GensiParser.from_string(content)
         assert parser.indices[0]['type'] == 'json'
         assert parser.indices[0]['json_path'] == 'data.content'
         assert parser.indices[0]['links'] == '.article-link'
 
-    def test_json_index_requires_json_path(self, temp_dir):
+    def test_json_index_requires_json_path(self):
         """Test that json_path is still required even without links."""
         content = """
 title = "Missing json_path"
@@ -594,45 +517,26 @@ title = "Missing json_path"
 url = "https://api.example.com/articles"
 type = "json"
 """
-        gensi_path = temp_dir / 'missing_path.gensi'
-        gensi_path.write_text(content)
-
         # Should raise - json_path still required
         with pytest.raises(ValueError, match="json_path.*required"):
-            GensiParser(gensi_path)
+            GensiParser.from_string(content)
 
-    def test_valid_article_json_string_path(self, temp_dir):
+    def test_valid_article_json_string_path(self):
         """Test valid article with JSON response_type and string json_path."""
-        content = """
-title = "Test"
-
-[[index]]
-url = "http://localhost/index.html"
-type = "html"
-links = "a"
-
+        content = _skeleton_gensi(extra="""
 [article]
 response_type = "json"
 json_path = "data.reportage.content"
 content = "div.content"
-"""
-        gensi_path = temp_dir / 'article_json_string.gensi'
-        gensi_path.write_text(content)
+""")
 
-        parser = GensiParser(gensi_path)
+        parser = GensiParser.from_string(content)
         assert parser.article['response_type'] == 'json'
         assert parser.article['json_path'] == 'data.reportage.content'
 
-    def test_valid_article_json_dict_path(self, temp_dir):
+    def test_valid_article_json_dict_path(self):
         """Test valid article with JSON response_type and dict json_path."""
-        content = """
-title = "Test"
-
-[[index]]
-url = "http://localhost/index.html"
-type = "html"
-links = "a"
-
+        content = _skeleton_gensi(extra="""
 [article]
 response_type = "json"
 
@@ -640,79 +544,50 @@ response_type = "json"
 content = "data.reportage.content"
 title = "data.reportage.title"
 author = "data.reportage.author"
-"""
-        gensi_path = temp_dir / 'article_json_dict.gensi'
-        gensi_path.write_text(content)
+""")
 
-        parser = GensiParser(gensi_path)
+        parser = GensiParser.from_string(content)
         assert parser.article['response_type'] == 'json'
         assert isinstance(parser.article['json_path'], dict)
         assert parser.article['json_path']['content'] == 'data.reportage.content'
         assert parser.article['json_path']['title'] == 'data.reportage.title'
 
-    def test_article_json_dict_missing_content(self, temp_dir):
+    def test_article_json_dict_missing_content(self):
         """Test that article json_path dict without 'content' key raises error."""
-        content = """
-title = "Test"
-
-[[index]]
-url = "http://localhost/index.html"
-type = "html"
-links = "a"
-
+        content = _skeleton_gensi(extra="""
 [article]
 response_type = "json"
 
 [article.json_path]
 title = "data.title"
-"""
-        gensi_path = temp_dir / 'article_json_no_content.gensi'
-        gensi_path.write_text(content)
+""")
 
         with pytest.raises(ValueError, match="json_path dict must have 'content' key"):
-            GensiParser(gensi_path)
+            GensiParser.from_string(content)
 
-    def test_article_invalid_response_type(self, temp_dir):
+    def test_article_invalid_response_type(self):
         """Test that invalid response_type raises error."""
-        content = """
-title = "Test"
-
-[[index]]
-url = "http://localhost/index.html"
-type = "html"
-links = "a"
-
+        content = _skeleton_gensi(extra="""
 [article]
 response_type = "xml"
 content = "div.content"
-"""
-        gensi_path = temp_dir / 'article_invalid_type.gensi'
-        gensi_path.write_text(content)
+""")
 
         with pytest.raises(ValueError, match="response_type.*must be.*html.*json"):
-            GensiParser(gensi_path)
+            GensiParser.from_string(content)
 
-    def test_article_json_missing_json_path(self, temp_dir):
+    def test_article_json_missing_json_path(self):
         """Test that article with response_type='json' without json_path raises error."""
-        content = """
-title = "Test"
-
-[[index]]
-url = "http://localhost/index.html"
-type = "html"
-links = "a"
-
+        content = _skeleton_gensi(extra="""
 [article]
 response_type = "json"
 content = "div.content"
-"""
-        gensi_path = temp_dir / 'article_json_no_path.gensi'
-        gensi_path.write_text(content)
+""")
 
         with pytest.raises(ValueError, match="json_path.*required.*response_type='json'"):
-            GensiParser(gensi_path)
+            GensiParser.from_string(content)
 
-    def test_valid_url_transform_simple_mode(self, temp_dir):
+    def test_valid_url_transform_simple_mode(self):
         """Test valid url_transform in simple mode with pattern and template."""
         content = """
 title = "Test"
@@ -730,24 +605,14 @@ template = 'https://api.com/graphql?slug={1}'
 [article]
 content = "div.content"
 """
-        gensi_path = temp_dir / 'url_transform_simple.gensi'
-        gensi_path.write_text(content)
-
-        parser = GensiParser(gensi_path)
+        parser = GensiParser.from_string(content)
         assert 'url_transform' in parser.indices[0]
         assert parser.indices[0]['url_transform']['pattern'] == '/reportage/([^/]+)/'
         assert parser.indices[0]['url_transform']['template'] == 'https://api.com/graphql?slug={1}'
 
-    def test_valid_url_transform_python_mode(self, temp_dir):
+    def test_valid_url_transform_python_mode(self):
         """Test valid url_transform in Python mode."""
-        content = """
-title = "Test"
-
-[[index]]
-url = "http://localhost/index.html"
-type = "html"
-links = "a"
-
+        content = _skeleton_gensi(extra="""
 [index.url_transform.python]
 script = '''
 import re
@@ -759,68 +624,55 @@ return url
 
 [article]
 content = "div.content"
-"""
-        gensi_path = temp_dir / 'url_transform_python.gensi'
-        gensi_path.write_text(content)
+""")
 
-        parser = GensiParser(gensi_path)
+        parser = GensiParser.from_string(content)
         assert 'url_transform' in parser.indices[0]
         assert 'python' in parser.indices[0]['url_transform']
 
-    def test_url_transform_missing_pattern(self, temp_dir):
+    def test_url_transform_missing_pattern(self):
         """Test that url_transform without pattern in simple mode raises error."""
-        content = """
-title = "Test"
-
-[[index]]
-url = "http://localhost/index.html"
-type = "html"
-links = "a"
-
+        content = _skeleton_gensi(extra="""
 [index.url_transform]
 template = 'https://api.com/{1}'
 
 [article]
 content = "div.content"
-"""
-        gensi_path = temp_dir / 'url_transform_no_pattern.gensi'
-        gensi_path.write_text(content)
+""")
 
         with pytest.raises(ValueError, match="url_transform requires 'pattern'"):
-            GensiParser(gensi_path)
+            GensiParser.from_string(content)
 
-    def test_url_transform_missing_template(self, temp_dir):
+    def test_url_transform_missing_template(self):
         """Test that url_transform without template in simple mode raises error."""
-        content = """
-title = "Test"
-
-[[index]]
-url = "http://localhost/index.html"
-type = "html"
-links = "a"
-
+        content = _skeleton_gensi(extra="""
 [index.url_transform]
 pattern = '/article/([^/]+)/'
 
 [article]
 content = "div.content"
-"""
-        gensi_path = temp_dir / 'url_transform_no_template.gensi'
-        gensi_path.write_text(content)
+""")
 
         with pytest.raises(ValueError, match="url_transform requires 'template'"):
-            GensiParser(gensi_path)
+            GensiParser.from_string(content)
 
-    def test_url_transform_mixed_modes_error(self, temp_dir):
-        """Test that url_transform with both Python and pattern/template raises error."""
-        content = """
-title = "Test"
+    def test_url_transform_invalid_pattern(self):
+        """Test that an invalid url_transform regex is reported at load time."""
+        content = _skeleton_gensi(extra="""
+[index.url_transform]
+pattern = '/article/([^/]+/'
+template = 'https://api.com/{1}'
 
-[[index]]
-url = "http://localhost/index.html"
-type = "html"
-links = "a"
+[article]
+content = "div.content"
+""")
 
+        with pytest.raises(ValueError, match="url_transform 'pattern' is not a valid regex"):
+            GensiParser.from_string(content)
+
+    def test_url_transform_mixed_modes_error(self):
+        """Test that url_transform with both Python and pattern/template raises error."""
+        content = _skeleton_gensi(extra="""
 [index.url_transform]
 pattern = '/article/([^/]+)/'
 template = 'https://api.com/{1}'
@@ -830,14 +682,12 @@ script = "return url"
 
 [article]
 content = "div.content"
-"""
-        gensi_path = temp_dir / 'url_transform_mixed.gensi'
-        gensi_path.write_text(content)
+""")
 
         with pytest.raises(ValueError, match="cannot have both 'python' and 'pattern'"):
-            GensiParser(gensi_path)
+            GensiParser.from_string(content)
 
-    def test_html_index_with_response_type_json(self, temp_dir):
+    def test_html_index_with_response_type_json(self):
         """Test HTML index with response_type='json' (fetch HTML, but it's actually JSON)."""
         content = """
 title = "Test"
@@ -852,10 +702,46 @@ links = "a"
 [article]
 content = "div.content"
 """
-        gensi_path = temp_dir / 'html_response_json.gensi'
-        gensi_path.write_text(content)
-
-        parser = GensiParser(gensi_path)
+        parser = GensiParser.from_string(content)
         assert parser.indices[0]['type'] == 'html'
         assert parser.indices[0]['response_type'] == 'json'
         assert parser.indices[0]['json_path'] == 'data.html'
+
+    def test_article_remove_invalid_selector(self):
+        """Test that an invalid 'remove' selector is reported at load time."""
+        content = _skeleton_gensi(extra="""
+[article]
+content = "div.content"
+remove = [".sidebar", "div[["]
+""")
+
+        with pytest.raises(ValueError, match="Article: 'remove' contains an invalid CSS selector"):
+            GensiParser.from_string(content)
+
+    def test_index_article_remove_must_be_list(self):
+        """Test that a per-index article 'remove' must be a list of selectors."""
+        content = _skeleton_gensi(extra="""
+[index.article]
+content = "div.content"
+remove = ".sidebar"
+""")
+
+        with pytest.raises(ValueError, match="Index 0: article: 'remove' must be a list"):
+            GensiParser.from_string(content)
+
+    def test_selectors_precompiled_on_load(self):
+        """Test that recipe selectors are compiled into the shared cache at load time."""
+        from gensi.core.extractor import compile_css
+
+        content = _skeleton_gensi(links="a.precompile-link", extra="""
+[article]
+content = "div.precompile-content"
+title = "h1[["
+""")
+
+        GensiParser.from_string(content)
+
+        hits = compile_css.cache_info().hits
+        compile_css("a.precompile-link")
+        compile_css("div.precompile-content")
+        assert compile_css.cache_info().hits == hits + 2
@@ -3,6 +3,7 @@
 import pytest
 from lxml import html
 from gensi.core.python_executor import PythonExecutor
+from gensi.utils.html_parser import get_html_parser
 
 
 class TestPythonExecutor:
@@ -47,7 +48,7 @@ class TestPythonExecutor:
 </body>
 </html>
 """
-        doc = html.fromstring(html_content)
+        doc = html.fromstring(html_content, parser=get_html_parser())
         script = """
 items = document.cssselect('.item')
 return len(items)
@@ -57,6 +58,20 @@ return len(items)
 
         assert result == 3
 
+    def test_execute_select_helper(self, executor):
+        """Test that scripts can use select() like element.cssselect()."""
+        doc = html.fromstring('<div><a class="x" href="/1">1</a><a href="/2">2</a><a class="x" href="/3">3</a></div>', parser=get_html_parser())
+        script = "return [a.get('href') for a in select(document, 'a.x')]"
+
+        assert executor.execute(script, {'document': doc}) == ['/1', '/3']
+        assert executor.execute(script, {'document': doc}) == [
+            a.get('href') for a in doc.cssselect('a.x')
+        ]
+
+    def test_execute_context_overrides_select(self, executor):
+        """Test that a context variable named select wins over the helper."""
+        assert executor.execute("return select", {'select': 'mine'}) == 'mine'
+
     def test_execute_extracting_urls(self, executor):
         """Test executing script that extracts URLs."""
         html_content = """
@@ -68,7 +83,7 @@ return len(items)
 </body>
 </html>
 """
-        doc = html.fromstring(html_content)
+        doc = html.fromstring(html_content, parser=get_html_parser())
         script = """
 links = []
 for elem in document.cssselect('a'):
@@ -93,7 +108,7 @@ return links
 </body>
 </html>
 """
-        doc = html.fromstring(html_content)
+        doc = html.fromstring(html_content, parser=get_html_parser())
         script = """
 featured = []
 for elem in document.cssselect('.post'):
@@ -142,6 +157,48 @@ return c * 2
         with pytest.raises(Exception):  # Should raise NameError
             executor.execute(script, {})
 
+    def test_execute_syntax_error_repeated(self, executor):
+        """Test that a syntax error is raised every time, not just on first compile."""
+        script = "x = = 1"
+
+        for _ in range(2):
+            with pytest.raises(Exception, match="Python script execution failed"):
+                executor.execute(script, {})
+
+    def test_execute_same_script_different_contexts(self, executor):
+        """Test that a reused script sees each call's own context."""
+        scripts = ["return value * 2", "value * 2", "result = value * 2"]
+
+        for script in scripts:
+            for value in (1, 2, 3):
+                result = executor.execute(script, {'value': value})
+                if script.startswith('result'):
+                    assert result is None
+                else:
+                    assert result == value * 2
+
+    def test_execute_reuses_wrapped_script(self, executor):
+        """Test that a repeated 'return' script is wrapped and compiled only once."""
+        from gensi.core.python_executor import _try_compile, _wrap_in_function
+
+        script = "items = [value] * 2\nreturn items"
+        assert executor.execute(script, {'value': 1}) == [1, 1]
+        wrap_hits = _wrap_in_function.cache_info().hits
+        compile_hits = _try_compile.cache_info().hits
+
+        assert executor.execute(script, {'value': 2}) == [2, 2]
+        assert _wrap_in_function.cache_info().hits == wrap_hits + 1
+        assert _try_compile.cache_info().hits == compile_hits + 1
+
+    def test_execute_one_line_return_skips_wrapper(self, executor):
+        """Test that a single 'return EXPR' line is evaluated without a function wrapper."""
+        from gensi.core.python_executor import _wrap_in_function
+
+        misses = _wrap_in_function.cache_info().misses
+        assert executor.execute("  return [x * 2 for x in items]\n", {'items': [1, 2]}) == [2, 4]
+        assert executor.execute("return 1, 2", {}) == (1, 2)
+        assert _wrap_in_function.cache_info().misses == misses
+
     def test_execute_no_return(self, executor):
         """Test executing script without return statement."""
         script = "x = 42"
@@ -150,6 +150,38 @@ class TestReplacements:
         captured = capsys.readouterr()
         assert "Warning" in captured.out or "warning" in captured.out.lower()
 
+    def test_regex_compiled_once(self):
+        """Test that a regex rule is compiled once and reused across documents."""
+        from gensi.core.replacements import compile_pattern
+
+        replacements = [{"pattern": r"<br\s*/?>\s*<br\s*/?>", "replacement": "</p><p>", "regex": True}]
+        assert apply_replacements("a<br><br>b", replacements) == "a</p><p>b"
+        hits = compile_pattern.cache_info().hits
+
+        assert apply_replacements("c<br/> <br/>d", replacements) == "c</p><p>d"
+        assert compile_pattern.cache_info().hits == hits + 1
+
+    def test_invalid_regex_warned_once(self, capsys):
+        """Test that an invalid regex is reported once, then skipped quietly."""
+        replacements = [
+            {"pattern": "(unclosed-group-warn-once", "replacement": "bar", "regex": True},
+            {"pattern": "test", "replacement": "done", "regex": False},
+        ]
+        assert apply_replacements("<p>test 1</p>", replacements) == "<p>done 1</p>"
+        assert "Warning" in capsys.readouterr().out
+
+        assert apply_replacements("<p>test 2</p>", replacements) == "<p>done 2</p>"
+        assert capsys.readouterr().out == ""
+
+    def test_replacement_count(self):
+        """Test that count limits how many matches are replaced."""
+        content = "<p>a</p><p>a</p><p>a</p>"
+        literal = [{"pattern": "<p>a</p>", "replacement": "<hr/>", "regex": False, "count": 1}]
+        regex = [{"pattern": r"<p>(\w)</p>", "replacement": r"<b>\1</b>", "regex": True, "count": 2}]
+
+        assert apply_replacements(content, literal) == "<hr/><p>a</p><p>a</p>"
+        assert apply_replacements(content, regex) == "<b>a</b><b>a</b><p>a</p>"
+
     def test_empty_content(self):
         """Test replacement on empty content."""
         content = ""
@@ -193,7 +225,7 @@ class TestReplacements:
 class TestReplacementsParser:
     """Test parsing of replacements from .gensi files."""
 
-    def test_parse_replacements(self, temp_dir):
+    def test_parse_replacements(self):
         """Test parsing replacements from .gensi file."""
         from gensi.core.parser import GensiParser
 
@@ -218,17 +250,14 @@ pattern = '<p class="center">[*\\s]+</p>'
 replacement = '<hr/>'
 regex = true
 """
-        gensi_path = temp_dir / 'with_replacements.gensi'
-        gensi_path.write_text(content, encoding='utf-8')
-
-        parser = GensiParser(gensi_path)
+        parser = GensiParser.from_string(content)
         assert len(parser.replacements) == 2
         assert parser.replacements[0]['pattern'] == '<p class="center">* * * *</p>'
         assert parser.replacements[0]['replacement'] == '<hr/>'
         assert parser.replacements[0]['regex'] is False
         assert parser.replacements[1]['regex'] is True
 
-    def test_parse_no_replacements(self, temp_dir):
+    def test_parse_no_replacements(self):
         """Test parsing .gensi file without replacements."""
         from gensi.core.parser import GensiParser
 
@@ -243,13 +272,10 @@ links = "a"
 [article]
 content = "div.content"
 """
-        gensi_path = temp_dir / 'no_replacements.gensi'
-        gensi_path.write_text(content)
-
-        parser = GensiParser(gensi_path)
+        parser = GensiParser.from_string(content)
         assert parser.replacements == []
 
-    def test_replacement_missing_pattern(self, temp_dir):
+    def test_replacement_missing_pattern(self):
         """Test that replacement without pattern raises error."""
         from gensi.core.parser import GensiParser
 
@@ -265,13 +291,10 @@ links = "a"
 replacement = '<hr/>'
 regex = false
 """
-        gensi_path = temp_dir / 'missing_pattern.gensi'
-        gensi_path.write_text(content)
-
         with pytest.raises(ValueError, match="pattern.*required"):
-            GensiParser(gensi_path)
+            GensiParser.from_string(content)
 
-    def test_replacement_missing_replacement(self, temp_dir):
+    def test_replacement_missing_replacement(self):
         """Test that replacement without replacement string raises error."""
         from gensi.core.parser import GensiParser
 
@@ -287,13 +310,10 @@ links = "a"
 pattern = 'foo'
 regex = false
 """
-        gensi_path = temp_dir / 'missing_replacement.gensi'
-        gensi_path.write_text(content)
-
         with pytest.raises(ValueError, match="replacement.*required"):
-            GensiParser(gensi_path)
+            GensiParser.from_string(content)
 
-    def test_replacement_missing_regex(self, temp_dir):
+    def test_replacement_missing_regex(self):
         """Test that replacement without regex flag raises error."""
         from gensi.core.parser import GensiParser
 
@@ -309,13 +329,32 @@ links = "a"
 pattern = 'foo'
 replacement = 'bar'
 """
-        gensi_path = temp_dir / 'missing_regex.gensi'
-        gensi_path.write_text(content)
-
         with pytest.raises(ValueError, match="regex.*required"):
-            GensiParser(gensi_path)
+            GensiParser.from_string(content)
+
+    def test_replacement_invalid_count(self):
+        """Test that a replacement count must be a positive integer."""
+        from gensi.core.parser import GensiParser
+
+        base = """
+title = "Test"
+
+[[index]]
+url = "http://localhost/index.html"
+type = "html"
+links = "a"
 
-    def test_replacement_invalid_types(self, temp_dir):
+[[replacements]]
+pattern = 'foo'
+replacement = 'bar'
+regex = false
+"""
+        assert GensiParser.from_string(base + "count = 1\n").replacements[0]['count'] == 1
+        for count in ("0", "-1", "'1'", "true"):
+            with pytest.raises(ValueError, match="count.*positive integer"):
+                GensiParser.from_string(base + f"count = {count}\n")
+
+    def test_replacement_invalid_types(self):
         """Test that replacement with invalid types raises error."""
         from gensi.core.parser import GensiParser
 
@@ -332,8 +371,5 @@ pattern = 123
 replacement = 'bar'
 regex = false
 """
-        gensi_path = temp_dir / 'invalid_pattern_type.gensi'
-        gensi_path.write_text(content)
-
         with pytest.raises(ValueError, match="pattern.*must be a string"):
-            GensiParser(gensi_path)
+            GensiParser.from_string(content)
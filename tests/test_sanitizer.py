@@ -114,6 +114,13 @@ class TestSanitizer:
 
         assert result.strip() == ""
 
+    def test_sanitize_blank_content_matches_nh3(self, sanitizer):
+        """Test that skipping blank content gives the same result as nh3."""
+        import nh3
+
+        for html in ["   \n  \t  ", "\r\n", "\xa0"]:
+            assert sanitizer.sanitize(html) == nh3.clean(html)
+
     def test_sanitize_malformed_html(self, sanitizer):
         """Test sanitizing malformed HTML."""
         html = "<p>Unclosed paragraph<div>Nested div"
@@ -148,3 +155,10 @@ class TestSanitizer:
         assert "strong" in result
         assert ("<em>" in result or "<i>" in result)  # em might be converted to i
         assert ("<strong>" in result or "<b>" in result)  # strong might be converted to b
+
+    def test_sanitize_custom_settings(self):
+        """Test that a Sanitizer built with custom settings applies them."""
+        sanitizer = Sanitizer(allowed_tags={'p'}, url_schemes={'https'})
+        html = '<p>Keep</p><div>drop <b>tags</b></div>'
+
+        assert sanitizer.sanitize(html) == '<p>Keep</p>drop tags'
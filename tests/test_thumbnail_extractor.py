@@ -13,6 +13,12 @@ from gensi.utils.thumbnail_extractor import (
 )
 
 
+def _score_first_img(html_str: str) -> float:
+    """Parse an HTML snippet and score its first <img>."""
+    img = next(html.fromstring(html_str).iter('img'))
+    return _score_image(img, "https://example.com/")
+
+
 class TestMetaTagExtraction:
     """Test extraction from Open Graph and Twitter Card meta tags."""
 
@@ -93,6 +99,20 @@ class TestMetaTagExtraction:
         assert "https://example.com/article.jpg" in urls
         assert "https://example.com/link.jpg" in urls
 
+    def test_meta_tags_in_source_priority_order(self):
+        """Test that meta images are ordered by source, not document position."""
+        html_str = """<html><head>
+<link rel="image_src" href="/link.jpg" />
+<meta name="twitter:image" content="/twitter.jpg" />
+<meta property="og:image" content="/og-1.jpg" />
+<meta property="og:image" content="/og-2.jpg" />
+<meta property="og:image:url" content="/og-1.jpg" />
+</head><body></body></html>"""
+        doc = html.fromstring(html_str)
+        urls = [c.url for c in _extract_from_meta_tags(doc)]
+
+        assert urls == ['/og-1.jpg', '/og-2.jpg', '/twitter.jpg', '/link.jpg']
+
     def test_no_meta_tags(self):
         """Test when no meta tags are present."""
         html_str = "<html><head></head><body></body></html>"
@@ -298,69 +318,48 @@ class TestImageScoring:
     def test_base_score(self):
         """Test base score for simple image."""
         html_str = '<img src="test.jpg" />'
-        doc = html.fromstring(html_str)
-        img = doc.xpath('//img')[0]
-
-        score = _score_image(img, "https://example.com/")
+        score = _score_first_img(html_str)
         assert score == 5.0  # Base score
 
     def test_dimension_boosters(self):
         """Test score boosters for large dimensions."""
         html_str = '<img src="test.jpg" width="800" height="600" />'
-        doc = html.fromstring(html_str)
-        img = doc.xpath('//img')[0]
-
-        score = _score_image(img, "https://example.com/")
+        score = _score_first_img(html_str)
         # Base (5) + width boost (3) + height boost (3) + has dimensions (1) = 12
         assert score == 12.0
 
     def test_dimension_penalties(self):
         """Test score penalties for small dimensions."""
         html_str = '<img src="test.jpg" width="100" height="100" />'
-        doc = html.fromstring(html_str)
-        img = doc.xpath('//img')[0]
-
-        score = _score_image(img, "https://example.com/")
+        score = _score_first_img(html_str)
         # Base (5) + has dimensions (1) - width penalty (5) - height penalty (5) = -4
         assert score < 0
 
     def test_figure_context_boost(self):
         """Test score boost for images in figure tags."""
         html_str = '<figure><img src="test.jpg" width="800" height="600" /></figure>'
-        doc = html.fromstring(html_str)
-        img = doc.xpath('//img')[0]
-
-        score = _score_image(img, "https://example.com/")
+        score = _score_first_img(html_str)
         # Should include figure boost (+2)
         assert score >= 14.0  # Base + dims + figure
 
     def test_featured_class_boost(self):
         """Test score boost for featured/hero classes."""
         html_str = '<img src="test.jpg" class="featured-image" width="800" height="600" />'
-        doc = html.fromstring(html_str)
-        img = doc.xpath('//img')[0]
-
-        score = _score_image(img, "https://example.com/")
+        score = _score_first_img(html_str)
         # Should include class boost (+2)
         assert score >= 14.0
 
     def test_icon_class_penalty(self):
         """Test score penalty for icon classes."""
         html_str = '<img src="test.jpg" class="icon" width="800" height="600" />'
-        doc = html.fromstring(html_str)
-        img = doc.xpath('//img')[0]
-
-        score = _score_image(img, "https://example.com/")
+        score = _score_first_img(html_str)
         # Should have large negative penalty
         assert score < 0
 
     def test_data_url_penalty(self):
         """Test score penalty for data URLs."""
         html_str = '<img src="data:image/png;base64,iVBORw0KG..." width="800" height="600" />'
-        doc = html.fromstring(html_str)
-        img = doc.xpath('//img')[0]
-
-        score = _score_image(img, "https://example.com/")
+        score = _score_first_img(html_str)
         # Should have data URL penalty
         assert score < 0
 
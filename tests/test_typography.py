@@ -100,3 +100,11 @@ class TestTypography:
         except Exception:
             # If it fails, that's also acceptable - the function should handle it
             pass
+
+    def test_improve_skips_content_without_triggers(self):
+        """Test that content the filters can't change is returned as-is."""
+        html = "<p>Plain words, nothing to change; not even 2 + 2 = 4</p>"
+        assert improve_typography(html) is html
+
+        # A backslash escape alone is enough to go through smartypants
+        assert improve_typography("<p>a \\\\ b</p>") != "<p>a \\\\ b</p>"
@@ -1,9 +1,13 @@
 """Tests for utility functions - URL resolution and metadata fallback."""
 
+import asyncio
+import threading
 import pytest
 from lxml import html
-from gensi.utils.url_utils import resolve_url, is_image_url, get_base_url
+from gensi.utils.url_utils import resolve_url, is_image_url, get_base_url, make_url_resolver
 from gensi.utils.metadata_fallback import extract_metadata_fallback
+from gensi.utils.html_parser import get_html_parser
+from gensi.utils import event_loop
 
 
 class TestURLUtils:
@@ -107,6 +111,70 @@ class TestURLUtils:
 
         assert base == "http://example.com:8080"
 
+    def test_url_resolver_matches_resolve_url(self):
+        """Test the precomputed resolver agrees with resolve_url."""
+        urls = [
+            "http://other.com/a.jpg", "/images/photo.jpg", "photo.jpg", "sub/photo.jpg",
+            "../photo.jpg", "./photo.jpg", "//cdn.example.com/a.jpg", "?page=2", "#top",
+            "", "mailto:me@example.com", "a//b.jpg", "  photo.jpg",
+            "foo?", "/x#", "a?#b", "http://other.com/c#", "http://other.com?",
+            "https://other.com/a?#b", ";", "x;", "a;b/c.jpg", "http://", "https://", "http:///x",
+        ]
+        for base in [
+            "http://example.com/articles/page.html", "https://example.com", "file:///tmp/x.html",
+            "http://ex.com/a/b",
+        ]:
+            resolve = make_url_resolver(base)
+            for url in urls:
+                assert resolve(url) == resolve_url(base, url)
+
+
+class TestHTMLParser:
+    """Test the shared HTML parser."""
+
+    def test_parser_reused_within_thread(self):
+        """Test that the same parser is returned on repeated calls."""
+        assert get_html_parser() is get_html_parser()
+
+    def test_parser_per_thread(self):
+        """Test that each thread gets its own parser."""
+        parsers = []
+        thread = threading.Thread(target=lambda: parsers.append(get_html_parser()))
+        thread.start()
+        thread.join()
+
+        assert parsers[0] is not get_html_parser()
+
+    def test_parser_parses_documents(self):
+        """Test that documents parsed with the shared parser behave normally."""
+        doc = html.fromstring('<div id="a"><p class="x">One</p></div>', parser=get_html_parser())
+        assert doc.cssselect('p.x')[0].text_content() == 'One'
+        doc = html.fromstring('<div id="a"><p class="x">Two</p></div>', parser=get_html_parser())
+        assert doc.cssselect('p.x')[0].text_content() == 'Two'
+
+
+class TestEventLoop:
+    """Test event loop helpers."""
+
+    def test_run_returns_result(self):
+        """Test that run() drives a coroutine to completion."""
+        async def compute():
+            await asyncio.sleep(0)
+            return 42
+
+        assert event_loop.run(compute()) == 42
+
+    def test_new_event_loop_without_uvloop(self, monkeypatch):
+        """Test falling back to the asyncio default loop when uvloop is missing."""
+        monkeypatch.setattr(event_loop, 'uvloop', None)
+
+        loop = event_loop.new_event_loop()
+        try:
+            assert isinstance(loop, asyncio.AbstractEventLoop)
+            assert loop.run_until_complete(asyncio.sleep(0, result='ok')) == 'ok'
+        finally:
+            loop.close()
+
 
 class TestMetadataFallback:
     """Test metadata fallback extraction."""
@@ -315,3 +383,20 @@ class TestMetadataFallback:
         # Empty values should be treated as None or fall back
         assert metadata['title'] is None or metadata['title'] == ""
         assert metadata['author'] is None or metadata['author'] == ""
+
+    def test_extract_date_precedence_between_meta_and_time(self):
+        """Test that meta and element sources keep their relative priority."""
+        html_content = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta name="date" content="2024-12-01">
+</head>
+<body><time datetime="2025-01-15">January 15</time></body>
+</html>
+"""
+        doc = html.fromstring(html_content)
+        metadata = extract_metadata_fallback(doc, "http://example.com")
+
+        # <time datetime> outranks <meta name="date">
+        assert metadata['date'] == "2025-01-15"